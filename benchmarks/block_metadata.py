@@ -0,0 +1,29 @@
+"""Benchmarks the per-class definition metadata (base classes, definition name, docstring) looked up when serializing
+a block, for passives which may be instantiated thousands of times in a design.
+
+Run from the repository root with: python -m benchmarks.block_metadata
+"""
+
+import time
+
+from edg import Capacitor, JlcCapacitor, JlcResistor, Resistor
+from edg.core.Blocks import BaseBlock
+
+
+def block_metadata(block: BaseBlock) -> None:
+    block._get_bases_of(BaseBlock)
+    block._get_def_name()
+    block._add_doc_metadata()
+
+
+if __name__ == "__main__":
+    count = 1000
+    for cls in [Resistor, JlcResistor, Capacitor, JlcCapacitor]:
+        times = []
+        for i in range(3):
+            blocks = [cls() for _ in range(count)]  # instantiation not timed
+            start = time.perf_counter()
+            for block in blocks:
+                block_metadata(block)
+            times.append(time.perf_counter() - start)
+        print(f"{cls.__name__:>16s}: {min(times) / count * 1e6:>6.2f} us / instance")
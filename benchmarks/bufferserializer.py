@@ -0,0 +1,99 @@
+"""Benchmarks the delimited protobuf framing used between the compiler and HDL server,
+reporting messages/second and MB/s for representative HdlRequest / HdlResponse sizes.
+
+Run from the repository root with: python -m benchmarks.bufferserializer
+"""
+
+import io
+import os
+import threading
+import time
+from typing import Type
+
+from edg import edgir, edgrpc
+from edg.core import BufferSerializer, BufferDeserializer, builder
+from edg.core.BufferSerializer import MessageType
+
+
+def library_request() -> edgrpc.HdlRequest:
+    request = edgrpc.HdlRequest()
+    request.get_library_element.element.target.name = "edg.parts.Microcontroller_Stm32f103.Stm32f103_48"
+    return request
+
+
+def generator_request() -> edgrpc.HdlRequest:
+    request = edgrpc.HdlRequest()
+    request.elaborate_generator.element.target.name = "edg.vendor_parts.jlc.JlcCapacitor.JlcCapacitor"
+    for i in range(64):
+        value = request.elaborate_generator.values.add()
+        value.path.CopyFrom(edgir.LocalPathList(["capacitance", str(i)]))
+        value.value.range.minimum.floating.val = 0.9e-6
+        value.value.range.maximum.floating.val = 1.1e-6
+    return request
+
+
+def library_response() -> edgrpc.HdlResponse:
+    from edg.parts import Stm32f103_48
+
+    response = edgrpc.HdlResponse()
+    response.get_library_element.element.hierarchy_block.CopyFrom(builder.elaborate_toplevel(Stm32f103_48()))
+    return response
+
+
+def index_response() -> edgrpc.HdlResponse:
+    response = edgrpc.HdlResponse()
+    for i in range(5000):
+        response.index_module.indexed.add().target.name = f"edg.parts.Module{i}.LibraryElement{i}"
+    return response
+
+
+def benchmark(
+    name: str, message_type: Type[MessageType], message: MessageType, stdout: bytes = b"", min_time: float = 1.0
+) -> None:
+    """Benchmarks writing and reading the message, optionally with non-message (stdout) data preceding each."""
+    count = 256
+    while True:
+        buffer = io.BytesIO()
+        serializer = BufferSerializer[MessageType](buffer)
+        start = time.perf_counter()
+        for i in range(count):
+            buffer.write(stdout)
+            serializer.write(message)
+        write_time = time.perf_counter() - start
+
+        # read through an OS pipe, so large messages arrive in chunks as they would from the compiler process
+        read_fd, write_fd = os.pipe()
+        data = buffer.getvalue()
+
+        def write_pipe() -> None:
+            with os.fdopen(write_fd, "wb") as write_file:
+                write_file.write(data)
+
+        writer = threading.Thread(target=write_pipe)
+        writer.start()
+        with os.fdopen(read_fd, "rb") as read_file:
+            deserializer = BufferDeserializer(message_type, read_file)
+            start = time.perf_counter()
+            for i in range(count):
+                assert deserializer.read() is not None
+            read_time = time.perf_counter() - start
+        writer.join()
+
+        if write_time + read_time >= min_time:
+            break
+        count *= 2
+
+    total_mb = len(buffer.getvalue()) / 1e6
+    print(
+        f"{name:24s} {message.ByteSize():>9d} B  "
+        f"write {count / write_time:>10.0f} msg/s {total_mb / write_time:>8.1f} MB/s  "
+        f"read {count / read_time:>10.0f} msg/s {total_mb / read_time:>8.1f} MB/s"
+    )
+
+
+if __name__ == "__main__":
+    benchmark("library request", edgrpc.HdlRequest, library_request())
+    benchmark("generator request", edgrpc.HdlRequest, generator_request())
+    benchmark("library response", edgrpc.HdlResponse, library_response())
+    benchmark("index response", edgrpc.HdlResponse, index_response())
+    benchmark("library resp + stdout", edgrpc.HdlResponse, library_response(), b"compiler log output\n" * 50)
@@ -0,0 +1,83 @@
+"""Benchmarks CompiledDesign value lookups as done by the backends (several parameters of each block),
+comparing the indexed get_value and batch get_values against building and serializing a LocalPath per lookup,
+and timing the backend transforms that use them. Requires the compiler.
+
+Run from the repository root with: python -m benchmarks.compiled_design
+"""
+
+import time
+from typing import Callable, List, Tuple
+
+from typing_extensions import override
+
+from edg import edgir
+from edg.core import ScalaCompiler, TransformUtil
+from edg.electronics_model.BomBackend import BomTransform
+from edg.electronics_model.NetlistGenerator import NetlistTransform
+from edg.electronics_model.RefdesRefinementPass import RefdesRefinementPass
+
+kParams = ("fp_footprint", "fp_pinning", "fp_mfr", "fp_part", "fp_value", "fp_refdes", "lcsc_part")
+
+
+class BlockPathsTransform(TransformUtil.Transform):
+    def __init__(self) -> None:
+        self.paths: List[Tuple[str, ...]] = []
+
+    @override
+    def visit_block(self, context: TransformUtil.TransformContext, block: edgir.HierarchyBlock) -> None:
+        self.paths.append(context.path.to_tuple())
+
+
+def benchmark(name: str, fn: Callable[[], object], lookups: int, min_time: float = 1.0) -> None:
+    count = 1
+    while True:
+        start = time.perf_counter()
+        for i in range(count):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        count *= 2
+    per_run = elapsed / count
+    per_lookup = f"  {per_run / lookups * 1e9:>8.0f} ns/lookup" if lookups else ""
+    print(f"{name:32s} {per_run * 1e3:>9.3f} ms/run{per_lookup}")
+
+
+if __name__ == "__main__":
+    from examples.test_usb_source_measure import UsbSourceMeasure
+
+    compiled = ScalaCompiler.compile(UsbSourceMeasure, ignore_errors=True)
+    compiled.append_values(RefdesRefinementPass().run(compiled))
+
+    paths_transform = BlockPathsTransform()
+    paths_transform.visit_design(compiled.design)
+    paths = paths_transform.paths
+    lookups = len(paths) * len(kParams)
+    print(f"{len(paths)} blocks, {lookups} lookups/run")
+
+    # the prior implementation: values keyed by serialized LocalPath, built for each lookup
+    serialized_values = {
+        edgir.LocalPathList(path + (param,)).SerializeToString(): compiled.get_value(path + (param,))
+        for path in paths
+        for param in kParams
+    }
+
+    def serialized_lookups() -> None:
+        for path in paths:
+            for param in kParams:
+                serialized_values.get(edgir.LocalPathList(path + (param,)).SerializeToString())
+
+    def get_value_lookups() -> None:
+        for path in paths:
+            for param in kParams:
+                compiled.get_value(path + (param,))
+
+    def get_values_lookups() -> None:
+        for path in paths:
+            compiled.get_values(path, kParams)
+
+    benchmark("serialized LocalPath", serialized_lookups, lookups)
+    benchmark("get_value", get_value_lookups, lookups)
+    benchmark("get_values", get_values_lookups, lookups)
+    benchmark("NetlistTransform", lambda: NetlistTransform(compiled).run(), 0)
+    benchmark("BomTransform", lambda: BomTransform(compiled).run(), 0)
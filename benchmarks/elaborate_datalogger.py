@@ -0,0 +1,80 @@
+"""Benchmarks and profiles elaborating the library elements of the Datalogger example (as in perf.py), without the
+compiler: the design top, every block, link and port class it reaches through block and link definitions, and the
+classes in its refinements, as the HDL server would on get_library_element requests.
+Generators are elaborated as their definition stubs, since generating requires values from the compiler.
+
+Run from the repository root with: python -m benchmarks.elaborate_datalogger [--profile]
+"""
+
+import cProfile
+import io
+import pstats
+import sys
+import time
+from pstats import SortKey
+from typing import Dict, List, Set, Type
+
+from edg import edgir
+from edg.core import DesignTop, LibraryElement
+from edg.hdl_server.__main__ import class_from_library, elaborate_class
+from examples.test_datalogger import Datalogger
+
+
+def library_classes(top: Type[DesignTop]) -> List[Type[LibraryElement]]:
+    """Returns the classes reachable from the top, in elaboration order"""
+    pending: List[Type[LibraryElement]] = [top]
+    refinements = top().refinements()
+    pending.extend(cls for _, cls in refinements.class_refinements)
+    pending.extend(cls for _, cls in refinements.instance_refinements)
+    seen: Set[Type[LibraryElement]] = set()
+    ordered: List[Type[LibraryElement]] = []
+    while pending:
+        cls = pending.pop()
+        if cls in seen:
+            continue
+        seen.add(cls)
+        ordered.append(cls)
+        _, pb = elaborate_class(cls)
+        names: List[str] = []
+        if pb.HasField("hierarchy_block"):
+            names.extend(block.value.lib_elem.base.target.name for block in pb.hierarchy_block.blocks)
+            names.extend(link.value.lib_elem.target.name for link in pb.hierarchy_block.links)
+            names.extend(port.value.lib_elem.target.name for port in pb.hierarchy_block.ports)
+        elif pb.HasField("link"):
+            names.extend(link.value.lib_elem.target.name for link in pb.link.links)
+            names.extend(port.value.lib_elem.target.name for port in pb.link.ports)
+        for name in names:
+            if name:  # port arrays are not lib_elems
+                pending.append(class_from_library(edgir.libpath(name), LibraryElement))  # type: ignore
+    return ordered
+
+
+def elaborate_all(classes: List[Type[LibraryElement]]) -> Dict[str, float]:
+    times: Dict[str, float] = {}
+    for cls in classes:
+        start = time.perf_counter()
+        elaborate_class(cls)
+        times[cls.__name__] = time.perf_counter() - start
+    return times
+
+
+if __name__ == "__main__":
+    classes = library_classes(Datalogger)  # also warms up imports and per-class caches
+
+    runs = []
+    for i in range(5):
+        start = time.perf_counter()
+        times = elaborate_all(classes)
+        runs.append(time.perf_counter() - start)
+    print(f"elaborated {len(classes)} library elements in {min(runs) * 1e3:.0f} ms (min of {len(runs)})")
+    for name, elapsed in sorted(times.items(), key=lambda item: -item[1])[:10]:
+        print(f"  {name:>40s}: {elapsed * 1e3:>6.1f} ms")
+
+    if "--profile" in sys.argv:
+        profile = cProfile.Profile()
+        profile.enable()
+        elaborate_all(classes)
+        profile.disable()
+        s = io.StringIO()
+        pstats.Stats(profile, stream=s).sort_stats(SortKey.TIME).print_stats(30)
+        print(s.getvalue())
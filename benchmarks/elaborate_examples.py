@@ -0,0 +1,26 @@
+"""Benchmarks elaborating the library elements of the larger examples, as in elaborate_datalogger, which exercises
+naming and registering the sub-elements (parameters, ports, blocks, connects) of every block and port.
+
+Run from the repository root with: python -m benchmarks.elaborate_examples
+"""
+
+import time
+
+from benchmarks.elaborate_datalogger import elaborate_all, library_classes
+from examples.test_datalogger import Datalogger
+from examples.test_fcml import Fcml
+from examples.test_iot_thermal_camera import IotThermalCamera
+from examples.test_usb_source_measure import UsbSourceMeasure
+
+if __name__ == "__main__":
+    total = 0.0
+    for top in [Datalogger, UsbSourceMeasure, IotThermalCamera, Fcml]:
+        classes = library_classes(top)  # also warms up imports and per-class caches
+        runs = []
+        for i in range(3):
+            start = time.perf_counter()
+            elaborate_all(classes)
+            runs.append(time.perf_counter() - start)
+        total += min(runs)
+        print(f"{top.__name__:>20s}: {len(classes):>4d} library elements in {min(runs) * 1e3:>6.0f} ms")
+    print(f"{'total':>20s}: {total * 1e3:>27.0f} ms")
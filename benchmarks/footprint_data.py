@@ -0,0 +1,66 @@
+"""Benchmarks the cold-start cost of footprint area lookups (as in parts selection), comparing validating the entire
+JSON table with pydantic (the previous implementation), parsing it with the json module (the fallback when the index
+is out of date), and the lazy lookups from the precompiled index.
+
+Run from the repository root with: python -m benchmarks.footprint_data
+"""
+
+import time
+from typing import Callable, Dict, Tuple
+
+from pydantic import BaseModel, RootModel
+
+from edg.electronics_model.KicadFootprintData import FootprintDataTable
+
+kFootprints = [  # typical lookups when selecting passives
+    "Resistor_SMD:R_0402_1005Metric",
+    "Resistor_SMD:R_0603_1608Metric",
+    "Resistor_SMD:R_0805_2012Metric",
+    "Capacitor_SMD:C_0402_1005Metric",
+    "Capacitor_SMD:C_0603_1608Metric",
+    "Capacitor_SMD:C_0805_2012Metric",
+    "Capacitor_SMD:C_1206_3216Metric",
+]
+
+
+class FootprintData(BaseModel):
+    area: float
+    bbox: Tuple[float, float, float, float]
+
+
+class FootprintJson(RootModel[Dict[str, FootprintData]]):
+    root: Dict[str, FootprintData]
+
+
+def pydantic_lookup() -> None:
+    with open(FootprintDataTable.kJsonPath, "r") as f:
+        table = FootprintJson.model_validate_json(f.read())
+    for footprint in kFootprints:
+        table.root[footprint].area
+
+
+def table_lookup(use_index: bool) -> None:
+    FootprintDataTable._index = None
+    FootprintDataTable._table = None
+    FootprintDataTable._cache = {}
+    if not use_index:
+        FootprintDataTable._table = FootprintDataTable._read_json()
+    for footprint in kFootprints:
+        FootprintDataTable.area_of(footprint)
+
+
+def benchmark(name: str, fn: Callable[[], None], runs: int = 20) -> None:
+    fn()  # warm up the OS file cache
+    times = []
+    for i in range(runs):
+        start = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - start)
+    print(f"{name:>24s}: {min(times) * 1e3:>7.2f} ms")
+
+
+if __name__ == "__main__":
+    print(f"cold-start lookup of {len(kFootprints)} footprints")
+    benchmark("pydantic validate JSON", pydantic_lookup)
+    benchmark("json parse", lambda: table_lookup(False))
+    benchmark("precompiled index", lambda: table_lookup(True))
@@ -0,0 +1,42 @@
+"""Benchmarks the startup time of importing parts of the library, each in a fresh interpreter, where exports of the
+edg package are loaded lazily. `from edg import *` loads the entire library, as all imports did previously.
+
+Run from the repository root with: python -m benchmarks.import_startup
+"""
+
+import subprocess
+import sys
+
+kStatements = [
+    "import edg",
+    "from edg import Range, compile_board",
+    "from edg import Resistor",
+    "from edg import Holyiot_18010",
+    "from edg import JlcBoardTop",
+    "from edg import *",
+]
+
+kTimingScript = """
+import sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(elapsed, len([name for name in sys.modules if name == "edg" or name.startswith("edg.")]))
+"""
+
+
+def benchmark(statement: str, runs: int = 5) -> None:
+    times = []
+    modules = 0
+    for i in range(runs):
+        output = subprocess.check_output([sys.executable, "-c", kTimingScript.format(statement=statement)], text=True)
+        elapsed, modules_str = output.split()
+        times.append(float(elapsed))
+        modules = int(modules_str)
+    print(f"{statement:>40s}: {min(times) * 1e3:>7.0f} ms, {modules:>4d} edg modules")
+
+
+if __name__ == "__main__":
+    subprocess.check_output([sys.executable, "-c", "import edg.parts"])  # warm up bytecode caches
+    for statement in kStatements:
+        benchmark(statement)
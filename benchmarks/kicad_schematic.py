@@ -0,0 +1,100 @@
+"""Benchmarks KiCadSchematic parsing and net extraction on synthetic schematics of increasing size, with a row of
+resistors whose top pins are all wired together into one large net (like a power net), and whose bottom pins
+are connected in pairs through labels on wire stubs. Elements include the graphical data (effects, strokes, uuids)
+written by KiCad.
+
+Also compares reading the file with the streaming reader against the full sexpdata parse, in time and peak memory.
+
+Run from the repository root with: python -m benchmarks.kicad_schematic
+"""
+
+import time
+import tracemalloc
+import uuid
+from typing import Any, Callable, List, Tuple
+
+import sexpdata  # type: ignore
+
+from edg.electronics_model.KiCadSchematicParser import KiCadSchematic
+from edg.electronics_model.KiCadSexpReader import read_toplevel
+
+kLibSymbols = """  (lib_symbols
+    (symbol "Device:R" (pin_names (offset 0)) (in_bom yes) (on_board yes)
+      (property "Reference" "R" (id 0) (at 2.032 0 90))
+      (property "Value" "R" (id 1) (at 0 0 90))
+      (symbol "R_1_1"
+        (pin passive line (at 0 3.81 270) (length 1.27) (name "~") (number "1"))
+        (pin passive line (at 0 -3.81 90) (length 1.27) (name "~") (number "2"))
+      )
+    )
+  )
+"""
+
+
+def synthetic_schematic(resistors: int) -> str:
+    effects = "(effects (font (size 1.27 1.27)) (justify left bottom))"
+    stroke = "(stroke (width 0) (type default) (color 0 0 0 0))"
+    elts: List[str] = []
+    y = 50.8
+    for i in range(resistors):
+        x = 5.08 * (i + 1)
+        elts.append(
+            f'  (symbol (lib_id "Device:R") (at {x:.2f} {y:.2f} 0) (unit 1)\n'
+            f"    (in_bom yes) (on_board yes) (fields_autoplaced)\n"
+            f"    (uuid {uuid.uuid4()})\n"
+            f'    (property "Reference" "R{i + 1}" (id 0) (at {x:.2f} {y:.2f} 0)\n      {effects}\n    )\n'
+            f'    (property "Value" "1k" (id 1) (at {x:.2f} {y:.2f} 0)\n      {effects}\n    )\n'
+            f'    (property "Footprint" "" (id 2) (at {x:.2f} {y:.2f} 0)\n      {effects}\n    )\n'
+            f'    (pin "1" (uuid {uuid.uuid4()}))\n'
+            f'    (pin "2" (uuid {uuid.uuid4()}))\n'
+            f"  )\n"
+        )
+        top, bottom = y - 3.81, y + 3.81
+        if i + 1 < resistors:  # chain all the top pins into one net
+            elts.append(
+                f"  (wire (pts (xy {x:.2f} {top:.2f}) (xy {x + 5.08:.2f} {top:.2f}))\n"
+                f"    {stroke}\n    (uuid {uuid.uuid4()})\n  )\n"
+            )
+        elts.append(
+            f"  (wire (pts (xy {x:.2f} {bottom:.2f}) (xy {x:.2f} {bottom + 2.54:.2f}))\n"
+            f"    {stroke}\n    (uuid {uuid.uuid4()})\n  )\n"
+        )
+        elts.append(
+            f'  (label "n{i // 2}" (at {x:.2f} {bottom + 2.54:.2f} 0)\n'
+            f"    {effects}\n    (uuid {uuid.uuid4()})\n  )\n"
+        )
+    if resistors:
+        elts.append(f'  (label "VCC" (at 5.08 {y - 3.81:.2f} 0)\n    {effects}\n    (uuid {uuid.uuid4()})\n  )\n')
+    return "(kicad_sch (version 20211123) (generator eeschema)\n" + kLibSymbols + "".join(elts) + ")\n"
+
+
+def measure(fn: Callable[[], Any]) -> Tuple[float, int]:
+    """Returns the time and peak traced memory of running fn, measured in separate runs since tracing is slow."""
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+if __name__ == "__main__":
+    for resistors in [1000, 4000, 16000]:
+        data = synthetic_schematic(resistors)
+        sexp_time, sexp_peak = measure(lambda: sexpdata.loads(data))
+        read_time, read_peak = measure(
+            lambda: list(read_toplevel(data, "kicad_sch", KiCadSchematic.kElements, KiCadSchematic.kSkippedElements))
+        )
+
+        start = time.perf_counter()
+        sch = KiCadSchematic(data)
+        total_time = time.perf_counter() - start
+        assert len(sch.nets) == 1 + (resistors + 1) // 2
+        print(
+            f"{resistors:>6d} resistors, {2 * resistors - 1:>6d} wires, {resistors + 1:>6d} labels, "
+            f"{len(data) / 1e6:>5.1f} MB: {total_time * 1e3:>7.0f} ms total\n"
+            f"  streaming read {read_time * 1e3:>7.0f} ms {read_peak / 1e6:>7.1f} MB peak, "
+            f"sexpdata {sexp_time * 1e3:>7.0f} ms {sexp_peak / 1e6:>7.1f} MB peak"
+        )
@@ -0,0 +1,44 @@
+"""Benchmarks index_module requests for the edg library, each in a fresh interpreter as at the start of a compile,
+comparing searching the library by reflection (the previous implementation) against the persistent library index.
+
+Run from the repository root with: python -m benchmarks.library_index
+"""
+
+import subprocess
+import sys
+import tempfile
+
+kReflectScript = """
+import importlib, time
+start = time.perf_counter()
+from edg.hdl_server.LibraryIndex import LibraryElementIndexer
+indexed = LibraryElementIndexer().index_module(importlib.import_module("edg"))
+print(time.perf_counter() - start, len(indexed), 0)
+"""
+
+kIndexScript = """
+import time
+start = time.perf_counter()
+from edg.hdl_server.LibraryIndex import LibraryIndex
+index = LibraryIndex({cache_dir!r})
+indexed = index.index_module("edg")
+print(time.perf_counter() - start, len(indexed), index.searches)
+"""
+
+
+def benchmark(name: str, script: str, runs: int = 3) -> None:
+    times = []
+    elements = searches = 0
+    for i in range(runs):
+        output = subprocess.check_output([sys.executable, "-c", script], text=True)
+        elapsed, elements_str, searches_str = output.split()
+        times.append(float(elapsed))
+        elements, searches = int(elements_str), int(searches_str)
+    print(f"{name:>16s}: {min(times) * 1e3:>6.0f} ms, {elements} elements, {searches} modules searched")
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as cache_dir:
+        benchmark("reflection", kReflectScript)
+        benchmark("index (cold)", kIndexScript.format(cache_dir=cache_dir), runs=1)
+        benchmark("index (warm)", kIndexScript.format(cache_dir=cache_dir))
@@ -0,0 +1,77 @@
+"""Benchmarks writing KiCad netlists for a synthetic board of two-pin parts chained into nets, comparing generating
+the netlist as a string then writing it against streaming it directly to the file, in time and peak memory.
+
+Run from the repository root with: python -m benchmarks.netlist_writer
+"""
+
+import os
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, List, Tuple
+
+from edg import edgir
+from edg.core import TransformUtil
+from edg.electronics_model import footprint as kicad
+from edg.electronics_model.NetlistGenerator import Netlist, NetBlock, Net, NetPin
+
+
+def synthetic_netlist(parts: int) -> Netlist:
+    """Netlist of parts (each with two pins, in a two-level hierarchy) connected in a chain,
+    so there are twice as many pins as parts."""
+    blocks: List[NetBlock] = []
+    nets: List[Net] = []
+    group_class = edgir.LibraryPath(target=edgir.LocalStep(name="Group"))
+    part_class = edgir.LibraryPath(target=edgir.LocalStep(name="Resistor"))
+    for i in range(parts):
+        path = TransformUtil.Path.empty().append_block(f"group{i // 100}", f"r{i % 100}")
+        blocks.append(
+            NetBlock("Resistor_SMD:R_0603_1608Metric", f"R{i + 1}", "RC0603", "1k", path, [group_class, part_class])
+        )
+    for i in range(parts + 1):
+        pins = []
+        if i > 0:
+            pins.append(NetPin(blocks[i - 1].full_path, "2"))
+        if i < parts:
+            pins.append(NetPin(blocks[i].full_path, "1"))
+        nets.append(Net(f"net{i}", pins, []))
+    return Netlist("", TransformUtil.Path.empty(), blocks, nets)
+
+
+def measure(fn: Callable[[], Any]) -> Tuple[float, int]:
+    """Returns the time and peak traced memory of running fn, measured in separate runs since tracing is slow."""
+    start = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as temp_dir:
+        filename = os.path.join(temp_dir, "bench.net")
+
+        def write_string(netlist: Netlist) -> None:
+            netlist_str = kicad.generate_netlist(netlist, kicad.RefdesMode.PathnameAsValue)
+            with open(filename, "w", encoding="utf-8") as f:
+                f.write(netlist_str)
+
+        def write_stream(netlist: Netlist) -> None:
+            with open(filename, "w", encoding="utf-8") as f:
+                kicad.write_netlist(f, netlist, kicad.RefdesMode.PathnameAsValue)
+
+        for parts in [1000, 10000, 40000]:
+            netlist = synthetic_netlist(parts)
+            string_time, string_peak = measure(lambda: write_string(netlist))
+            stream_time, stream_peak = measure(lambda: write_stream(netlist))
+            size = os.path.getsize(filename)
+            print(
+                f"{2 * parts:>6d} pins, {size / 1e6:>5.1f} MB: "
+                f"string {string_time * 1e3:>6.0f} ms ({size / 1e6 / string_time:>5.1f} MB/s) "
+                f"{string_peak / 1e6:>6.1f} MB peak, "
+                f"streamed {stream_time * 1e3:>6.0f} ms ({size / 1e6 / stream_time:>5.1f} MB/s) "
+                f"{stream_peak / 1e6:>6.1f} MB peak"
+            )
@@ -0,0 +1,95 @@
+"""Benchmarks parts table snapshots loaded by several worker processes (like pytest-xdist or hdl_server workers),
+comparing fully decoded tables against shared tables attached to the memory-mapped snapshot, in load time and
+memory. Each worker loads a synthetic table and runs a typical indexed selection.
+
+Memory is measured as the proportional set size (shared pages split between the processes using them) added by
+loading the table and running the query, so it reflects the total memory cost of all workers. Requires Linux.
+
+Run from the repository root with: python -m benchmarks.parts_table_shared
+"""
+
+import multiprocessing
+import os
+import random
+import tempfile
+import time
+from typing import Tuple
+
+from edg.abstract_parts.PartsTable import PartsTable, PartsTableColumn, PartsTableRow
+from edg.abstract_parts.PartsTableSnapshot import PartsTableSnapshot
+from edg.core import Range
+
+kRows = 200000
+kWorkers = 4
+
+
+class BenchmarkTable:
+    RESISTANCE = PartsTableColumn(Range)
+    COST = PartsTableColumn(float)
+    BASIC = PartsTableColumn(bool)
+
+
+def synthetic_table(rows: int) -> PartsTable:
+    rng = random.Random(0)
+    return PartsTable(
+        [
+            PartsTableRow(
+                {
+                    "part": f"RC0603FR-07{i}L",
+                    "description": f"{rng.choice(['1%', '5%'])} 100mW thick film resistor, 0603, part {i}",
+                    "footprint": "Resistor_SMD:R_0603_1608Metric",
+                    BenchmarkTable.RESISTANCE: Range.from_tolerance(10 ** rng.uniform(0, 6), 0.01),
+                    BenchmarkTable.COST: rng.uniform(0.001, 0.1),
+                    BenchmarkTable.BASIC: rng.random() < 0.1,
+                }
+            )
+            for i in range(rows)
+        ]
+    )
+
+
+def pss_kb() -> int:
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            if line.startswith("Pss:"):
+                return int(line.split()[1])
+    raise ValueError("no Pss in smaps_rollup")
+
+
+def worker(args: Tuple[str, str, bool]) -> Tuple[float, int, int]:
+    cache_dir, source, shared = args
+    pss_start = pss_kb()
+    start = time.perf_counter()
+    table = PartsTableSnapshot(cache_dir, shared=shared).load(BenchmarkTable, [source])
+    load_time = time.perf_counter() - start
+    assert table is not None
+    selected = table.filter_indices(table.select_range_in(BenchmarkTable.RESISTANCE, Range(900, 1100)))
+    selected = selected.filter(lambda row: row[BenchmarkTable.BASIC]).sort_by(lambda row: row[BenchmarkTable.COST])
+    time.sleep(1)  # so all workers are alive when memory is measured
+    return load_time, pss_kb() - pss_start, len(selected)
+
+
+if __name__ == "__main__":
+    # snapshots are keyed by class module, which must match the module name in workers rather than __main__
+    from benchmarks.parts_table_shared import BenchmarkTable, synthetic_table, worker
+
+    with tempfile.TemporaryDirectory() as temp_dir:
+        source = os.path.join(temp_dir, "source.csv")
+        with open(source, "w") as f:
+            f.write("synthetic")
+        snapshot = PartsTableSnapshot(os.path.join(temp_dir, "snapshots"))
+        start = time.perf_counter()
+        assert snapshot.save(BenchmarkTable, synthetic_table(kRows), [source])
+        snapshot_size = os.path.getsize(snapshot._path(BenchmarkTable))
+        print(f"{kRows} rows, snapshot {snapshot_size / 1e6:.1f} MB, built in {time.perf_counter() - start:.1f} s")
+
+        ctx = multiprocessing.get_context("spawn")  # fresh workers, as in pytest-xdist
+        for shared in [False, True]:
+            with ctx.Pool(kWorkers) as pool:
+                results = pool.map(worker, [(snapshot.cache_dir, source, shared)] * kWorkers)
+            load_ms = max(load_time for load_time, _, _ in results) * 1e3
+            total_mb = sum(pss for _, pss, _ in results) / 1e3
+            print(
+                f"{'shared' if shared else 'decoded':>8s}: {kWorkers} workers, load {load_ms:>6.0f} ms (slowest), "
+                f"{total_mb:>6.1f} MB total, {results[0][2]} rows selected"
+            )
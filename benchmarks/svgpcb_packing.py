@@ -0,0 +1,63 @@
+"""Benchmarks arranging footprints for the SVGPCB backend on synthetic boards of increasing size, made of
+subcircuits with a mix of footprint sizes, comparing the shelf and skyline packers in time and packing density
+(fraction of the board area covered by footprint bounding boxes).
+
+Run from the repository root with: python -m benchmarks.svgpcb_packing
+"""
+
+import random
+import time
+from typing import List
+
+from edg import edgir
+from edg.core import TransformUtil
+from edg.electronics_model.KicadFootprintData import FootprintDataTable
+from edg.electronics_model.NetlistGenerator import NetBlock
+from edg.electronics_model.RectPacker import RectPacker, ShelfPacker, SkylinePacker
+from edg.electronics_model.SvgPcbBackend import arrange_blocks
+
+kFootprints = [  # weighted towards passives, like typical boards
+    "Resistor_SMD:R_0603_1608Metric",
+    "Resistor_SMD:R_0603_1608Metric",
+    "Capacitor_SMD:C_0603_1608Metric",
+    "Capacitor_SMD:C_0603_1608Metric",
+    "Capacitor_SMD:C_0805_2012Metric",
+    "Package_TO_SOT_SMD:SOT-23",
+    "Package_TO_SOT_SMD:SOT-23-5",
+    "Package_SO:SOIC-8_3.9x4.9mm_P1.27mm",
+    "Package_QFP:LQFP-48-1EP_7x7mm_P0.5mm_EP3.6x3.6mm",
+]
+
+
+def synthetic_blocks(footprints: int, seed: int = 0) -> List[NetBlock]:
+    """Footprints in subcircuits of varying size (including some at the top level)."""
+    rng = random.Random(seed)
+    blocks: List[NetBlock] = []
+    subcircuit = 0
+    while len(blocks) < footprints:
+        size = min(rng.randint(1, 24), footprints - len(blocks))
+        for i in range(size):
+            if size == 1:
+                path = TransformUtil.Path.empty().append_block(f"part{subcircuit}")
+            else:
+                path = TransformUtil.Path.empty().append_block(f"sub{subcircuit}", f"part{i}")
+            blocks.append(NetBlock(rng.choice(kFootprints), f"U{len(blocks)}", "", "", path, [edgir.LibraryPath()] * 2))
+        subcircuit += 1
+    return blocks
+
+
+if __name__ == "__main__":
+    FootprintDataTable.bbox_of("")  # load the table outside the timing
+    packers: List[RectPacker] = [ShelfPacker(), SkylinePacker()]
+    for footprints in [100, 1000, 10000]:
+        blocks = synthetic_blocks(footprints)
+        results = []
+        for packer in packers:
+            start = time.perf_counter()
+            arranged = arrange_blocks(blocks, packer=packer)
+            elapsed = time.perf_counter() - start
+            results.append(
+                f"{type(packer).__name__} {elapsed * 1e3:>6.1f} ms, {arranged.width:>5.0f} x {arranged.height:>5.0f} mm, "
+                f"{arranged.density() * 100:>4.1f}% dense"
+            )
+        print(f"{footprints:>6d} footprints: " + "; ".join(results))
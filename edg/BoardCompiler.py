@@ -3,12 +3,12 @@ import inspect
 from contextlib import suppress
 from typing import Type, Optional, Tuple
 
-from . import edgir
-from .core import Block, ScalaCompiler, CompiledDesign, CompiledDesignExportTransform
+from .core import Block, ScalaCompiler, CompiledDesign, CompiledDesignExportTransform, TransformUtil
 from .electronics_model.NetlistBackend import NetlistBackend  # imported separately b/c mypy confuses with the modules
 from .electronics_model.SvgPcbBackend import SvgPcbBackend
 from .electronics_model.RefdesRefinementPass import RefdesRefinementPass
-from .electronics_model.BomBackend import GenerateBom
+from .electronics_model.BomBackend import GenerateBom, BomTransform
+from .electronics_model.NetlistGenerator import NetlistTransform
 
 
 def compile_board(design: Type[Block], target_dir_name: Optional[Tuple[str, str]]) -> CompiledDesign:
@@ -48,30 +48,27 @@ def compile_board(design: Type[Block], target_dir_name: Optional[Tuple[str, str]
 
         raise core.ScalaCompilerInterface.CompilerCheckError(f"error during compilation:\n{compiled.errors_str()}")
 
-    netlist_all = NetlistBackend().run(compiled)
-    bom_all = GenerateBom().run(compiled)
+    # netlisting and BOM generation are read-only and independent, so share one traversal of the design
+    netlist_transform = NetlistTransform(compiled)
+    bom_transform = BomTransform(compiled)
+    TransformUtil.FusedTransform([netlist_transform, bom_transform]).visit_design(compiled.design)
+    board_netlists = compiled.netlists(netlist_transform)  # shared with other backends
+
+    bom_all = GenerateBom().generate(bom_transform.bom_list)
     assert len(bom_all) == 1
-    svgpcb_all = SvgPcbBackend().run(compiled)
-    assert len(svgpcb_all) == 1
+    top_netlist = compiled.netlist()  # SVG-PCB is only generated for a top-level board
+    svgpcb = SvgPcbBackend().generate(compiled, top_netlist) if top_netlist is not None else None
     compiled_json = CompiledDesignExportTransform(compiled).transform()
 
     if target_dir_name is not None:
-        for path, netlist in netlist_all:
-            path_str = edgir.local_path_to_str_list(path)
-            if not path_str:
-                net_filename = netlist_filename_prefix + ".net"
-            else:
-                net_filename = netlist_filename_prefix + "_" + "_".join(path_str) + ".net"
-
-            with open(net_filename, "w", encoding="utf-8") as net_file:
-                net_file.write(netlist)
+        NetlistBackend().write(board_netlists, netlist_filename_prefix)  # streamed, since netlists can be large
 
         with open(bom_filename, "w", encoding="utf-8") as bom_file:
             bom_file.write(bom_all[0][1])
 
-        if svgpcb_all:
+        if svgpcb is not None:
             with open(svgpcb_filename, "w", encoding="utf-8") as svgpcb_file:
-                svgpcb_file.write(svgpcb_all[0][1])
+                svgpcb_file.write(svgpcb)
 
         with open(compiled_json_filename, "w", encoding="utf-8") as compiled_json_file:
             compiled_json_file.write(
@@ -0,0 +1,890 @@
+# Generated by `python -m edg.tools.export_index`, regenerate after changing the exports.
+# Maps each name exported by the package to the module (relative to the package) it is loaded from.
+kExportIndex = {
+    "A1304": ".parts",
+    "A4988": ".parts",
+    "AaBattery": ".parts",
+    "AaBatteryStack": ".parts",
+    "Accelerometer": ".electronics_model",
+    "Ad8418a": ".parts",
+    "Afc01": ".parts",
+    "Afc07Top": ".parts",
+    "Ah1806": ".parts",
+    "Al8861": ".parts",
+    "AluminumCapacitor": ".abstract_parts",
+    "Amp": ".electronics_model",
+    "Amphenol901143": ".parts",
+    "Amplifier": ".circuits",
+    "Ams1117": ".parts",
+    "Analog": ".electronics_model",
+    "AnalogCapacitor": ".abstract_parts",
+    "AnalogClampResistor": ".circuits",
+    "AnalogClampZenerDiode": ".abstract_parts",
+    "AnalogCoaxTestPoint": ".abstract_parts",
+    "AnalogDemuxer": ".abstract_parts",
+    "AnalogFilter": ".electronics_model",
+    "AnalogIsolatedSwitch": ".abstract_parts",
+    "AnalogLink": ".electronics_interfaces",
+    "AnalogLowPassRc": ".circuits",
+    "AnalogMuxer": ".abstract_parts",
+    "AnalogSeriesCapacitor": ".abstract_parts",
+    "AnalogSeriesResistor": ".abstract_parts",
+    "AnalogSetpointResistor": ".abstract_parts",
+    "AnalogSink": ".electronics_interfaces",
+    "AnalogSource": ".electronics_interfaces",
+    "AnalogSwitch": ".abstract_parts",
+    "AnalogSwitchTree": ".abstract_parts",
+    "AnalogTestPoint": ".abstract_parts",
+    "AnalogToDigital": ".electronics_model",
+    "Antenna": ".abstract_parts",
+    "AnyPin": ".electronics_model",
+    "AnyPinAssign": ".electronics_model",
+    "Ap2204k": ".parts",
+    "Ap2210": ".parts",
+    "Ap3012": ".parts",
+    "Ap3418": ".parts",
+    "Ap7215": ".parts",
+    "Apx803s": ".parts",
+    "ArrayBoolExpr": ".core",
+    "ArrayBoolLike": ".core",
+    "ArrayFloatExpr": ".core",
+    "ArrayFloatLike": ".core",
+    "ArrayIntExpr": ".core",
+    "ArrayIntLike": ".core",
+    "ArrayRangeExpr": ".core",
+    "ArrayRangeLike": ".core",
+    "ArrayStringExpr": ".core",
+    "ArrayStringLike": ".core",
+    "As7341": ".parts",
+    "BananaJack": ".abstract_parts",
+    "BananaSafetyJack": ".abstract_parts",
+    "BaseBackend": ".core",
+    "BaseBlock": ".core",
+    "BaseDiode": ".abstract_parts",
+    "BaseIoController": ".abstract_parts",
+    "BaseIoControllerExportable": ".abstract_parts",
+    "BaseIoControllerModelable": ".abstract_parts",
+    "BaseIoControllerPinmapGenerator": ".abstract_parts",
+    "BaseIoControllerWrapped": ".abstract_parts",
+    "BaseIoControllerWrapper": ".abstract_parts",
+    "BasePort": ".core",
+    "BaseRefinementPass": ".core",
+    "BaseTableFet": ".abstract_parts",
+    "Battery": ".abstract_parts",
+    "Bh1750": ".parts",
+    "BidirectionalLevelShifter": ".circuits",
+    "Bit": ".electronics_model",
+    "BitBangAdapter": ".electronics_model",
+    "Bjt": ".abstract_parts",
+    "BjtStandardFootprint": ".abstract_parts",
+    "BldcDriver": ".electronics_model",
+    "Block": ".core",
+    "BlockInterfaceMixin": ".core",
+    "BlueSmirf": ".parts",
+    "Bme680": ".parts",
+    "BoardTop": ".BoardTop",
+    "BoolExpr": ".core",
+    "BoolLike": ".core",
+    "BoostConverter": ".abstract_parts",
+    "BoostConverterPowerPath": ".circuits",
+    "BootstrapCapacitor": ".circuits",
+    "BootstrapVoltageAdder": ".circuits",
+    "BrushedMotorDriver": ".electronics_model",
+    "BuckBoostConverterPowerPath": ".circuits",
+    "BuckConverter": ".abstract_parts",
+    "BuckConverterPowerPath": ".circuits",
+    "BufferDeserializer": ".core",
+    "BufferSerializer": ".core",
+    "Bundle": ".core",
+    "Bwipx_1_001e": ".parts",
+    "Camera": ".electronics_model",
+    "CanControllerPort": ".electronics_interfaces",
+    "CanControllerTestPoint": ".abstract_parts",
+    "CanDiffLink": ".electronics_interfaces",
+    "CanDiffPort": ".electronics_interfaces",
+    "CanDiffTestPoint": ".abstract_parts",
+    "CanEsdDiode": ".abstract_parts",
+    "CanLogicLink": ".electronics_interfaces",
+    "CanPassivePort": ".electronics_interfaces",
+    "CanTransceiver": ".abstract_parts",
+    "CanTransceiverPort": ".electronics_interfaces",
+    "Capacitor": ".abstract_parts",
+    "CapacitorStandardFootprint": ".abstract_parts",
+    "Cbmud1200l": ".parts",
+    "CeramicCapacitor": ".abstract_parts",
+    "CeramicResonator": ".abstract_parts",
+    "Ch280qv10_Ct": ".parts",
+    "Ch32v003": ".parts",
+    "Ch32v203": ".parts",
+    "Ch32vSdi2Header": ".parts",
+    "Ch32vSdi2Header254": ".parts",
+    "Ch32vSdi2Tc2030": ".parts",
+    "Ch32vSdiHeader": ".parts",
+    "Ch32vSdiHeader254": ".parts",
+    "Ch32vSdiTc2030": ".parts",
+    "CharlieplexedLedMatrix": ".circuits",
+    "CircuitPort": ".electronics_model",
+    "CircuitPortAdapter": ".electronics_model",
+    "CircuitPortBridge": ".electronics_model",
+    "CombinedCapacitor": ".abstract_parts",
+    "Common": ".electronics_interfaces",
+    "CompactKeystone5015": ".parts",
+    "Comparator": ".abstract_parts",
+    "CompensatorType2": ".circuits",
+    "CompiledDesign": ".core",
+    "CompiledDesignExportTransform": ".core",
+    "CompilerCheckError": ".core",
+    "CompilerDaemon": ".core",
+    "CompilerDaemonClient": ".core",
+    "Connector": ".electronics_model",
+    "ConnectorResistiveSensor": ".circuits",
+    "ConnectorSpeaker": ".parts",
+    "ConstraintExpr": ".core",
+    "Cp2102": ".parts",
+    "CpuFanConnector": ".parts",
+    "CpuFanPwmControl": ".parts",
+    "Cr2032": ".parts",
+    "Crystal": ".abstract_parts",
+    "CrystalDriver": ".electronics_interfaces",
+    "CrystalLink": ".electronics_interfaces",
+    "CrystalPort": ".electronics_interfaces",
+    "Cstne": ".vendor_parts",
+    "Ct3151": ".parts",
+    "CurrentSenseResistor": ".abstract_parts",
+    "CurrentSensor": ".electronics_model",
+    "CustomDiode": ".vendor_parts",
+    "CustomFet": ".vendor_parts",
+    "CustomSyncBuckBoostConverterPwm": ".parts",
+    "CustomSyncBuckConverterIndependent": ".parts",
+    "DecouplingCapacitor": ".abstract_parts",
+    "DefaultExportBlock": ".core",
+    "DeprecatedBlock": ".electronics_model",
+    "DescriptionString": ".core",
+    "DesignTop": ".core",
+    "Dg468": ".parts",
+    "DifferentialAmplifier": ".circuits",
+    "DigitalArrayTestPoint": ".abstract_parts",
+    "DigitalBidir": ".electronics_interfaces",
+    "DigitalBidirNotConnected": ".electronics_interfaces",
+    "DigitalBidirSeriesResistor": ".abstract_parts",
+    "DigitalCapacitor": ".abstract_parts",
+    "DigitalClampResistor": ".circuits",
+    "DigitalDirectionSwitch": ".abstract_parts",
+    "DigitalDirectionSwitchCenter": ".abstract_parts",
+    "DigitalFilter": ".electronics_model",
+    "DigitalIsolator": ".abstract_parts",
+    "DigitalJumper": ".abstract_parts",
+    "DigitalLink": ".electronics_interfaces",
+    "DigitalLowPassRc": ".circuits",
+    "DigitalLowPassRcArray": ".circuits",
+    "DigitalRotaryEncoder": ".abstract_parts",
+    "DigitalRotaryEncoderSwitch": ".abstract_parts",
+    "DigitalSeriesResistor": ".abstract_parts",
+    "DigitalSingleSource": ".electronics_interfaces",
+    "DigitalSink": ".electronics_interfaces",
+    "DigitalSource": ".electronics_interfaces",
+    "DigitalSourceConnected": ".electronics_interfaces",
+    "DigitalSwitch": ".abstract_parts",
+    "DigitalTestPoint": ".abstract_parts",
+    "DigitalToAnalog": ".electronics_model",
+    "DigitalTvsDiode": ".abstract_parts",
+    "Diode": ".abstract_parts",
+    "DiodePowerMerge": ".circuits",
+    "DiodeStandardFootprint": ".abstract_parts",
+    "DirectionSwitch": ".abstract_parts",
+    "DirectionSwitchCenter": ".abstract_parts",
+    "DiscreteApplication": ".electronics_model",
+    "DiscreteBoostConverter": ".abstract_parts",
+    "DiscreteBuckConverter": ".abstract_parts",
+    "DiscreteComponent": ".electronics_model",
+    "DiscreteRfWarning": ".circuits",
+    "DiscreteSemiconductor": ".electronics_model",
+    "Display": ".electronics_model",
+    "DistanceSensor": ".electronics_model",
+    "Dm3btDsfPejs": ".parts",
+    "Drv8313": ".parts",
+    "Drv8833": ".parts",
+    "Drv8870": ".parts",
+    "DuckLogo": ".parts",
+    "DummyAnalogSink": ".electronics_interfaces",
+    "DummyAnalogSource": ".electronics_interfaces",
+    "DummyCapacitorFootprint": ".abstract_parts",
+    "DummyDevice": ".electronics_model",
+    "DummyDigitalSink": ".electronics_interfaces",
+    "DummyDigitalSource": ".electronics_interfaces",
+    "DummyGround": ".electronics_interfaces",
+    "DummyPassive": ".electronics_interfaces",
+    "DummyVoltageSink": ".electronics_interfaces",
+    "DummyVoltageSource": ".electronics_interfaces",
+    "Dvp8Camera": ".electronics_interfaces",
+    "Dvp8Host": ".electronics_interfaces",
+    "Dvp8Link": ".electronics_interfaces",
+    "E93Lc_B": ".parts",
+    "EInk": ".electronics_model",
+    "ESeriesRatioUtil": ".abstract_parts",
+    "ESeriesRatioValue": ".abstract_parts",
+    "ESeriesUtil": ".abstract_parts",
+    "Ec05e": ".parts",
+    "Ec11eWithSwitch": ".parts",
+    "Ec11j15WithSwitch": ".parts",
+    "ElementDict": ".core",
+    "EnvironmentalSensor": ".electronics_model",
+    "Er_Epd027_2": ".parts",
+    "Er_Oled022_1": ".parts",
+    "Er_Oled028_1": ".parts",
+    "Er_Oled_091_3": ".parts",
+    "Er_Oled_096_1_1": ".parts",
+    "Er_Oled_096_1c": ".parts",
+    "Er_Tft_128_3": ".parts",
+    "Esp32_Wroom_32": ".parts",
+    "Esp32c3": ".parts",
+    "Esp32c3_Wroom02": ".parts",
+    "Esp32s3_Wroom_1": ".parts",
+    "EspAutoProgram": ".parts",
+    "EspProgrammingAutoReset": ".parts",
+    "EspProgrammingHeader": ".parts",
+    "EspProgrammingPinHeader254": ".parts",
+    "EspProgrammingTc2030": ".parts",
+    "Farad": ".electronics_model",
+    "Fcr7350": ".parts",
+    "Feather_Nrf52840": ".parts",
+    "FeedbackVoltageDivider": ".circuits",
+    "FerriteBead": ".abstract_parts",
+    "FerriteBeadStandardFootprint": ".abstract_parts",
+    "Fet": ".abstract_parts",
+    "FetHalfBridge": ".circuits",
+    "FetHalfBridgeIndependent": ".circuits",
+    "FetHalfBridgePwmReset": ".circuits",
+    "FetStandardFootprint": ".abstract_parts",
+    "Filter": ".electronics_model",
+    "FlirLepton": ".parts",
+    "FloatExpr": ".core",
+    "FloatLike": ".core",
+    "FootprintBlock": ".electronics_model",
+    "FootprintDataTable": ".electronics_model",
+    "FootprintPassiveConnector": ".abstract_parts",
+    "FootprintTouchPad": ".parts",
+    "ForcedAnalogSignal": ".electronics_interfaces",
+    "ForcedDigitalSinkCurrentDraw": ".electronics_interfaces",
+    "ForcedVoltage": ".electronics_interfaces",
+    "ForcedVoltageCurrent": ".electronics_interfaces",
+    "ForcedVoltageCurrentDraw": ".electronics_interfaces",
+    "ForcedVoltageCurrentLimit": ".electronics_interfaces",
+    "Fpc030": ".parts",
+    "Fpc030Bottom": ".parts",
+    "Fpc030Top": ".parts",
+    "Fpc030TopBottom": ".parts",
+    "Fpc050": ".parts",
+    "Fpc050Bottom": ".parts",
+    "Fpc050BottomFlip": ".parts",
+    "Fpc050Pair": ".parts",
+    "Fpc050Top": ".parts",
+    "Fpga": ".electronics_model",
+    "Freenove_Esp32_Wrover": ".parts",
+    "Freenove_Esp32s3_Wroom": ".parts",
+    "Ft232hl": ".parts",
+    "Fusb302b": ".parts",
+    "Fuse": ".abstract_parts",
+    "FuseStandardFootprint": ".abstract_parts",
+    "G3VM_61GR2": ".parts",
+    "GHertz": ".electronics_model",
+    "GasSensor": ".electronics_model",
+    "GeneratorBlock": ".core",
+    "GenericAxialResistor": ".vendor_parts",
+    "GenericAxialVerticalResistor": ".vendor_parts",
+    "GenericChipResistor": ".vendor_parts",
+    "GenericMlcc": ".vendor_parts",
+    "Ground": ".electronics_interfaces",
+    "GroundJumper": ".abstract_parts",
+    "GroundLink": ".electronics_interfaces",
+    "GroundReference": ".electronics_interfaces",
+    "GroundSource": ".electronics_interfaces",
+    "GroundTestPoint": ".abstract_parts",
+    "Gyroscope": ".electronics_model",
+    "HalfBridge": ".circuits",
+    "HalfBridgeDriver": ".abstract_parts",
+    "HalfBridgeDriverIndependent": ".abstract_parts",
+    "HalfBridgeDriverPwm": ".abstract_parts",
+    "HalfBridgeIndependent": ".circuits",
+    "HalfBridgePwm": ".circuits",
+    "HasEspProgramming": ".parts",
+    "HasPassivePort": ".electronics_model",
+    "Hdc1080": ".parts",
+    "Henry": ".electronics_model",
+    "Hertz": ".electronics_model",
+    "HighSideSwitch": ".circuits",
+    "HiroseFh12sh": ".parts",
+    "HiroseFh35cshw": ".parts",
+    "Holyiot_18010": ".parts",
+    "HumanInterface": ".electronics_model",
+    "HumiditySensor": ".electronics_model",
+    "I2cController": ".electronics_interfaces",
+    "I2cControllerBitBang": ".circuits",
+    "I2cLink": ".electronics_interfaces",
+    "I2cMaster": ".electronics_interfaces",
+    "I2cPullup": ".circuits",
+    "I2cPullupPort": ".electronics_interfaces",
+    "I2cSlave": ".electronics_interfaces",
+    "I2cTarget": ".electronics_interfaces",
+    "I2cTestPoint": ".abstract_parts",
+    "I2sController": ".electronics_interfaces",
+    "I2sLink": ".electronics_interfaces",
+    "I2sTargetReceiver": ".electronics_interfaces",
+    "Ice40up": ".parts",
+    "IdDots4": ".parts",
+    "IdealModel": ".electronics_model",
+    "IdentityDict": ".core",
+    "IdentitySet": ".core",
+    "ImplicitConnect": ".core",
+    "Imu_Lsm6ds3trc": ".parts",
+    "InOut": ".core",
+    "Ina219": ".parts",
+    "Ina826": ".parts",
+    "IndicatorLed": ".abstract_parts",
+    "IndicatorLedArray": ".abstract_parts",
+    "IndicatorSinkLed": ".abstract_parts",
+    "IndicatorSinkLedArray": ".abstract_parts",
+    "IndicatorSinkLedResistor": ".abstract_parts",
+    "IndicatorSinkPackedRgbLed": ".abstract_parts",
+    "IndicatorSinkRgbLed": ".abstract_parts",
+    "Inductor": ".abstract_parts",
+    "Input": ".core",
+    "IntExpr": ".core",
+    "IntLike": ".core",
+    "IntegratorInverting": ".circuits",
+    "Interface": ".electronics_model",
+    "InternalBlock": ".core",
+    "InternalSubcircuit": ".electronics_model",
+    "IoController": ".abstract_parts",
+    "IoControllerBle": ".abstract_parts",
+    "IoControllerBluetooth": ".abstract_parts",
+    "IoControllerCan": ".abstract_parts",
+    "IoControllerDac": ".abstract_parts",
+    "IoControllerDvp8": ".abstract_parts",
+    "IoControllerI2cTarget": ".abstract_parts",
+    "IoControllerI2s": ".abstract_parts",
+    "IoControllerPowerOut": ".abstract_parts",
+    "IoControllerPowerRequired": ".abstract_parts",
+    "IoControllerSpiPeripheral": ".abstract_parts",
+    "IoControllerTouchDriver": ".abstract_parts",
+    "IoControllerUsb": ".abstract_parts",
+    "IoControllerUsbCc": ".abstract_parts",
+    "IoControllerUsbOut": ".abstract_parts",
+    "IoControllerVin": ".abstract_parts",
+    "IoControllerWifi": ".abstract_parts",
+    "IoControllerWithSwdTargetConnector": ".abstract_parts",
+    "IoExpander": ".electronics_model",
+    "Ir2301": ".parts",
+    "Iso1050dub": ".parts",
+    "IsolatedCanTransceiver": ".abstract_parts",
+    "JacdacDataInterface": ".parts",
+    "JacdacDataPort": ".parts",
+    "JacdacDeviceTop": ".parts",
+    "JacdacEdgeConnector": ".parts",
+    "JacdacMountingData1": ".parts",
+    "JacdacMountingGnd2": ".parts",
+    "JacdacMountingGnd4": ".parts",
+    "JacdacMountingPwr3": ".parts",
+    "JacdacPassivePort": ".parts",
+    "JlcAluminumCapacitor": ".vendor_parts.jlc",
+    "JlcAntenna": ".vendor_parts.jlc",
+    "JlcBjt": ".vendor_parts.jlc",
+    "JlcBoardTop": ".BoardTop",
+    "JlcCapacitor": ".vendor_parts.jlc",
+    "JlcCrystal": ".vendor_parts.jlc",
+    "JlcDiode": ".vendor_parts.jlc",
+    "JlcFerriteBead": ".vendor_parts.jlc",
+    "JlcFet": ".vendor_parts.jlc",
+    "JlcInductor": ".vendor_parts.jlc",
+    "JlcLed": ".vendor_parts.jlc",
+    "JlcOscillator": ".vendor_parts.jlc",
+    "JlcPart": ".vendor_parts.jlc",
+    "JlcPptcFuse": ".vendor_parts.jlc",
+    "JlcResistor": ".vendor_parts.jlc",
+    "JlcResistorArray": ".vendor_parts.jlc",
+    "JlcSwitch": ".vendor_parts.jlc",
+    "JlcSwitchFet": ".vendor_parts.jlc",
+    "JlcZenerDiode": ".vendor_parts.jlc",
+    "JstPh": ".parts",
+    "JstPhKHorizontal": ".parts",
+    "JstPhKVertical": ".parts",
+    "JstPhSmVertical": ".parts",
+    "JstPhSmVerticalJlc": ".parts",
+    "JstShSmHorizontal": ".parts",
+    "JstXh": ".parts",
+    "JstXhAHorizontal": ".parts",
+    "JstXhAVertical": ".parts",
+    "Jumper": ".abstract_parts",
+    "KailhSocket": ".vendor_parts",
+    "Keystone5000": ".parts",
+    "Keystone5015": ".parts",
+    "KiCadBlackbox": ".electronics_model",
+    "KiCadBlackboxBase": ".electronics_model",
+    "KiCadImportableBlock": ".electronics_model",
+    "KiCadInstantiableBlock": ".electronics_model",
+    "KiCadJlcBlackbox": ".vendor_parts.jlc",
+    "KiCadLibSymbol": ".electronics_model",
+    "KiCadSchematicBlock": ".electronics_model",
+    "KiCadSymbol": ".electronics_model",
+    "KicadImportablePortAdapter": ".electronics_model",
+    "L293dd": ".parts",
+    "L74Ahct1g125": ".parts",
+    "L78l": ".parts",
+    "LHighPassFilter": ".circuits",
+    "LLowPassFilter": ".circuits",
+    "LLowPassFilterWith2HNotch": ".circuits",
+    "Label": ".electronics_model",
+    "Lcd": ".electronics_model",
+    "Ld1117": ".parts",
+    "Ldl1117": ".parts",
+    "LeadFreeIndicator": ".parts",
+    "Led": ".abstract_parts",
+    "LedColor": ".abstract_parts",
+    "LedColorLike": ".abstract_parts",
+    "LedDriver": ".abstract_parts",
+    "LedDriverPwm": ".abstract_parts",
+    "LedDriverSwitchingConverter": ".abstract_parts",
+    "LedStandardFootprint": ".abstract_parts",
+    "LemurLogo": ".parts",
+    "Li18650": ".parts",
+    "LibraryElement": ".core",
+    "Light": ".electronics_model",
+    "LightSensor": ".electronics_model",
+    "LinearRegulator": ".abstract_parts",
+    "LinearRegulatorDevice": ".abstract_parts",
+    "Link": ".core",
+    "LipoConnector": ".parts",
+    "LiteralConstructor": ".core",
+    "Lm2664": ".parts",
+    "Lm2733": ".parts",
+    "Lm4871": ".parts",
+    "Lmr38020": ".parts",
+    "Lmv321": ".parts",
+    "Lmv331": ".parts",
+    "LoadSwitch": ".circuits",
+    "LowPassAnalogDifferentialRc": ".circuits",
+    "LowPassRc": ".circuits",
+    "LowPassRcDac": ".circuits",
+    "Lp5907": ".parts",
+    "Lpc1549_48": ".parts",
+    "Lpc1549_64": ".parts",
+    "Lsm6ds3trc": ".parts",
+    "Lsm6dsv16x": ".parts",
+    "Ltc3429": ".parts",
+    "MHertz": ".electronics_model",
+    "MOhm": ".electronics_model",
+    "Mag_Qmc5883l": ".parts",
+    "MagneticSensor": ".electronics_model",
+    "MagneticSwitch": ".electronics_model",
+    "Magnetometer": ".electronics_model",
+    "Max17048": ".parts",
+    "Max98357a": ".parts",
+    "Mcp3201": ".parts",
+    "Mcp3561": ".parts",
+    "Mcp4728": ".parts",
+    "Mcp47f": ".parts",
+    "Mcp4921": ".parts",
+    "Mcp6001": ".parts",
+    "Mcp73831": ".parts",
+    "Mdbt50q_1mv2": ".parts",
+    "Mechanical": ".electronics_model",
+    "MechanicalKeyswitch": ".abstract_parts",
+    "Memory": ".electronics_model",
+    "MergedAnalogSource": ".electronics_interfaces",
+    "MergedDigitalSource": ".electronics_interfaces",
+    "MergedSpiController": ".electronics_interfaces",
+    "MergedVoltageSource": ".electronics_interfaces",
+    "MiBit": ".electronics_model",
+    "MicroSdSocket": ".parts",
+    "Microcontroller": ".electronics_model",
+    "Microphone": ".electronics_model",
+    "Molex1040310811": ".parts",
+    "MolexSl": ".parts",
+    "MotorDriver": ".electronics_model",
+    "MountingHole": ".parts",
+    "MountingHole_M2_5": ".parts",
+    "MountingHole_M3": ".parts",
+    "MountingHole_M4": ".parts",
+    "MountingHole_NoPad_M2_5": ".parts",
+    "Mp2722": ".parts",
+    "MultiBiDict": ".core",
+    "MultipackBlock": ".core",
+    "MultipackDevice": ".electronics_model",
+    "MultipackOpamp": ".abstract_parts",
+    "MultipackOpampGenerator": ".abstract_parts",
+    "Nano2Fuseholder": ".vendor_parts",
+    "Ncp3420": ".parts",
+    "Neopixel": ".abstract_parts",
+    "NeopixelArray": ".parts",
+    "NeopixelArrayCircular": ".parts",
+    "NetBlock": ".electronics_model",
+    "NetPackingBlock": ".electronics_interfaces",
+    "NetlistBackend": ".electronics_model",
+    "Nhd_312_25664uc": ".parts",
+    "Nlas4157": ".parts",
+    "Nonstrict3v3Compatible": ".abstract_parts",
+    "NotConnectedPin": ".electronics_model",
+    "Nucleo_F303k8": ".parts",
+    "Ohm": ".electronics_model",
+    "Oled": ".electronics_model",
+    "Opa189": ".parts",
+    "Opa197": ".parts",
+    "Opa2171": ".parts",
+    "Opa2189": ".parts",
+    "Opa2197": ".parts",
+    "Opa2333": ".parts",
+    "Opamp": ".abstract_parts",
+    "OpampApplication": ".electronics_model",
+    "OpampCurrentSensor": ".circuits",
+    "OpampElement": ".abstract_parts",
+    "OpampFollower": ".circuits",
+    "OpenDrainDriver": ".circuits",
+    "Oscillator": ".abstract_parts",
+    "OscillatorReference": ".abstract_parts",
+    "Outline_Pn1332": ".parts",
+    "Output": ".core",
+    "Ov2640": ".parts",
+    "Ov2640_Fpc24": ".parts",
+    "PackedBlockArray": ".core",
+    "PackedGround": ".electronics_interfaces",
+    "PackedPassive": ".electronics_interfaces",
+    "PackedVoltageSource": ".electronics_interfaces",
+    "Pam8302a": ".parts",
+    "ParamValue": ".core",
+    "PartParserUtil": ".electronics_model",
+    "PartsTable": ".abstract_parts",
+    "PartsTableAreaSelector": ".abstract_parts",
+    "PartsTableBase": ".abstract_parts",
+    "PartsTableColumn": ".abstract_parts",
+    "PartsTableFootprintFilter": ".abstract_parts",
+    "PartsTablePart": ".abstract_parts",
+    "PartsTableRow": ".abstract_parts",
+    "PartsTableSelector": ".abstract_parts",
+    "PartsTableSelectorFootprint": ".abstract_parts",
+    "Passive": ".electronics_model",
+    "PassiveComponent": ".electronics_model",
+    "PassiveConnector": ".abstract_parts",
+    "PassiveLink": ".electronics_model",
+    "Pca9554": ".parts",
+    "Pcf2129": ".parts",
+    "Pcf8574": ".parts",
+    "Pec11s": ".parts",
+    "PeripheralAnyResource": ".abstract_parts",
+    "PeripheralFixedPin": ".abstract_parts",
+    "PeripheralFixedResource": ".abstract_parts",
+    "PeripheralPinAssign": ".electronics_model",
+    "Pesd1can": ".parts",
+    "Pesd5v0x1bt": ".parts",
+    "Pgb102st23": ".parts",
+    "PiLowPassFilter": ".circuits",
+    "Picoblade": ".parts",
+    "Picoblade53261": ".parts",
+    "Picoblade53398": ".parts",
+    "PinAssignmentUtil": ".electronics_model",
+    "PinHeader127DualShrouded": ".parts",
+    "PinHeader254": ".parts",
+    "PinHeader254DualShroudedInline": ".parts",
+    "PinHeader254Horizontal": ".parts",
+    "PinHeader254Vertical": ".parts",
+    "PinHeader2mm": ".parts",
+    "PinHeader2mmHorizontal": ".parts",
+    "PinHeader2mmVertical": ".parts",
+    "PinMapUtil": ".abstract_parts",
+    "PinMappable": ".abstract_parts",
+    "PinResource": ".abstract_parts",
+    "PinSocket254": ".parts",
+    "PinSocket254Pair": ".parts",
+    "PinSocket2mm": ".parts",
+    "PinSocket2mmPair": ".parts",
+    "Pj_036ah": ".parts",
+    "Pj_102ah": ".parts",
+    "PmosChargerReverseProtection": ".circuits",
+    "PmosReverseProtection": ".circuits",
+    "Pn7160": ".parts",
+    "PololuA4988": ".parts",
+    "Port": ".core",
+    "PortAdapter": ".core",
+    "PortBridge": ".core",
+    "PortTag": ".core",
+    "Power": ".electronics_interfaces",
+    "PowerBarrelJack": ".parts",
+    "PowerConditioner": ".electronics_model",
+    "PowerSource": ".electronics_model",
+    "PowerSwitch": ".electronics_model",
+    "PptcFuse": ".abstract_parts",
+    "PressureSensor": ".electronics_model",
+    "PriorityPowerOr": ".circuits",
+    "ProgrammableController": ".electronics_model",
+    "ProgrammingConnector": ".electronics_model",
+    "Protection": ".electronics_model",
+    "ProtectionTvsDiode": ".abstract_parts",
+    "ProtectionZenerDiode": ".abstract_parts",
+    "PulldownResistor": ".abstract_parts",
+    "PulldownResistorArray": ".abstract_parts",
+    "PullupDelayRc": ".circuits",
+    "PullupResistor": ".abstract_parts",
+    "PullupResistorArray": ".abstract_parts",
+    "Qmc5883l": ".parts",
+    "Qmc5883p": ".parts",
+    "Qt096t_if09": ".parts",
+    "QwiicTarget": ".parts",
+    "Radiofrequency": ".electronics_model",
+    "RampLimiter": ".circuits",
+    "Range": ".core",
+    "RangeExpr": ".core",
+    "RangeLike": ".core",
+    "Ratio": ".electronics_model",
+    "Rclamp0521p": ".parts",
+    "RealtimeClock": ".electronics_model",
+    "Ref30xx": ".parts",
+    "RefdesRefinementPass": ".electronics_model",
+    "Refinements": ".core",
+    "Resettable": ".abstract_parts",
+    "ResistiveDivider": ".circuits",
+    "Resistor": ".abstract_parts",
+    "ResistorArray": ".abstract_parts",
+    "ResistorArrayStandardFootprint": ".abstract_parts",
+    "ResistorStandardFootprint": ".abstract_parts",
+    "RfConnector": ".abstract_parts",
+    "RfConnectorAntenna": ".abstract_parts",
+    "RfConnectorTestPoint": ".abstract_parts",
+    "RfFilter": ".electronics_model",
+    "RgbLedCommonAnode": ".abstract_parts",
+    "RotaryEncoder": ".abstract_parts",
+    "RotaryEncoderSwitch": ".abstract_parts",
+    "Rp2040": ".parts",
+    "S8261A": ".parts",
+    "ScalaCompiler": ".core",
+    "Sd18ob261": ".parts",
+    "SdCard": ".parts",
+    "SdSocket": ".parts",
+    "Second": ".electronics_model",
+    "SelectorArea": ".abstract_parts",
+    "SelectorFootprint": ".abstract_parts",
+    "Sensor": ".electronics_model",
+    "SeriesPowerFerriteBead": ".abstract_parts",
+    "SeriesPowerFuse": ".abstract_parts",
+    "SeriesPowerInductor": ".abstract_parts",
+    "SeriesPowerPptcFuse": ".abstract_parts",
+    "SeriesPowerResistor": ".abstract_parts",
+    "SeriesResistor": ".abstract_parts",
+    "Shtc3": ".parts",
+    "SignalDivider": ".circuits",
+    "SimpleBoardTop": ".BoardTop",
+    "SingleDiodePowerMerge": ".circuits",
+    "Sk6805_Ec15": ".parts",
+    "Sk6812Mini_E": ".parts",
+    "Sk6812_Side_A": ".parts",
+    "Skrh": ".parts",
+    "Skrtlae010": ".vendor_parts.jlc",
+    "SmaConnector": ".abstract_parts",
+    "SmaFConnector": ".abstract_parts",
+    "SmaMConnector": ".abstract_parts",
+    "Smt0404RgbLed": ".vendor_parts",
+    "Smt0606RgbLed": ".vendor_parts",
+    "SmtLed": ".vendor_parts",
+    "SmtSwitch": ".vendor_parts",
+    "SmtSwitchRa": ".vendor_parts",
+    "Sn65hvd230": ".parts",
+    "Sn74lvc1g3157": ".parts",
+    "Sn74lvc1g74": ".parts",
+    "Sn74lvc2g02": ".parts",
+    "SoftPowerGate": ".circuits",
+    "SoftPowerSwitch": ".circuits",
+    "SolderJumperTriangular": ".parts",
+    "SolidStateRelay": ".abstract_parts",
+    "Speaker": ".parts",
+    "SpeakerDriver": ".electronics_model",
+    "SpeakerDriverPort": ".electronics_interfaces",
+    "SpeakerLink": ".electronics_interfaces",
+    "SpeakerPort": ".electronics_interfaces",
+    "SpiController": ".electronics_interfaces",
+    "SpiLink": ".electronics_interfaces",
+    "SpiMaster": ".electronics_interfaces",
+    "SpiMemory": ".abstract_parts",
+    "SpiMemoryQspi": ".abstract_parts",
+    "SpiPeripheral": ".electronics_interfaces",
+    "SpiSlave": ".electronics_interfaces",
+    "SpiTestPoint": ".abstract_parts",
+    "StandardFootprint": ".abstract_parts",
+    "Stm32f103": ".parts",
+    "Stm32f103_48": ".parts",
+    "Stm32g031_G": ".parts",
+    "Stm32g431kb": ".parts",
+    "Stm32l432k": ".parts",
+    "StringExpr": ".core",
+    "StringLike": ".core",
+    "SubElementDict": ".core",
+    "SubboardBlock": ".electronics_model",
+    "SubboardConnectorPair": ".electronics_model",
+    "SummingAmplifier": ".circuits",
+    "SvgPcbBackend": ".electronics_model",
+    "SvgPcbTemplateBlock": ".electronics_model",
+    "SwdCortexTargetConnector": ".abstract_parts",
+    "SwdCortexTargetConnectorReset": ".abstract_parts",
+    "SwdCortexTargetConnectorSwo": ".abstract_parts",
+    "SwdCortexTargetConnectorTdi": ".abstract_parts",
+    "SwdCortexTargetHeader": ".parts",
+    "SwdCortexTargetTagConnect": ".parts",
+    "SwdHostPort": ".electronics_interfaces",
+    "SwdLink": ".electronics_interfaces",
+    "SwdPullPort": ".electronics_interfaces",
+    "SwdTargetPort": ".electronics_interfaces",
+    "Switch": ".abstract_parts",
+    "SwitchFet": ".abstract_parts",
+    "SwitchMatrix": ".circuits",
+    "SwitchMatrixNeopixels": ".circuits",
+    "SwitchingVoltageRegulator": ".abstract_parts",
+    "Sx1262": ".parts",
+    "TableAntenna": ".abstract_parts",
+    "TableBjt": ".abstract_parts",
+    "TableCapacitor": ".abstract_parts",
+    "TableCrystal": ".abstract_parts",
+    "TableDeratingCapacitor": ".abstract_parts",
+    "TableDiode": ".abstract_parts",
+    "TableFerriteBead": ".abstract_parts",
+    "TableFet": ".abstract_parts",
+    "TableFuse": ".abstract_parts",
+    "TableInductor": ".abstract_parts",
+    "TableLed": ".abstract_parts",
+    "TableOscillator": ".abstract_parts",
+    "TableResistor": ".abstract_parts",
+    "TableResistorArray": ".abstract_parts",
+    "TableSwitchFet": ".abstract_parts",
+    "TableZenerDiode": ".abstract_parts",
+    "TactileSwitch": ".abstract_parts",
+    "TagConnect": ".parts",
+    "TagConnectLegged": ".parts",
+    "TagConnectNonLegged": ".parts",
+    "Te1734839": ".parts",
+    "TeRc": ".parts",
+    "TemperatureSensor": ".electronics_model",
+    "TestPoint": ".abstract_parts",
+    "Testing": ".electronics_model",
+    "ThtLed": ".vendor_parts",
+    "ThtRgbLed": ".vendor_parts",
+    "Tlp170am": ".parts",
+    "Tlp3545a": ".parts",
+    "Tlv757p": ".parts",
+    "Tlv9061": ".parts",
+    "Tlv9152": ".parts",
+    "Tmp1075n": ".parts",
+    "TouchDriver": ".electronics_interfaces",
+    "TouchPadPort": ".electronics_interfaces",
+    "Tpa2005d1": ".parts",
+    "Tpd2e009": ".parts",
+    "Tps54202h": ".parts",
+    "Tps561201": ".parts",
+    "Tps61040": ".parts",
+    "Tps92200": ".parts",
+    "TransformUtil": ".core",
+    "TvsDiode": ".abstract_parts",
+    "TypedJumper": ".electronics_model",
+    "TypedTestPoint": ".electronics_model",
+    "UartLink": ".electronics_interfaces",
+    "UartPort": ".electronics_interfaces",
+    "Ucc27282": ".parts",
+    "UflConnector": ".abstract_parts",
+    "UnitUtils": ".electronics_model",
+    "UnpolarizedCapacitor": ".abstract_parts",
+    "UsbAReceptacle": ".parts",
+    "UsbBitBang": ".circuits",
+    "UsbCReceptacle": ".parts",
+    "UsbCcPort": ".electronics_interfaces",
+    "UsbConnector": ".abstract_parts",
+    "UsbDeviceConnector": ".abstract_parts",
+    "UsbDevicePort": ".electronics_interfaces",
+    "UsbEsdDiode": ".abstract_parts",
+    "UsbHostConnector": ".abstract_parts",
+    "UsbHostPort": ".electronics_interfaces",
+    "UsbLink": ".electronics_interfaces",
+    "UsbMicroBReceptacle": ".parts",
+    "UsbPassivePort": ".electronics_interfaces",
+    "UsbSeriesResistor": ".circuits",
+    "VariantPinRemapper": ".abstract_parts",
+    "Vector": ".core",
+    "Vl53l0x": ".parts",
+    "Vl53l0xApplication": ".parts",
+    "Vl53l0xArray": ".parts",
+    "Vl53l0xConnector": ".parts",
+    "Vl53l5cx": ".parts",
+    "Volt": ".electronics_model",
+    "VoltageComparator": ".circuits",
+    "VoltageDivider": ".circuits",
+    "VoltageIndicatorLed": ".abstract_parts",
+    "VoltageIsolatedSwitch": ".abstract_parts",
+    "VoltageJumper": ".abstract_parts",
+    "VoltageLink": ".electronics_interfaces",
+    "VoltageReference": ".abstract_parts",
+    "VoltageRegulator": ".abstract_parts",
+    "VoltageRegulatorEnableWrapper": ".abstract_parts",
+    "VoltageSenseDivider": ".circuits",
+    "VoltageSink": ".electronics_interfaces",
+    "VoltageSource": ".electronics_interfaces",
+    "VoltageSourceConnected": ".electronics_interfaces",
+    "VoltageTestPoint": ".abstract_parts",
+    "W25q": ".parts",
+    "Watt": ".electronics_model",
+    "Waveshare_Epd": ".parts",
+    "WithCrystalGenerator": ".abstract_parts",
+    "WrapperSubboardBlock": ".electronics_model",
+    "Ws2812b": ".parts",
+    "Ws2812c_2020": ".parts",
+    "Xbee_S3b": ".parts",
+    "XboxElite2Joystick": ".parts",
+    "Xc6206p": ".parts",
+    "Xc6209": ".parts",
+    "Xc9142": ".parts",
+    "Xiao_Esp32c3": ".parts",
+    "Xiao_Rp2040": ".parts",
+    "ZenerDiode": ".abstract_parts",
+    "abstract_block": ".core",
+    "abstract_block_default": ".core",
+    "abstract_parts": ".",
+    "builder": ".core",
+    "circuits": ".",
+    "compile_board": ".BoardCompiler",
+    "compile_board_inplace": ".BoardCompiler",
+    "core": ".",
+    "edgir": ".",
+    "edgrpc": ".",
+    "electronics_interfaces": ".",
+    "electronics_model": ".",
+    "init_in_parent": ".core",
+    "jlc": ".vendor_parts",
+    "jlcparts": ".vendor_parts",
+    "kHertz": ".electronics_model",
+    "kOhm": ".electronics_model",
+    "kiBit": ".electronics_model",
+    "mAmp": ".electronics_model",
+    "mOhm": ".electronics_model",
+    "mSecond": ".electronics_model",
+    "mVolt": ".electronics_model",
+    "nAmp": ".electronics_model",
+    "nFarad": ".electronics_model",
+    "nHenry": ".electronics_model",
+    "nSecond": ".electronics_model",
+    "non_library": ".core",
+    "pAmp": ".electronics_model",
+    "pFarad": ".electronics_model",
+    "parts": ".",
+    "uAmp": ".electronics_model",
+    "uFarad": ".electronics_model",
+    "uHenry": ".electronics_model",
+    "uSecond": ".electronics_model",
+    "util": ".",
+    "vendor_parts": ".",
+}
+
+# Submodules that are also visible as attributes with eager imports
+kSubmodules = [
+    "BoardCompiler",
+    "BoardTop",
+    "abstract_parts",
+    "circuits",
+    "core",
+    "electronics_interfaces",
+    "electronics_model",
+    "parts",
+    "vendor_parts",
+]
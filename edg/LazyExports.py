@@ -0,0 +1,140 @@
+import importlib
+import json
+import os
+import sys
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple
+
+from typing_extensions import override
+
+# Sources of the names exported by a package, in the order they would be imported eagerly (so later sources
+# override earlier ones), as (module relative to the package, names or None for everything from a star import).
+# The source "." exports submodules of the package itself, like `from . import edgir`.
+ExportSources = List[Tuple[str, Optional[List[str]]]]
+
+# Packages with lazy exports, in the order their indices must be generated (packages before those re-exporting them)
+kLazyPackages = ["edg.parts", "edg"]
+
+
+class LazyExportsModule(ModuleType):
+    """Module type for packages that load their exports lazily on first access, using a generated index that maps
+    each exported name to the module it is loaded from. This allows eg `from edg import Holyiot_18010` to import
+    only the modules needed instead of the entire library.
+    `from package import *` and dir(package) (used by the compiler to index the library) still load everything."""
+
+    _export_index: Dict[str, str]
+    _export_submodules: List[str]
+
+    @classmethod
+    def install(cls, name: str, index: Dict[str, str], submodules: List[str]) -> None:
+        """Makes the already-imported package lazy, with its export index and submodules"""
+        module = sys.modules[name]
+        module.__class__ = cls
+        assert isinstance(module, LazyExportsModule)
+        module._export_index = index
+        module._export_submodules = submodules
+        module.__all__ = list(index.keys())
+
+    @override
+    def __getattr__(self, name: str) -> Any:  # only called if the attribute was not found normally
+        source = self.__dict__.get("_export_index", {}).get(name)
+        if source == ".":
+            value = importlib.import_module("." + name, self.__name__)
+        elif source is not None:
+            value = getattr(importlib.import_module(source, self.__name__), name)
+        elif name in self.__dict__.get("_export_submodules", []):
+            value = importlib.import_module("." + name, self.__name__)
+        else:
+            raise AttributeError(f"module {self.__name__!r} has no attribute {name!r}")
+        self.__dict__[name] = value  # cache, so later accesses do not go through __getattr__
+        return value
+
+    @override
+    def __dir__(self) -> List[str]:
+        return sorted(set(self.__dict__.keys()) | set(self._export_index.keys()) | set(self._export_submodules))
+
+    @override
+    def __setattr__(self, name: str, value: Any) -> None:
+        """Importing a submodule binds it as an attribute of the package, which must not shadow an export of the
+        same name (like the BoardTop class, exported from the edg.BoardTop submodule) that has yet to be loaded.
+        Only that binding by the import system is skipped, all other assignments are set as usual."""
+        source = self.__dict__.get("_export_index", {}).get(name)
+        if source is not None and source != "." and isinstance(value, ModuleType):
+            if value.__name__ == f"{self.__name__}.{name}":
+                return
+        super().__setattr__(name, value)
+
+
+def _star_exports(module: ModuleType) -> Dict[str, Any]:
+    """Returns the names and values that `from module import *` would import, excluding modules of the library.
+    Those are only bound as attributes of their parent package once some other code imports them, so eager star
+    imports exported them inconsistently depending on import order."""
+    names = getattr(module, "__all__", None)
+    if names is None:
+        names = [name for name in vars(module).keys() if not name.startswith("_")]
+    library_prefix = module.__name__.split(".")[0] + "."
+    exports = {}
+    for name in names:
+        value = getattr(module, name)
+        if not (isinstance(value, ModuleType) and value.__name__.startswith(library_prefix)):
+            exports[name] = value
+    return exports
+
+
+def build_export_index(package: str, sources: ExportSources) -> Dict[str, str]:
+    """Imports all the export sources of a package and returns its lazy export index, mapping each exported name to
+    the module (relative to the package) it is loaded from. The value of each name is the same as with eager imports
+    of the sources in order, but is loaded from the first source that exports that value, to import as little as
+    possible."""
+    exports: List[Tuple[str, Dict[str, Any]]] = []
+    for source, names in sources:
+        if source == ".":
+            assert names is not None, "star exports of the package itself are not supported"
+            exports.append((source, {name: importlib.import_module("." + name, package) for name in names}))
+            continue
+        module = importlib.import_module(source, package)
+        if names is None:
+            exports.append((source, _star_exports(module)))
+        else:
+            exports.append((source, {name: getattr(module, name) for name in names}))
+
+    values: Dict[str, Any] = {}  # final value of each name, as with eager imports
+    for _, source_exports in exports:
+        values.update(source_exports)
+
+    index: Dict[str, str] = {}
+    for name, value in values.items():
+        for source, source_exports in exports:
+            if name in source_exports and source_exports[name] is value:
+                index[name] = source
+                break
+    return index
+
+
+def export_submodules(sources: ExportSources) -> List[str]:
+    """Returns the submodules of a package that eager imports of its sources also make visible as attributes"""
+    return sorted(set(source.split(".")[1] for source, _ in sources if source != "." and not source.startswith("..")))
+
+
+def write_export_index(package: str) -> None:
+    """Regenerates the export index file of an (imported) lazy package from its _export_sources,
+    and updates the package to use the new index."""
+    module = sys.modules[package]
+    sources: ExportSources = module.__dict__["_export_sources"]
+    index = build_export_index(package, sources)
+    submodules = export_submodules(sources)
+    assert module.__file__ is not None
+    with open(os.path.join(os.path.dirname(module.__file__), "ExportIndex.py"), "w") as f:
+        f.write("# Generated by `python -m edg.tools.export_index`, regenerate after changing the exports.\n")
+        f.write("# Maps each name exported by the package to the module (relative to the package) it is loaded from.\n")
+        f.write("kExportIndex = {\n")
+        for name in sorted(index.keys()):
+            f.write(f"    {json.dumps(name)}: {json.dumps(index[name])},\n")
+        f.write("}\n")
+        f.write("\n")
+        f.write("# Submodules that are also visible as attributes with eager imports\n")
+        f.write("kSubmodules = [\n")
+        for submodule in submodules:
+            f.write(f"    {json.dumps(submodule)},\n")
+        f.write("]\n")
+    LazyExportsModule.install(package, index, submodules)
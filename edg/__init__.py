@@ -1,15 +1,49 @@
-# Some common operations are directly exported
-from .BoardTop import BoardTop, SimpleBoardTop, JlcBoardTop
-
-from .BoardCompiler import compile_board, compile_board_inplace
-
-# For backwards compatibility, this re-exports internal packages and parts libraries to allow `from edg import *`.
-# This may go away in the future.
-from .core import *
-from .electronics_model import *
-from .electronics_interfaces import *
-from .abstract_parts import *
-from .vendor_parts import *
-from .vendor_parts.jlc import *
-from .circuits import *
-from .parts import *
+from typing import TYPE_CHECKING
+
+from .LazyExports import ExportSources, LazyExportsModule
+from .ExportIndex import kExportIndex, kSubmodules
+
+# Some common operations are directly exported, and for backwards compatibility, this re-exports internal packages
+# and parts libraries to allow `from edg import *`. This may go away in the future.
+# Exports are loaded on first use through the generated ExportIndex, regenerate it after changing these.
+_export_sources: ExportSources = [
+    (".BoardTop", ["BoardTop", "SimpleBoardTop", "JlcBoardTop"]),
+    (".BoardCompiler", ["compile_board", "compile_board_inplace"]),
+    (".core", None),
+    (".electronics_model", None),
+    (".electronics_interfaces", None),
+    (".abstract_parts", None),
+    (".vendor_parts", None),
+    (".vendor_parts.jlc", None),
+    (".circuits", None),
+    (".parts", None),
+    # Packages and modules that are commonly used directly
+    (".", ["edgir", "edgrpc", "util"]),
+    (
+        ".",
+        ["core", "electronics_model", "electronics_interfaces", "abstract_parts", "vendor_parts", "circuits", "parts"],
+    ),
+    (".core", ["TransformUtil"]),
+    (".vendor_parts", ["jlc", "jlcparts"]),
+]
+
+if TYPE_CHECKING:  # static checkers see the equivalent eager imports
+    from .BoardTop import BoardTop, SimpleBoardTop, JlcBoardTop
+
+    from .BoardCompiler import compile_board, compile_board_inplace
+
+    from .core import *
+    from .electronics_model import *
+    from .electronics_interfaces import *
+    from .abstract_parts import *
+    from .vendor_parts import *
+    from .vendor_parts.jlc import *
+    from .circuits import *
+    from .parts import *
+
+    from . import edgir, edgrpc, util
+    from . import core, electronics_model, electronics_interfaces, abstract_parts, vendor_parts, circuits, parts
+    from .core import TransformUtil
+    from .vendor_parts import jlc, jlcparts
+
+LazyExportsModule.install(__name__, kExportIndex, kSubmodules)
@@ -218,8 +218,7 @@ class TableCapacitor(PartsTableSelector, Capacitor):
         self.assign(self.actual_voltage_rating, row[self.VOLTAGE_RATING])
         self.assign(self.actual_capacitance, row[self.CAPACITANCE])
 
-    @override
-    def _row_filter(self, row: PartsTableRow) -> bool:
+    def _derated_voltage(self) -> Range:
         if not math.isnan(self.get(self.voltage_rating_derating)):
             derated_voltage = self.get(self.voltage) / self.get(self.voltage_rating_derating)
             warnings.warn(
@@ -230,10 +229,18 @@ class TableCapacitor(PartsTableSelector, Capacitor):
             assert self.get(self.voltage_margin) == 2.0, "cannot use both voltage_rating_derating and voltage_margin"
         else:
             derated_voltage = self.get(self.voltage) * self.get(self.voltage_margin)
+        return derated_voltage
+
+    @override
+    def _table_prefilter(self, table: PartsTable) -> PartsTable:
+        table = super()._table_prefilter(table)
+        return table.filter_indices(table.select_range_contains(self.VOLTAGE_RATING, self._derated_voltage()))
 
+    @override
+    def _row_filter(self, row: PartsTableRow) -> bool:
         return (
             super()._row_filter(row)
-            and derated_voltage.fuzzy_in(row[self.VOLTAGE_RATING])
+            and self._derated_voltage().fuzzy_in(row[self.VOLTAGE_RATING])
             and self._row_filter_capacitance(row)
         )
 
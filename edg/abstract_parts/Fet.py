@@ -209,6 +209,16 @@ class TableFet(PartsTableSelector, BaseTableFet):
             self.channel,
         )
 
+    @override
+    def _table_prefilter(self, table: PartsTable) -> PartsTable:
+        table = super()._table_prefilter(table)
+        drain_voltage = self.get(self.drain_voltage) * self.get(self.drain_voltage_margin)
+        indices = table.select_equals(self.CHANNEL, self.get(self.channel))
+        indices = table.select_range_contains(self.VDS_RATING, drain_voltage, indices)
+        indices = table.select_range_contains(self.IDS_RATING, self.get(self.drain_current), indices)
+        indices = table.select_range_contains(self.POWER_RATING, self.get(self.power), indices)
+        return table.filter_indices(indices)
+
     @override
     def _row_filter(self, row: PartsTableRow) -> bool:
         return (
@@ -2,7 +2,7 @@ from typing import Any, Dict, Optional
 from typing_extensions import override
 
 from ..electronics_interfaces import *
-from .PartsTable import PartsTableColumn, PartsTableRow, ExperimentalUserFnPartsTable
+from .PartsTable import PartsTable, PartsTableColumn, PartsTableRow, ExperimentalUserFnPartsTable
 from .PartsTablePart import PartsTableSelector
 from .StandardFootprint import StandardFootprint, HasStandardFootprint
 
@@ -151,6 +151,15 @@ class TableInductor(PartsTableSelector, Inductor):
             self.inductance, self.current, self.frequency, self.resistance_dc, self.experimental_filter_fn
         )
 
+    @override
+    def _table_prefilter(self, table: PartsTable) -> PartsTable:
+        table = super()._table_prefilter(table)
+        indices = table.select_range_in(self.INDUCTANCE, self.get(self.inductance))
+        indices = table.select_range_contains(self.CURRENT_RATING, self.get(self.current), indices)
+        indices = table.select_range_in(self.DC_RESISTANCE, self.get(self.resistance_dc), indices)
+        indices = table.select_range_contains(self.FREQUENCY_RATING, self.get(self.frequency), indices)
+        return table.filter_indices(indices)
+
     @override
     def _row_filter(self, row: PartsTableRow) -> bool:
         filter_fn_str = self.get(self.experimental_filter_fn)
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import bisect
 import csv
 import itertools
+import math
+from array import array
 from typing import (
     Generic,
     Type,
@@ -17,6 +20,9 @@ from typing import (
     Tuple,
     Sequence,
     Protocol,
+    Iterable,
+    Iterator,
+    Set,
 )
 
 from typing_extensions import ParamSpec, TypeVar, override
@@ -69,13 +75,115 @@ class PartsTableRow:
             raise TypeError()
 
 
+class PartsTableColumnarRows(Sequence[PartsTableRow]):
+    """Rows of a parts table stored as columns (such as views of a memory-mapped snapshot), where each row is
+    created on access. This keeps only the rows in use in memory, at the cost of re-creating rows on each access.
+    Columns may be any sequences indexed by row, and can be read directly (without creating rows) by
+    PartsTable.column."""
+
+    def __init__(
+        self,
+        num_rows: int,
+        keys: List[Any],
+        columns: List[Sequence[Any]],
+        range_bounds: Dict[Any, Tuple[memoryview, memoryview]] = {},
+    ):
+        """range_bounds optionally provides the lower and upper bounds of Range columns (by key) as packed doubles,
+        which PartsTable.range_column uses directly without creating the Range values."""
+        self._num_rows = num_rows
+        self.keys = keys
+        self.columns = columns
+        self.range_bounds = range_bounds
+
+    @override
+    def __len__(self) -> int:
+        return self._num_rows
+
+    @overload
+    def __getitem__(self, index: int) -> PartsTableRow: ...
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[PartsTableRow]: ...
+
+    @override
+    def __getitem__(self, index: Union[int, slice]) -> Union[PartsTableRow, Sequence[PartsTableRow]]:
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._num_rows))]
+        if index < 0:
+            index += self._num_rows
+        if not 0 <= index < self._num_rows:
+            raise IndexError(f"row {index} out of range")
+        return PartsTableRow({key: column[index] for key, column in zip(self.keys, self.columns)})
+
+    @override
+    def __iter__(self) -> Iterator[PartsTableRow]:
+        keys, columns = self.keys, self.columns
+        for i in range(self._num_rows):
+            yield PartsTableRow({key: column[i] for key, column in zip(keys, columns)})
+
+
+class PartsTableRangeIndex:
+    """Sorted-endpoint index over the (lower, upper) bounds of a range column, answering containment queries
+    in time proportional to the log of the table size plus the number of candidate rows examined.
+    Rows are sorted separately by lower and by upper bound, and each query scans only the smaller of the two
+    candidate slices (or the rows from a previous query, if fewer), checking the other bound per row.
+    Rows with NaN bounds are never returned."""
+
+    def __init__(self, lowers: Sequence[float], uppers: Sequence[float]):
+        self.lowers = lowers
+        self.uppers = uppers
+        valid = [i for i in range(len(lowers)) if not math.isnan(lowers[i]) and not math.isnan(uppers[i])]
+        # stored as arrays, which are much more compact than lists for large tables
+        self._by_lower = array("q", sorted(valid, key=lowers.__getitem__))
+        self._sorted_lowers = array("d", [lowers[i] for i in self._by_lower])
+        self._by_upper = array("q", sorted(valid, key=uppers.__getitem__))
+        self._sorted_uppers = array("d", [uppers[i] for i in self._by_upper])
+
+    def within(self, lower: float, upper: float, among: Optional[Set[int]] = None) -> Set[int]:
+        """Returns the indices of rows with lower <= row lower and row upper <= upper.
+        If among is specified, only those rows are considered, checking them directly if that is cheaper."""
+        lowers, uppers = self.lowers, self.uppers
+        lower_start = bisect.bisect_left(self._sorted_lowers, lower)
+        lower_end = bisect.bisect_right(self._sorted_lowers, upper)  # row lower <= row upper <= upper
+        upper_start = bisect.bisect_left(self._sorted_uppers, lower)  # lower <= row lower <= row upper
+        upper_end = bisect.bisect_right(self._sorted_uppers, upper)
+        if among is not None and len(among) <= min(lower_end - lower_start, upper_end - upper_start):
+            return {i for i in among if lower <= lowers[i] and uppers[i] <= upper}
+        elif lower_end - lower_start <= upper_end - upper_start:
+            result = {i for i in self._by_lower[lower_start:lower_end] if uppers[i] <= upper}
+        else:
+            result = {i for i in self._by_upper[upper_start:upper_end] if lowers[i] >= lower}
+        return result if among is None else result & among
+
+    def containing(self, lower: float, upper: float, among: Optional[Set[int]] = None) -> Set[int]:
+        """Returns the indices of rows with row lower <= lower and upper <= row upper.
+        If among is specified, only those rows are considered, checking them directly if that is cheaper."""
+        lowers, uppers = self.lowers, self.uppers
+        lower_end = bisect.bisect_right(self._sorted_lowers, lower)
+        upper_start = bisect.bisect_left(self._sorted_uppers, upper)
+        if among is not None and len(among) <= min(lower_end, len(self._sorted_uppers) - upper_start):
+            return {i for i in among if lowers[i] <= lower and upper <= uppers[i]}
+        elif lower_end <= len(self._sorted_uppers) - upper_start:
+            result = {i for i in self._by_lower[:lower_end] if uppers[i] >= upper}
+        else:
+            result = {i for i in self._by_upper[upper_start:] if lowers[i] <= lower}
+        return result if among is None else result & among
+
+
 class PartsTable:
     """A parts table, with data that can be loaded from a CSV, and providing functions for
     filtering and transformation.
     Immutable, all data is copied as needed (see functions for depth of copy).
 
-    Optimization TODO: could probably significantly (~2x) improve performance using not-dicts
-    https://www.districtdatalabs.com/simple-csv-data-wrangling-with-python
+    In addition to the row-based API, this provides column views of the data (see column and range_column),
+    which are built on first use and cached with the table. The scan_* functions check every value of a column view
+    in a Python loop, returning a mask (list of bools) of matching rows. This is not vectorized, it only avoids
+    the per-row dict lookups and Range allocations of row-based filtering. Masks can be combined with mask_and and
+    applied with filter_mask. Column views are most useful on long-lived tables (like the cached full parts table),
+    where they are built once and reused across many queries.
+
+    The select_* functions instead use indices over a column (also built on first use and cached), returning
+    the set of matching row indices without examining every row. Results can be combined with set operations,
+    or for range columns chained through the among argument (most selective first), and applied with filter_indices.
     """
 
     @staticmethod
@@ -117,9 +225,16 @@ class PartsTable:
     def __len__(self) -> int:
         return len(self.rows)
 
-    def __init__(self, rows: List[PartsTableRow]):
-        """Internal function, just creates a new PartsTable wrapping the rows, without any checking."""
+    def __init__(self, rows: Sequence[PartsTableRow]):
+        """Internal function, just creates a new PartsTable wrapping the rows (typically a list, or
+        PartsTableColumnarRows), without any checking."""
         self.rows = rows
+        self._columns: Dict[Any, List[Any]] = {}  # lazily built columnar views, valid since the table is immutable
+        self._range_columns: Dict[Any, Tuple[array[float], array[float]]] = {}
+        self._fuzzy_range_columns: Dict[Any, Tuple[array[float], array[float]]] = {}
+        self._range_indices: Dict[Any, PartsTableRangeIndex] = {}
+        self._fuzzy_range_indices: Dict[Any, PartsTableRangeIndex] = {}
+        self._value_indices: Dict[Any, Dict[Any, List[int]]] = {}
 
     def filter(self, fn: Callable[[PartsTableRow], bool]) -> PartsTable:
         """Creates a new table view (shallow copy) with rows filtered according to some criteria."""
@@ -181,6 +296,139 @@ class PartsTable:
         new_rows = sorted(self.rows, key=fn, reverse=reverse)
         return PartsTable(new_rows)
 
+    def column(self, column: Union[str, PartsTableColumn[PartsTableColumnType]]) -> Sequence[PartsTableColumnType]:
+        """Returns the values of a column, in row order. Built on first use and cached."""
+        values = self._columns.get(column)
+        if values is None:
+            if isinstance(self.rows, PartsTableColumnarRows):  # read columns directly, without creating rows
+                if column not in self.rows.keys:
+                    raise KeyError(column)
+                values = list(self.rows.columns[self.rows.keys.index(column)])
+            else:
+                values = [row.values[column] for row in self.rows]
+            self._columns[column] = values
+        return values
+
+    def range_column(self, column: PartsTableColumn[Range]) -> Tuple[array[float], array[float]]:
+        """Returns the lower and upper bounds of a Range column as float arrays, in row order.
+        Built on first use and cached."""
+        bounds = self._range_columns.get(column)
+        if bounds is None:
+            if isinstance(self.rows, PartsTableColumnarRows) and column in self.rows.range_bounds:
+                lowers, uppers = array("d"), array("d")
+                packed_lowers, packed_uppers = self.rows.range_bounds[column]
+                lowers.frombytes(packed_lowers)
+                uppers.frombytes(packed_uppers)
+                bounds = self._range_columns[column] = (lowers, uppers)
+            else:
+                values = self.column(column)
+                bounds = self._range_columns[column] = (
+                    array("d", [value.lower for value in values]),
+                    array("d", [value.upper for value in values]),
+                )
+        return bounds
+
+    @staticmethod
+    def _fuzzy_bounds(container: Range) -> Tuple[float, float]:
+        """Returns the bounds of the container, expanded by Range.fuzzy_in's rounding factor."""
+        factor = Range.DOUBLE_FLOAT_ROUND_FACTOR
+        return (
+            container.lower * (1 - factor) if container.lower >= 0 else container.lower * (1 + factor),
+            container.upper * (1 + factor) if container.upper >= 0 else container.upper * (1 - factor),
+        )
+
+    def _fuzzy_range_column(self, column: PartsTableColumn[Range]) -> Tuple[array[float], array[float]]:
+        """Returns the lower and upper bounds of a Range column, expanded by Range.fuzzy_in's rounding factor."""
+        bounds = self._fuzzy_range_columns.get(column)
+        if bounds is None:
+            factor = Range.DOUBLE_FLOAT_ROUND_FACTOR
+            lowers, uppers = self.range_column(column)
+            bounds = self._fuzzy_range_columns[column] = (
+                array("d", [lower * (1 - factor) if lower >= 0 else lower * (1 + factor) for lower in lowers]),
+                array("d", [upper * (1 + factor) if upper >= 0 else upper * (1 - factor) for upper in uppers]),
+            )
+        return bounds
+
+    def scan_range_in(self, column: PartsTableColumn[Range], container: Range) -> List[bool]:
+        """Returns a mask of rows where the column value is (fuzzy) within the container,
+        equivalent to row[column].fuzzy_in(container)."""
+        container_lower, container_upper = self._fuzzy_bounds(container)
+        lowers, uppers = self.range_column(column)
+        return [container_lower <= lower and upper <= container_upper for lower, upper in zip(lowers, uppers)]
+
+    def scan_range_contains(self, column: PartsTableColumn[Range], item: Range) -> List[bool]:
+        """Returns a mask of rows where the column value (fuzzy) contains the item,
+        equivalent to item.fuzzy_in(row[column])."""
+        item_lower, item_upper = item.lower, item.upper
+        lowers, uppers = self._fuzzy_range_column(column)
+        return [lower <= item_lower and item_upper <= upper for lower, upper in zip(lowers, uppers)]
+
+    def scan_equals(self, column: Union[str, PartsTableColumn[Any]], value: Any) -> List[bool]:
+        """Returns a mask of rows where the column value equals the value."""
+        return [row_value == value for row_value in self.column(column)]
+
+    def scan_in(self, column: Union[str, PartsTableColumn[Any]], values: Iterable[Any]) -> List[bool]:
+        """Returns a mask of rows where the column value is one of the values."""
+        values_set = set(values)
+        return [row_value in values_set for row_value in self.column(column)]
+
+    @staticmethod
+    def mask_and(*masks: Sequence[bool]) -> List[bool]:
+        """Returns the element-wise and of masks (eg, from scan_* functions)."""
+        return [all(mask_values) for mask_values in zip(*masks)]
+
+    def filter_mask(self, mask: Sequence[bool]) -> PartsTable:
+        """Creates a new table view (shallow copy) with the rows where the mask is True."""
+        assert len(mask) == len(self.rows), f"mask length {len(mask)} does not match table length {len(self.rows)}"
+        return PartsTable(list(itertools.compress(self.rows, mask)))
+
+    def select_range_in(
+        self, column: PartsTableColumn[Range], container: Range, among: Optional[Set[int]] = None
+    ) -> Set[int]:
+        """Returns the indices of rows where the column value is (fuzzy) within the container,
+        equivalent to row[column].fuzzy_in(container).
+        If among is specified (for example, from a previous select), returns only indices in among;
+        this is faster than an intersection when among is small."""
+        index = self._range_indices.get(column)
+        if index is None:
+            index = self._range_indices[column] = PartsTableRangeIndex(*self.range_column(column))
+        return index.within(*self._fuzzy_bounds(container), among)
+
+    def select_range_contains(
+        self, column: PartsTableColumn[Range], item: Range, among: Optional[Set[int]] = None
+    ) -> Set[int]:
+        """Returns the indices of rows where the column value (fuzzy) contains the item,
+        equivalent to item.fuzzy_in(row[column]).
+        If among is specified, returns only indices in among, as in select_range_in."""
+        index = self._fuzzy_range_indices.get(column)
+        if index is None:
+            index = self._fuzzy_range_indices[column] = PartsTableRangeIndex(*self._fuzzy_range_column(column))
+        return index.containing(item.lower, item.upper, among)
+
+    def select_equals(self, column: Union[str, PartsTableColumn[Any]], value: Any) -> Set[int]:
+        """Returns the indices of rows where the column value equals the value. Column values must be hashable."""
+        index = self._value_indices.get(column)
+        if index is None:
+            index = self._value_indices[column] = {}
+            for i, row_value in enumerate(self.column(column)):
+                index.setdefault(row_value, []).append(i)
+        return set(index.get(value, []))
+
+    def select_in(self, column: Union[str, PartsTableColumn[Any]], values: Iterable[Any]) -> Set[int]:
+        """Returns the indices of rows where the column value is one of the values."""
+        return set().union(*[self.select_equals(column, value) for value in values])
+
+    def filter_indices(self, indices: Iterable[int]) -> PartsTable:
+        """Creates a new table view (shallow copy) with the rows at the indices, in table order."""
+        return PartsTable([self.rows[i] for i in sorted(indices)])
+
+    def sort_by_keys(self, keys: Sequence[Any], reverse: bool = False) -> PartsTable:
+        """Creates a new table view (shallow copy) with rows sorted by precomputed per-row keys,
+        for example built from columns."""
+        assert len(keys) == len(self.rows), f"keys length {len(keys)} does not match table length {len(self.rows)}"
+        order = sorted(range(len(self.rows)), key=keys.__getitem__, reverse=reverse)
+        return PartsTable([self.rows[i] for i in order])
+
     def first(self, err: str = "no elements in list") -> PartsTableRow:
         if not self.rows:
             raise IndexError(err)
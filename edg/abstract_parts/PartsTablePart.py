@@ -1,11 +1,12 @@
 import warnings
 from abc import abstractmethod
-from typing import Optional, Union, Any
+from typing import Optional, Union, Any, List, Tuple
 
 from typing_extensions import override
 
 from ..electronics_model import *
 from .PartsTable import PartsTable, PartsTableColumn, PartsTableRow
+from .PartsTableSnapshot import PartsTableSnapshot
 from .StandardFootprint import HasStandardFootprint
 
 
@@ -28,10 +29,36 @@ class PartsTableBase:
         """Returns a parts table for this device. Implement me."""
         ...
 
+    @classmethod
+    def _table_sources(cls) -> Optional[List[str]]:
+        """Returns the data files the table is built from, which allows the parsed table to be saved as a persistent
+        snapshot (see PartsTableSnapshot) when enabled. Returns None if the table should not be snapshotted."""
+        return None
+
+    @classmethod
+    def _table_params(cls) -> Tuple[Any, ...]:
+        """Returns any configuration the table contents depend on, other than its source files and code.
+        Used to invalidate snapshots."""
+        return ()
+
     @classmethod
     def _get_table(cls) -> PartsTable:
         if cls._TABLE is None:
-            cls._TABLE = cls._make_table()
+            snapshot = PartsTableSnapshot.from_env()
+            sources = cls._table_sources() if snapshot is not None else None
+            table = None
+            if snapshot is not None and sources is not None:
+                table = snapshot.load(cls, sources, cls._table_params())
+                if table is None:
+                    with snapshot.lock(cls):  # so concurrent processes only build the table once
+                        table = snapshot.load(cls, sources, cls._table_params())  # if built while waiting
+                        if table is None:
+                            table = cls._make_table()
+                            if snapshot.save(cls, table, sources, cls._table_params()) and snapshot.shared:
+                                table = snapshot.load(cls, sources, cls._table_params()) or table
+            else:
+                table = cls._make_table()
+            cls._TABLE = table
             if len(cls._TABLE) == 0:
                 raise ValueError(f"{cls.__name__} _make_table returned empty table")
         return cls._TABLE
@@ -69,6 +96,17 @@ class PartsTableSelector(PartsTablePart, GeneratorBlock, PartsTableBase):
             (not excluded_parts) or (row[self.PART_NUMBER_COL] not in excluded_parts)
         )
 
+    def _table_prefilter(self, table: PartsTable) -> PartsTable:
+        """Optional coarse filtering step on the full table, run before _row_filter, using the indexed (select_*)
+        or column scan (scan_*) operations of PartsTable. This must only remove rows that _row_filter would also
+        reject, _row_filter is still run on the remaining rows.
+        Only called within generate(), so has access to GeneratorParam.get().
+        Subclasses should chain by filtering the results of a super() call."""
+        part = self.get(self.part)
+        if part:
+            table = table.filter_indices(table.select_equals(self.PART_NUMBER_COL, part))
+        return table
+
     def _table_postprocess(self, table: PartsTable) -> PartsTable:
         """Optional postprocessing step that takes a table and returns a transformed table.
         Only called within generate(), so has access to GeneratorParam.get().
@@ -90,7 +128,8 @@ class PartsTableSelector(PartsTablePart, GeneratorBlock, PartsTableBase):
     def generate(self) -> None:
         super().generate()
 
-        matching_table = self._get_table().filter(lambda row: self._row_filter(row))
+        prefiltered_table = self._table_prefilter(self._get_table())
+        matching_table = prefiltered_table.filter(lambda row: self._row_filter(row))
         postprocessed_table = self._table_postprocess(matching_table)
         postprocessed_table = postprocessed_table.sort_by(self._row_sort_by)
         self.assign(self.matching_parts, postprocessed_table.map(lambda row: row[self.PART_NUMBER_COL]))
@@ -129,11 +168,25 @@ class PartsTableFootprintFilter(PartsTableSelector, SelectorFootprint):
         if self.get(self.footprint_spec):
             warnings.warn(f"footprint_spec replaced with filter_footprints taking an array", DeprecationWarning)
 
-    @override
-    def _row_filter(self, row: PartsTableRow) -> bool:
-        filter_footprints = self.get(self.filter_footprints)
+    def _filter_footprints(self) -> List[str]:
+        """Returns the footprints to filter on, including the deprecated footprint_spec. This builds a new list,
+        since values from self.get may be shared and must not be modified."""
+        filter_footprints = list(self.get(self.filter_footprints))
         if self.get(self.footprint_spec):
             filter_footprints.append(self.get(self.footprint_spec))
+        return filter_footprints
+
+    @override
+    def _table_prefilter(self, table: PartsTable) -> PartsTable:
+        table = super()._table_prefilter(table)
+        filter_footprints = self._filter_footprints()
+        if filter_footprints:
+            table = table.filter_indices(table.select_in(self.KICAD_FOOTPRINT, filter_footprints))
+        return table
+
+    @override
+    def _row_filter(self, row: PartsTableRow) -> bool:
+        filter_footprints = self._filter_footprints()
         return super()._row_filter(row) and ((not filter_footprints or row[self.KICAD_FOOTPRINT] in filter_footprints))
 
 
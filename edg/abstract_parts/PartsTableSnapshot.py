@@ -0,0 +1,345 @@
+import gc
+import hashlib
+import marshal
+import mmap
+import os
+import struct
+import time
+from array import array
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Tuple, Sequence, Union, Iterator, overload, cast
+
+from typing_extensions import override
+
+from ..core import Range
+from ..util.CacheUtil import SourceHasher, atomic_write, cache_dir_from_env, files_stat_hash
+from .PartsTable import PartsTable, PartsTableColumn, PartsTableRow, PartsTableColumnarRows
+
+
+class _SnapshotColumn(Sequence[Any]):
+    """Column of a shared snapshot table, decoding values from the memory map on access."""
+
+    def __init__(self, num_rows: int) -> None:
+        self._num_rows = num_rows
+
+    def _get(self, index: int) -> Any:
+        raise NotImplementedError()
+
+    @override
+    def __len__(self) -> int:
+        return self._num_rows
+
+    @overload
+    def __getitem__(self, index: int) -> Any: ...
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[Any]: ...
+
+    @override
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self._get(i) for i in range(*index.indices(self._num_rows))]
+        if index < 0:
+            index += self._num_rows
+        if not 0 <= index < self._num_rows:
+            raise IndexError(f"row {index} out of range")
+        return self._get(index)
+
+    @override
+    def __iter__(self) -> Iterator[Any]:
+        return map(self._get, range(self._num_rows))
+
+
+class _RangeSnapshotColumn(_SnapshotColumn):
+    def __init__(self, lowers: Sequence[float], uppers: Sequence[float]) -> None:
+        super().__init__(len(lowers))
+        self._lowers = lowers
+        self._uppers = uppers
+
+    @override
+    def _get(self, index: int) -> Range:
+        return Range(self._lowers[index], self._uppers[index])
+
+
+class _StrSnapshotColumn(_SnapshotColumn):
+    def __init__(self, offsets: Sequence[int], blob: memoryview) -> None:
+        super().__init__(len(offsets) - 1)
+        self._offsets = offsets
+        self._blob = blob
+
+    @override
+    def _get(self, index: int) -> str:
+        return str(self._blob[self._offsets[index] : self._offsets[index + 1]], "utf-8")
+
+
+class _MarshalSnapshotColumn(_SnapshotColumn):
+    """Column of arbitrary (marshalled) values, which are decoded together on first access."""
+
+    def __init__(self, num_rows: int, blob: memoryview) -> None:
+        super().__init__(num_rows)
+        self._blob: Optional[memoryview] = blob
+        self._values: List[Any] = []
+
+    @override
+    def _get(self, index: int) -> Any:
+        if self._blob is not None:
+            self._values = marshal.loads(self._blob)
+            self._blob = None
+        return self._values[index]
+
+
+class PartsTableSnapshot:
+    """Persistent on-disk snapshots of fully parsed parts tables, so tables built from large data files
+    (and the per-row parsing on top of them) are only built once, instead of in every process.
+
+    A snapshot is stored per table class, in a columnar binary format: Range and float columns are stored as
+    raw double arrays which are read directly from a memory map, and other columns are stored as marshalled lists.
+    Columns are identified by their header string, or for PartsTableColumn, by the attribute name on the table class.
+
+    Snapshots are keyed by the table's data source files (by path, size and modification time), the table's config
+    parameters, and the source of the modules defining the table class, its superclasses, and the table
+    infrastructure. Helper modules used in parsing are NOT part of the key, so the snapshot directory should
+    be cleared when those change.
+
+    By default, loading decodes every row into Range and dict objects, which for large tables is most of the load
+    time (on the order of 80ms per 20k rows), though still much faster than parsing the source files.
+    If shared, loaded tables instead stay attached to the memory-mapped snapshot, with rows created
+    on access (see PartsTableColumnarRows). Processes using the same snapshot (like parallel test workers) then
+    share its data through the OS page cache, and only hold the rows they use.
+    Snapshots that cannot be read or decoded (eg, truncated or corrupt files) are treated as missing.
+    Building a snapshot is guarded by a lock file, so concurrent processes wait for one to build it."""
+
+    kFileSuffix = ".ptable"
+    kMagic = b"EDGPTBL2"  # bump the version on format changes
+    kHeaderLength = struct.Struct("<I")
+    kLockPollInterval = 0.1  # seconds
+    kLockTimeout = 600  # seconds, after which a lock is assumed to be left by a crashed process
+    # errors from reading or decoding a missing, truncated or corrupt snapshot, which are treated as a miss
+    kLoadErrors = (OSError, ValueError, EOFError, struct.error, KeyError, TypeError, IndexError)
+
+    @staticmethod
+    def from_env() -> Optional["PartsTableSnapshot"]:
+        """Returns a snapshot store if enabled by the EDG_PARTS_TABLE_CACHE_DIR environment variable,
+        otherwise None. Tables are shared if the EDG_PARTS_TABLE_SHARED environment variable is set to 1."""
+        cache_dir = cache_dir_from_env("EDG_PARTS_TABLE_CACHE_DIR")
+        if cache_dir is None:
+            return None
+        return PartsTableSnapshot(cache_dir, shared=os.environ.get("EDG_PARTS_TABLE_SHARED") == "1")
+
+    def __init__(self, cache_dir: str, shared: bool = False) -> None:
+        self.cache_dir = cache_dir
+        self.shared = shared
+        os.makedirs(cache_dir, exist_ok=True)
+        self._sources = SourceHasher()
+
+    def _key(self, cls: type, sources: List[str], params: Tuple[Any, ...]) -> str:
+        hasher = hashlib.sha256()
+        hasher.update(f"{cls.__module__}.{cls.__qualname__}".encode("utf-8"))
+        hasher.update(files_stat_hash(sources).encode("utf-8"))
+        hasher.update(repr(params).encode("utf-8"))
+        module_names = [mro.__module__ for mro in cls.__mro__] + [PartsTable.__module__, __name__]
+        hasher.update(self._sources.modules_hash(module_names).encode("utf-8"))
+        return hasher.hexdigest()
+
+    def _path(self, cls: type) -> str:
+        return os.path.join(self.cache_dir, f"{cls.__module__}.{cls.__qualname__}{self.kFileSuffix}")
+
+    @staticmethod
+    def _column_names(cls: type) -> Dict[PartsTableColumn[Any], str]:
+        """Returns the attribute name of each PartsTableColumn defined on the class, for the nearest definition."""
+        names: Dict[PartsTableColumn[Any], str] = {}
+        for mro in reversed(cls.__mro__):
+            for name, value in vars(mro).items():
+                if isinstance(value, PartsTableColumn):
+                    names[value] = name
+        return names
+
+    @contextmanager
+    def lock(self, cls: type) -> Iterator[None]:
+        """Holds the build lock for the class's snapshot, waiting for other processes to release it."""
+        lock_path = self._path(cls) + ".lock"
+        while True:
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - os.stat(lock_path).st_mtime > self.kLockTimeout:
+                        os.remove(lock_path)  # stale, clear and retry
+                        continue
+                except FileNotFoundError:  # released in the meantime
+                    continue
+                time.sleep(self.kLockPollInterval)
+        try:
+            yield
+        finally:
+            os.close(fd)
+            try:
+                os.remove(lock_path)
+            except FileNotFoundError:
+                pass
+
+    def load(self, cls: type, sources: List[str], params: Tuple[Any, ...] = ()) -> Optional[PartsTable]:
+        """Returns the snapshot table for the class, or None if it does not exist or is out of date."""
+        path = self._path(cls)
+        if self.shared:
+            key = self._key(cls, sources, params)
+            try:
+                with open(path, "rb") as f:
+                    data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)  # kept open by the table
+                return self._attach(cls, data, key)
+            except self.kLoadErrors:
+                return None
+        gc_enabled = gc.isenabled()
+        gc.disable()  # decoding allocates many objects without cycles, avoid repeated collections
+        try:
+            with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                return self._decode(cls, data, self._key(cls, sources, params))
+        except self.kLoadErrors:  # ValueError includes empty files, which cannot be mmapped
+            return None
+        finally:
+            if gc_enabled:
+                gc.enable()
+
+    def _columns(
+        self, cls: type, data: mmap.mmap, key: str
+    ) -> Optional[Tuple[int, List[Tuple[Any, str, List[Tuple[int, int]]]]]]:
+        """Parses the snapshot header, returning the number of rows and for each column, its key, encoding, and
+        the (start, end) positions of its blobs. Returns None if the snapshot is invalid or out of date."""
+        if data[: len(self.kMagic)] != self.kMagic:
+            return None
+        pos = len(self.kMagic)
+        (header_len,) = self.kHeaderLength.unpack_from(data, pos)
+        pos += self.kHeaderLength.size
+        header = marshal.loads(data[pos : pos + header_len])
+        pos += header_len
+        if header["key"] != key:
+            return None
+
+        columns: List[Tuple[Any, str, List[Tuple[int, int]]]] = []
+        for name, is_column, encoding, lengths in header["columns"]:
+            if is_column:
+                column_key = getattr(cls, name, None)
+                if not isinstance(column_key, PartsTableColumn):
+                    return None
+            else:
+                column_key = name
+            blob_ranges = []
+            for length in lengths:
+                blob_ranges.append((pos, pos + length))
+                pos += length
+            columns.append((column_key, encoding, blob_ranges))
+        return header["rows"], columns
+
+    def _decode(self, cls: type, data: mmap.mmap, key: str) -> Optional[PartsTable]:
+        header = self._columns(cls, data, key)
+        if header is None:
+            return None
+        num_rows, columns = header
+
+        column_keys: List[Any] = []
+        column_values: List[List[Any]] = []
+        for column_key, encoding, blob_ranges in columns:
+            blobs = [data[start:end] for start, end in blob_ranges]
+            if encoding == "range":
+                lowers, uppers = array("d", blobs[0]), array("d", blobs[1])
+                values: List[Any] = [Range(lower, upper) for lower, upper in zip(lowers, uppers)]
+            elif encoding == "float":
+                values = array("d", blobs[0]).tolist()
+            elif encoding == "str":
+                offsets, blob = array("q", blobs[0]), blobs[1]
+                values = [str(blob[offsets[i] : offsets[i + 1]], "utf-8") for i in range(num_rows)]
+            else:
+                values = marshal.loads(blobs[0])
+            if len(values) != num_rows:  # corrupt snapshot
+                return None
+            column_keys.append(column_key)
+            column_values.append(values)
+
+        return PartsTable([PartsTableRow(dict(zip(column_keys, row))) for row in zip(*column_values)])
+
+    def _attach(self, cls: type, data: mmap.mmap, key: str) -> Optional[PartsTable]:
+        """Like _decode, but returns a table with rows decoded on access from the memory map."""
+        header = self._columns(cls, data, key)
+        if header is None:
+            return None
+        num_rows, columns = header
+
+        view = memoryview(data)
+        column_keys: List[Any] = []
+        column_values: List[Sequence[Any]] = []
+        range_bounds: Dict[Any, Tuple[memoryview, memoryview]] = {}
+        for column_key, encoding, blob_ranges in columns:
+            blobs = [view[start:end] for start, end in blob_ranges]
+            if encoding == "range":
+                values: Sequence[Any] = _RangeSnapshotColumn(blobs[0].cast("d"), blobs[1].cast("d"))
+                range_bounds[column_key] = (blobs[0], blobs[1])
+            elif encoding == "float":
+                values = cast(Sequence[float], blobs[0].cast("d"))
+            elif encoding == "str":
+                values = _StrSnapshotColumn(blobs[0].cast("q"), blobs[1])
+            else:
+                values = _MarshalSnapshotColumn(num_rows, blobs[0])
+            if len(values) != num_rows:  # corrupt snapshot
+                return None
+            column_keys.append(column_key)
+            column_values.append(values)
+
+        return PartsTable(PartsTableColumnarRows(num_rows, column_keys, column_values, range_bounds))
+
+    def save(self, cls: type, table: PartsTable, sources: List[str], params: Tuple[Any, ...] = ()) -> bool:
+        """Writes the snapshot for the class. Returns False (and does not write) if the table cannot be
+        represented, for example if it uses columns not defined on the class or values that cannot be marshalled.
+        Rows must have the same columns (as enforced by PartsTable construction)."""
+        column_names = self._column_names(cls)
+        keys = list(table.rows[0].values.keys()) if table.rows else []
+        if not all(row.values.keys() == table.rows[0].values.keys() for row in table.rows):
+            return False
+
+        header_columns = []
+        blobs = []
+        for key in keys:
+            if isinstance(key, PartsTableColumn):
+                name = column_names.get(key)
+                if name is None:
+                    return False
+                header_column: Tuple[str, bool] = (name, True)
+            elif isinstance(key, str):
+                header_column = (key, False)
+            else:
+                return False
+
+            values = [row.values[key] for row in table.rows]
+            if values and all(type(value) is Range for value in values):
+                encoding = "range"
+                column_blobs = [
+                    array("d", [value.lower for value in values]).tobytes(),
+                    array("d", [value.upper for value in values]).tobytes(),
+                ]
+            elif values and all(type(value) is float for value in values):
+                encoding = "float"
+                column_blobs = [array("d", values).tobytes()]
+            elif values and all(type(value) is str for value in values):
+                encoding = "str"  # as offsets into a blob, so individual values can be decoded
+                encoded = [value.encode("utf-8") for value in values]
+                offsets = array("q", [0])
+                for value_bytes in encoded:
+                    offsets.append(offsets[-1] + len(value_bytes))
+                column_blobs = [offsets.tobytes(), b"".join(encoded)]
+            else:
+                encoding = "marshal"
+                try:
+                    column_blobs = [marshal.dumps(values)]
+                except ValueError:  # unmarshallable object
+                    return False
+            header_columns.append((*header_column, encoding, [len(blob) for blob in column_blobs]))
+            blobs.extend(column_blobs)
+
+        header = marshal.dumps({"key": self._key(cls, sources, params), "rows": len(table), "columns": header_columns})
+        path = self._path(cls)
+        with atomic_write(path) as f:
+            f.write(self.kMagic)
+            f.write(self.kHeaderLength.pack(len(header)))
+            f.write(header)
+            for blob in blobs:
+                f.write(blob)
+        return True
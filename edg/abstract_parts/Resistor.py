@@ -4,7 +4,7 @@ from typing_extensions import override
 
 from ..electronics_interfaces import *
 from .ESeriesUtil import ESeriesUtil
-from .PartsTable import PartsTableColumn, PartsTableRow
+from .PartsTable import PartsTable, PartsTableColumn, PartsTableRow
 from .PartsTablePart import PartsTableSelector
 from .StandardFootprint import StandardFootprint, HasStandardFootprint
 
@@ -122,6 +122,14 @@ class TableResistor(PartsTableSelector, Resistor):
         super().__init__(*args, **kwargs)
         self.generator_param(self.resistance, self.power, self.voltage)
 
+    @override
+    def _table_prefilter(self, table: PartsTable) -> PartsTable:
+        table = super()._table_prefilter(table)
+        indices = table.select_range_in(self.RESISTANCE, self.get(self.resistance))
+        indices = table.select_range_contains(self.POWER_RATING, self.get(self.power), indices)
+        indices = table.select_range_contains(self.VOLTAGE_RATING, self.get(self.voltage), indices)
+        return table.filter_indices(indices)
+
     @override
     def _row_filter(self, row: PartsTableRow) -> bool:
         return (
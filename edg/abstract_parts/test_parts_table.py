@@ -1,4 +1,5 @@
 import os
+import random
 import unittest
 
 from .PartsTable import *
@@ -78,6 +79,121 @@ class PartsTableTest(unittest.TestCase):
         self.assertEqual(self.table.first().values, {"header1": "1", "header2": "foo", "header3": "9"})
 
 
+class PartsTableColumnarTest(unittest.TestCase):
+    RANGE_COLUMN = PartsTableColumn(Range)
+    STR_COLUMN = PartsTableColumn(str)
+
+    @override
+    def setUp(self) -> None:
+        self.table = PartsTable.from_dict_rows(
+            [{"value": "1"}, {"value": "2"}, {"value": "3"}, {"value": "4"}]
+        ).map_new_columns(
+            lambda row: {
+                self.RANGE_COLUMN: {
+                    "1": Range(1, 2),
+                    "2": Range(-2, 1e-9),
+                    "3": Range(0.9999999, 10),
+                    "4": Range(-3, -1),
+                }[row["value"]],
+                self.STR_COLUMN: {"1": "a", "2": "b", "3": "a", "4": "c"}[row["value"]],
+            }
+        )
+
+    def test_column(self) -> None:
+        self.assertEqual(self.table.column("value"), ["1", "2", "3", "4"])
+        self.assertEqual(list(self.table.range_column(self.RANGE_COLUMN)[0]), [1, -2, 0.9999999, -3])
+        self.assertEqual(list(self.table.range_column(self.RANGE_COLUMN)[1]), [2, 1e-9, 10, -1])
+
+    def test_scan_range(self) -> None:  # scans must be consistent with the row-wise fuzzy_in
+        for container in [Range(1, 10), Range(-2, 0), Range(-3, 2), Range(1.0000001, 2), Range(-1, -1)]:
+            self.assertEqual(
+                self.table.scan_range_in(self.RANGE_COLUMN, container),
+                self.table.map(lambda row: row[self.RANGE_COLUMN].fuzzy_in(container)),
+            )
+            self.assertEqual(
+                self.table.scan_range_contains(self.RANGE_COLUMN, container),
+                self.table.map(lambda row: container.fuzzy_in(row[self.RANGE_COLUMN])),
+            )
+
+    def test_filter_mask(self) -> None:
+        self.assertEqual(self.table.scan_equals(self.STR_COLUMN, "a"), [True, False, True, False])
+        self.assertEqual(self.table.scan_in(self.STR_COLUMN, ["b", "c"]), [False, True, False, True])
+        table = self.table.filter_mask(
+            PartsTable.mask_and(
+                self.table.scan_in(self.STR_COLUMN, ["a", "b"]),
+                self.table.scan_range_in(self.RANGE_COLUMN, Range(-2, 2)),
+            )
+        )
+        self.assertEqual(table.map(lambda row: row["value"]), ["1", "2"])
+
+    def test_sort_by_keys(self) -> None:
+        table = self.table.sort_by_keys(self.table.range_column(self.RANGE_COLUMN)[0])
+        self.assertEqual(table.map(lambda row: row["value"]), ["4", "2", "3", "1"])
+        table = self.table.sort_by_keys(self.table.column(self.STR_COLUMN), reverse=True)
+        self.assertEqual(table.map(lambda row: row["value"]), ["4", "2", "1", "3"])
+
+
+class PartsTableIndexTest(unittest.TestCase):
+    RANGE_COLUMN = PartsTableColumn(Range)
+    STR_COLUMN = PartsTableColumn(str)
+
+    @override
+    def setUp(self) -> None:
+        rng = random.Random(0)
+        rows = []
+        for i in range(500):
+            center = rng.choice([-10, 0, 1, 1e-3, 1e3]) * rng.uniform(0.5, 2)
+            tolerance = abs(center) * rng.choice([0, 0.01, 0.1, 1])
+            rows.append(
+                PartsTableRow(
+                    {
+                        self.RANGE_COLUMN: Range(center - tolerance, center + tolerance),
+                        self.STR_COLUMN: rng.choice(["a", "b", "c"]),
+                    }
+                )
+            )
+        rows.append(PartsTableRow({self.RANGE_COLUMN: Range(float("nan"), float("nan")), self.STR_COLUMN: "a"}))
+        rows.append(PartsTableRow({self.RANGE_COLUMN: Range.all(), self.STR_COLUMN: "a"}))
+        self.table = PartsTable(rows)
+        self.queries = [Range(0, 1), Range(-20, 0), Range(1e-3, 1e-3), Range(0.9, 1.1), Range.all()]
+        self.queries.extend([row[self.RANGE_COLUMN] for row in rows[:50]])  # including exact and fuzzy edges
+
+    def _indices(self, fn: Callable[[PartsTableRow], bool]) -> Set[int]:
+        return {i for i, row in enumerate(self.table.rows) if fn(row)}
+
+    def test_select_range(self) -> None:  # results must be consistent with the row-wise fuzzy_in
+        for query in self.queries:
+            self.assertEqual(
+                self.table.select_range_in(self.RANGE_COLUMN, query),
+                self._indices(lambda row: row[self.RANGE_COLUMN].fuzzy_in(query)),
+            )
+            self.assertEqual(
+                self.table.select_range_contains(self.RANGE_COLUMN, query),
+                self._indices(lambda row: query.fuzzy_in(row[self.RANGE_COLUMN])),
+            )
+            among = self.table.select_equals(self.STR_COLUMN, "a")
+            self.assertEqual(
+                self.table.select_range_in(self.RANGE_COLUMN, query, among),
+                self.table.select_range_in(self.RANGE_COLUMN, query) & among,
+            )
+            self.assertEqual(
+                self.table.select_range_contains(self.RANGE_COLUMN, query, among),
+                self.table.select_range_contains(self.RANGE_COLUMN, query) & among,
+            )
+
+    def test_select_compose(self) -> None:
+        indices = self.table.select_in(self.STR_COLUMN, ["a", "b"]) & self.table.select_range_in(
+            self.RANGE_COLUMN, Range(0, 1)
+        )
+        self.assertEqual(
+            self.table.filter_indices(indices).rows,
+            self.table.filter(
+                lambda row: row[self.STR_COLUMN] in ("a", "b") and row[self.RANGE_COLUMN].fuzzy_in(Range(0, 1))
+            ).rows,
+        )
+        self.assertEqual(self.table.select_equals(self.STR_COLUMN, "d"), set())
+
+
 class UserFnPartsTableTest(unittest.TestCase):
     @staticmethod
     @ExperimentalUserFnPartsTable.user_fn()
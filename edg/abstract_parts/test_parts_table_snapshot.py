@@ -0,0 +1,183 @@
+import csv
+import os
+import tempfile
+import unittest
+from typing import Any, Dict, List, Optional, Tuple
+
+from typing_extensions import override
+
+from ..core import Range
+from .PartsTable import PartsTable, PartsTableColumn, PartsTableRow, PartsTableColumnarRows
+from .PartsTablePart import PartsTableBase
+from .PartsTableSnapshot import PartsTableSnapshot
+
+
+class SnapshotTable(PartsTableBase):
+    PART_NUMBER_COL = "part"
+    MANUFACTURER_COL = "part"
+    DESCRIPTION_COL = "part"
+    DATASHEET_COL = "part"
+
+    RANGE_COL = PartsTableColumn(Range)
+    FLOAT_COL = PartsTableColumn(float)
+    BOOL_COL = PartsTableColumn(bool)
+
+    source = ""
+    min_value = 0
+    make_count = 0
+
+    @classmethod
+    @override
+    def _make_table(cls) -> PartsTable:
+        cls.make_count += 1
+
+        def parse_row(row: PartsTableRow) -> Optional[Dict[PartsTableColumn, Any]]:
+            value = float(row["value"])
+            if value < cls.min_value:
+                return None
+            return {
+                cls.RANGE_COL: Range.from_tolerance(value, 0.1),
+                cls.FLOAT_COL: value,
+                cls.BOOL_COL: value > 1,
+            }
+
+        return PartsTable.from_csv_files([cls.source]).map_new_columns(parse_row)
+
+    @classmethod
+    @override
+    def _table_sources(cls) -> Optional[List[str]]:
+        return [cls.source]
+
+    @classmethod
+    @override
+    def _table_params(cls) -> Tuple[Any, ...]:
+        return (cls.min_value,)
+
+
+class PartsTableSnapshotTest(unittest.TestCase):
+    @override
+    def setUp(self) -> None:
+        self.dir = tempfile.TemporaryDirectory()
+        SnapshotTable.source = os.path.join(self.dir.name, "table.csv")
+        self._write_source(["1", "2", "3"])
+        SnapshotTable.min_value = 0
+        self.snapshot = PartsTableSnapshot(os.path.join(self.dir.name, "snapshots"))
+
+    @override
+    def tearDown(self) -> None:
+        self.dir.cleanup()
+
+    def _write_source(self, values: List[str]) -> None:
+        with open(SnapshotTable.source, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(["part", "value"])
+            for value in values:
+                writer.writerow([f"P{value}", value])
+
+    def _load(self) -> Optional[PartsTable]:
+        return self.snapshot.load(SnapshotTable, [SnapshotTable.source], SnapshotTable._table_params())
+
+    def _save(self) -> PartsTable:
+        table = SnapshotTable._make_table()
+        self.assertTrue(self.snapshot.save(SnapshotTable, table, [SnapshotTable.source], SnapshotTable._table_params()))
+        return table
+
+    def test_roundtrip(self) -> None:
+        self.assertIsNone(self._load())
+        table = self._save()
+        loaded = self._load()
+        assert loaded is not None
+        self.assertEqual([row.values for row in loaded.rows], [row.values for row in table.rows])
+        self.assertEqual(loaded.rows[0][SnapshotTable.RANGE_COL], Range.from_tolerance(1, 0.1))
+        self.assertEqual(loaded.rows[2][SnapshotTable.BOOL_COL], True)
+        self.assertEqual(loaded.rows[2]["part"], "P3")
+
+    def test_invalidate_source(self) -> None:
+        self._save()
+        self._write_source(["1", "2", "3", "4"])
+        os.utime(SnapshotTable.source, ns=(0, 0))  # make sure the mtime changes even on coarse filesystems
+        self.assertIsNone(self._load())
+
+    def test_get_table(self) -> None:
+        os.environ["EDG_PARTS_TABLE_CACHE_DIR"] = self.snapshot.cache_dir
+        try:
+            SnapshotTable.make_count = 0
+            SnapshotTable._TABLE = None
+            table = SnapshotTable._get_table()
+            SnapshotTable._TABLE = None  # simulate a new process
+            loaded = SnapshotTable._get_table()
+            self.assertEqual(SnapshotTable.make_count, 1)
+            self.assertEqual([row.values for row in loaded.rows], [row.values for row in table.rows])
+        finally:
+            del os.environ["EDG_PARTS_TABLE_CACHE_DIR"]
+            SnapshotTable._TABLE = None
+
+    def test_corrupt(self) -> None:
+        self._save()
+        path = self.snapshot._path(SnapshotTable)
+        with open(path, "rb") as f:
+            data = f.read()
+        for corrupt in [data[: len(data) // 2], data[:-1], PartsTableSnapshot.kMagic + b"\xff" * 16]:
+            with open(path, "wb") as f:
+                f.write(corrupt)
+            self.assertIsNone(self._load())
+
+    def test_shared_corrupt(self) -> None:
+        self._save()
+        with open(self.snapshot._path(SnapshotTable), "wb") as f:
+            f.write(PartsTableSnapshot.kMagic + b"\x01" * 5)  # header length and header truncated
+        shared_snapshot = PartsTableSnapshot(self.snapshot.cache_dir, shared=True)
+        self.assertIsNone(shared_snapshot.load(SnapshotTable, [SnapshotTable.source], SnapshotTable._table_params()))
+
+    def test_invalidate_params(self) -> None:
+        self._save()
+        SnapshotTable.min_value = 2
+        self.assertIsNone(self._load())
+
+    def test_unnamed_column(self) -> None:
+        column = PartsTableColumn(str)  # not defined on the class, so cannot be restored
+        table = PartsTable([PartsTableRow({column: "a"})])
+        self.assertFalse(self.snapshot.save(SnapshotTable, table, [SnapshotTable.source]))
+
+    def test_shared(self) -> None:
+        table = self._save()
+        shared_snapshot = PartsTableSnapshot(self.snapshot.cache_dir, shared=True)
+        loaded = shared_snapshot.load(SnapshotTable, [SnapshotTable.source], SnapshotTable._table_params())
+        assert loaded is not None
+        self.assertIsInstance(loaded.rows, PartsTableColumnarRows)
+        self.assertEqual([row.values for row in loaded.rows], [row.values for row in table.rows])
+        self.assertEqual(loaded.rows[-1]["part"], "P3")
+        self.assertEqual(loaded.rows[0][SnapshotTable.RANGE_COL], Range.from_tolerance(1, 0.1))
+        self.assertEqual(list(loaded.column(SnapshotTable.FLOAT_COL)), [1.0, 2.0, 3.0])
+        self.assertEqual(list(loaded.column("part")), ["P1", "P2", "P3"])
+        self.assertEqual(loaded.select_range_in(SnapshotTable.RANGE_COL, Range(1.5, 2.5)), {1})
+        self.assertEqual(
+            [row.values for row in loaded.filter(lambda row: row[SnapshotTable.BOOL_COL]).rows],
+            [row.values for row in table.rows[1:]],
+        )
+
+    def test_lock_stale(self) -> None:
+        lock_path = self.snapshot._path(SnapshotTable) + ".lock"
+        with open(lock_path, "w"):
+            pass
+        os.utime(lock_path, (0, 0))  # left by a crashed process long ago
+        with self.snapshot.lock(SnapshotTable):
+            self.assertTrue(os.path.exists(lock_path))
+        self.assertFalse(os.path.exists(lock_path))
+
+    def test_get_table_shared(self) -> None:
+        os.environ["EDG_PARTS_TABLE_CACHE_DIR"] = self.snapshot.cache_dir
+        os.environ["EDG_PARTS_TABLE_SHARED"] = "1"
+        try:
+            SnapshotTable.make_count = 0
+            SnapshotTable._TABLE = None
+            table = SnapshotTable._get_table()
+            self.assertIsInstance(table.rows, PartsTableColumnarRows)  # builder also attaches to the snapshot
+            SnapshotTable._TABLE = None  # simulate a new process
+            loaded = SnapshotTable._get_table()
+            self.assertEqual(SnapshotTable.make_count, 1)
+            self.assertEqual([row.values for row in loaded.rows], [row.values for row in table.rows])
+        finally:
+            del os.environ["EDG_PARTS_TABLE_CACHE_DIR"]
+            del os.environ["EDG_PARTS_TABLE_SHARED"]
+            SnapshotTable._TABLE = None
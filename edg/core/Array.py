@@ -43,7 +43,7 @@ class MapExtractBinding(Binding):
 
     @override
     def populate_expr_proto(self, pb: edgir.ValueExpr, expr: ConstraintExpr, ref_map: Refable.RefMapType) -> None:
-        contained_map = self.container._get_elt_sample()._create_ref_map(edgir.LocalPath())
+        contained_map = self.container._get_elt_sample()._create_ref_map()
         pb.map_extract.container.ref.CopyFrom(ref_map[self.container])  # TODO support arbitrary refs
         pb.map_extract.path.CopyFrom(contained_map[self.elt])
 
@@ -207,15 +207,15 @@ class Vector(BaseVector, Generic[VectorType]):
         raise RuntimeError()  # this doesn't generate into a library element
 
     @override
-    def _build_ref_map(self, ref_map: Refable.RefMapType, prefix: edgir.LocalPath) -> None:
+    def _build_ref_map(self, ref_map: Refable.RefMapType, prefix: edgir.LocalPathSteps) -> None:
         super()._build_ref_map(ref_map, prefix)
-        ref_map[self._length] = edgir.localpath_concat(prefix, edgir.LENGTH)
-        ref_map[self._requested] = edgir.localpath_concat(prefix, edgir.ALLOCATED)
+        ref_map.add(self._length, prefix + (edgir.LENGTH,))
+        ref_map.add(self._requested, prefix + (edgir.ALLOCATED,))
         elts_items = self._elts.items() if self._elts is not None else []
         for index, elt in elts_items:
-            elt._build_ref_map(ref_map, edgir.localpath_concat(prefix, index))
+            elt._build_ref_map(ref_map, prefix + (index,))
         for suggested_name, request in self._requests:
-            request._build_ref_map(ref_map, edgir.localpath_concat(prefix, edgir.Allocate(suggested_name)))
+            request._build_ref_map(ref_map, prefix + (edgir.Allocate(suggested_name),))
 
     @override
     def _get_initializers(self, path_prefix: List[str]) -> List[Tuple[ConstraintExpr, List[str], ConstraintExpr]]:
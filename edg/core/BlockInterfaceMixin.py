@@ -34,8 +34,8 @@ class BlockInterfaceMixin(Block, Generic[MixinBaseType]):
 
     @classmethod
     @override
-    def _get_bases_of(cls, base_type: Type[BaseType]) -> Tuple[List[Type[BaseType]], List[Type[BaseType]]]:
-        ordered_direct_bases, ordered_indirect_bases = super()._get_bases_of(base_type)
+    def _compute_bases_of(cls, base_type: Type[BaseType]) -> Tuple[List[Type[BaseType]], List[Type[BaseType]]]:
+        ordered_direct_bases, ordered_indirect_bases = super()._compute_bases_of(base_type)
         if cls._is_mixin():  # adds the mixin base defined in MixinBaseType to the list of bases
             mixin_base = cls._get_mixin_base()
             all_bases = ordered_direct_bases + ordered_indirect_bases
@@ -303,6 +303,16 @@ class BaseBlock(HasMetadata, metaclass=BaseBlockMeta):
 
         self._name = StringExpr()._bind(NameBinding(self))
 
+        self.manager_ignored.update(["_elaboration_ref_map"])
+        self._elaboration_ref_map: Optional[Tuple[BlockElaborationState, Refable.RefMapType]] = None
+
+    def _get_ref_map(self) -> Refable.RefMapType:
+        """Returns the ref map of this block, built once per elaboration state and shared by the _def_to_proto passes,
+        since the contents of a block only change between elaboration states."""
+        if self._elaboration_ref_map is None or self._elaboration_ref_map[0] != self._elaboration_state:
+            self._elaboration_ref_map = (self._elaboration_state, self._create_ref_map())
+        return self._elaboration_ref_map[1]
+
     def _all_delegated_connects(self) -> IdentitySet[Connection]:
         """Returns all the prior connects that have been superseded by a joined connect"""
         return IdentitySet(*itertools.chain(*self._connect_delegateds.values()))
@@ -345,11 +355,21 @@ class BaseBlock(HasMetadata, metaclass=BaseBlockMeta):
 
         return self._def_to_proto()
 
+    _cleaned_docs: Dict[Type[BaseBlock], Optional[str]] = {}  # memoized _cleaned_doc, shared by all instances
+
+    @classmethod
+    def _cleaned_doc(cls) -> Optional[str]:
+        """Returns the cleaned-up docstring of this class, or None if it has none"""
+        if cls not in BaseBlock._cleaned_docs:
+            BaseBlock._cleaned_docs[cls] = inspect.cleandoc(cls.__doc__) if cls.__doc__ else None
+        return BaseBlock._cleaned_docs[cls]
+
     def _add_doc_metadata(self) -> None:
         """Adds docstrings to metadata"""
         metadata_dict: Dict[str, str] = {}
-        if self.__doc__:
-            metadata_dict[""] = inspect.cleandoc(self.__doc__)
+        doc = self._cleaned_doc()
+        if doc is not None:
+            metadata_dict[""] = doc
         for name, param in self._parameters.items():
             if param in self._param_docs:
                 metadata_dict[name] = self._param_docs[param]
@@ -394,7 +414,7 @@ class BaseBlock(HasMetadata, metaclass=BaseBlockMeta):
         for name, port in self._ports.items():
             port._populate_portlike_proto(edgir.add_pair(pb.ports, name))
 
-        ref_map = self._create_ref_map()
+        ref_map = self._get_ref_map()
         for name, port in self._ports.items():
             if port in self._required_ports:
                 if isinstance(port, Port):
@@ -451,13 +471,13 @@ class BaseBlock(HasMetadata, metaclass=BaseBlockMeta):
             description.add_to_proto(pb, ref_map)
 
     @override
-    def _build_ref_map(self, ref_map: Refable.RefMapType, prefix: edgir.LocalPath) -> None:
+    def _build_ref_map(self, ref_map: Refable.RefMapType, prefix: edgir.LocalPathSteps) -> None:
         super()._build_ref_map(ref_map, prefix)
-        ref_map[self.name()] = edgir.localpath_concat(prefix, edgir.NAME)
+        ref_map.add(self.name(), prefix + (edgir.NAME,))
         for name, param in self._parameters.items():
-            param._build_ref_map(ref_map, edgir.localpath_concat(prefix, name))
+            param._build_ref_map(ref_map, prefix + (name,))
         for name, port in self._ports.items():
-            port._build_ref_map(ref_map, edgir.localpath_concat(prefix, name))
+            port._build_ref_map(ref_map, prefix + (name,))
 
     def _bind_in_place(self, parent: Union[BaseBlock, Port]) -> None:
         self._parent = parent
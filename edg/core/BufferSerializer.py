@@ -1,10 +1,11 @@
-from typing import TypeVar, Generic, Type, BinaryIO, Optional, IO
+from typing import TypeVar, Generic, Type, Optional, IO, Tuple
 
 import google.protobuf as protobuf
-import struct
+from google.protobuf.internal.encoder import _VarintBytes  # type: ignore
 
 MessageType = TypeVar("MessageType", bound=protobuf.message.Message)
 kHeaderMagicByte = b"\xfe"
+kMaxVarintBytes = 10  # maximum encoded length of a 64-bit varint
 
 
 class BufferSerializer(Generic[MessageType]):
@@ -17,12 +18,9 @@ class BufferSerializer(Generic[MessageType]):
         self.buffer = buffer
 
     def write(self, message: MessageType) -> None:
-        from google.protobuf.internal.encoder import _VarintBytes  # type: ignore
-
         # from https://cwiki.apache.org/confluence/display/GEODE/Delimiting+Protobuf+Messages
         serialized = message.SerializeToString()
-        self.buffer.write(kHeaderMagicByte)
-        self.buffer.write(_VarintBytes(len(serialized)))
+        self.buffer.write(kHeaderMagicByte + _VarintBytes(len(serialized)))  # header is small, combine into one write
         self.buffer.write(serialized)
         self.buffer.flush()
 
@@ -31,50 +29,98 @@ class BufferDeserializer(Generic[MessageType]):
     """
     Deserializes protobuf-serialized messages from a byte buffer and returns it one message at a time,
     using a delimited framing consistent with the Java implementation.
+
+    Where the buffer supports peek (eg, io.BufferedReader, including pipes and socket files), data preceding the
+    message header is consumed in bulk from the buffered data. This never reads past the end of the current message,
+    so multiple deserializers may take turns reading the same buffer.
+    Message payloads are read directly into a reusable receive buffer.
     """
 
     def __init__(self, message_type: Type[MessageType], buffer: IO[bytes]):
         self.message_type = message_type
         self.buffer = buffer
-        self.stdout_buffer = b""
-
-    # Returns the next message from the buffer
-    def read(self) -> Optional[MessageType]:
-        while True:
-            new = self.buffer.read(1)
-            if not new:
-                return None
-            elif new == kHeaderMagicByte:
-                break
-            else:
-                self.stdout_buffer += new
-
-        from google.protobuf.internal.decoder import _DecodeVarint32  # type: ignore
-
+        self.stdout_buffer = bytearray()
+        self._peekable = hasattr(buffer, "peek")
+        self._recv_buffer = bytearray(4096)
+
+    @staticmethod
+    def _decode_varint(data: bytes, pos: int) -> Optional[Tuple[int, int]]:
+        """Decodes a varint starting at pos, returning the value and the position after the varint,
+        or None if the varint is incomplete."""
         # from https://cwiki.apache.org/confluence/display/GEODE/Delimiting+Protobuf+Messages
-        current = b""
-        while len(current) == 0 or current[-1] & 0x80 == 0x80:
+        result = 0
+        shift = 0
+        for i in range(pos, min(len(data), pos + kMaxVarintBytes)):
+            result |= (data[i] & 0x7F) << shift
+            if not data[i] & 0x80:
+                return result, i + 1
+            shift += 7
+        if len(data) >= pos + kMaxVarintBytes:
+            raise ValueError("malformed varint in message header")
+        return None
+
+    def _read_header(self) -> Optional[int]:
+        """Consumes data through the end of the message header, storing preceding data in the stdout buffer.
+        Returns the message size, or None if the end of stream was reached first."""
+        if self._peekable:
+            while True:
+                available = self.buffer.peek(1)  # type: ignore[attr-defined]
+                if not available:
+                    return None
+                header_pos = available.find(kHeaderMagicByte)
+                if header_pos < 0:
+                    self.stdout_buffer += self.buffer.read(len(available))
+                    continue
+                self.stdout_buffer += available[:header_pos]
+                decoded = self._decode_varint(available, header_pos + 1)
+                if decoded is not None:  # common case, entire header is buffered
+                    self.buffer.read(decoded[1])
+                    return decoded[0]
+                else:
+                    self.buffer.read(header_pos + 1)
+                    break
+        else:
+            while True:
+                new = self.buffer.read(1)
+                if not new:
+                    return None
+                elif new == kHeaderMagicByte:
+                    break
+                else:
+                    self.stdout_buffer += new
+
+        # slow path, read varint bytes individually
+        header = b""
+        while True:
             new = self.buffer.read(1)
             if not new:
                 return None
-            current = current + new
-        size, new_pos = _DecodeVarint32(current, 0)
-        assert new_pos == len(current)
-
-        current = b""
-        while len(current) < size:
-            new = self.buffer.read(size - len(current))
-            if not new:
-                return None
-            current = current + new
-        assert len(current) == size
-
-        message = self.message_type()
-        message.ParseFromString(current)
+            header += new
+            decoded = self._decode_varint(header, 0)
+            if decoded is not None:
+                return decoded[0]
 
+    # Returns the next message from the buffer
+    def read(self) -> Optional[MessageType]:
+        size = self._read_header()
+        if size is None:
+            return None
+
+        if len(self._recv_buffer) < size:
+            self._recv_buffer = bytearray(max(size, 2 * len(self._recv_buffer)))
+        with memoryview(self._recv_buffer) as view:  # released on exit so the receive buffer can be resized
+            pos = 0
+            while pos < size:
+                read_len = self.buffer.readinto(view[pos:size])  # type: ignore[attr-defined]
+                if not read_len:
+                    return None
+                pos += read_len
+
+            message = self.message_type()
+            message.ParseFromString(view[:size])  # type: ignore[arg-type]
         return message
 
     def read_stdout(self) -> bytes:
-        old_buffer = self.stdout_buffer
-        self.stdout_buffer = b""
+        old_buffer = bytes(self.stdout_buffer)
+        self.stdout_buffer.clear()
         return old_buffer
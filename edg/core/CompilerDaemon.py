@@ -0,0 +1,166 @@
+import queue
+import socket
+import socketserver
+import threading
+import traceback
+from concurrent.futures import Future
+from typing import Callable, Optional, Tuple, Type, IO, cast
+
+from typing_extensions import override
+
+from .. import edgir
+from .. import edgrpc
+from .BufferSerializer import BufferSerializer, BufferDeserializer
+from .HierarchyBlock import Block
+from .Refinements import Refinements
+from .ScalaCompilerInterface import ScalaCompilerInstance, CompiledDesign, CompilerCheckError
+
+DaemonAddress = Tuple[str, int]
+kDefaultDaemonAddress: DaemonAddress = ("127.0.0.1", 19410)
+
+
+class CompilerDaemon:
+    """A long-lived compiler server that keeps one compiler JVM (and its library cache) warm across client processes.
+
+    Clients connect over a local socket and send delimited CompilerRequests (using the same framing as the compiler
+    stdio interface), and receive a CompilerResult for each request, in order. Requests from all clients are placed
+    in one job queue and run sequentially against the single compiler instance, with this process serving
+    the HDL requests.
+
+    Like the compiler server, library elements are cached for the lifetime of the daemon (both the JVM library cache
+    and the imported Python modules), so this should be restarted when HDL changes are expected.
+    Library modules are resolved by name relative to this process's working directory and path."""
+
+    class _Handler(socketserver.StreamRequestHandler):
+        server: "CompilerDaemon._Server"
+
+        @override
+        def handle(self) -> None:
+            request_deserializer = BufferDeserializer(edgrpc.CompilerRequest, cast(IO[bytes], self.rfile))
+            result_serializer = BufferSerializer[edgrpc.CompilerResult](cast(IO[bytes], self.wfile))
+            while True:
+                request = request_deserializer.read()
+                if request is None:  # client disconnected
+                    return
+                result_serializer.write(self.server.daemon.submit(request).result())
+
+    class _Server(socketserver.ThreadingTCPServer):
+        daemon_threads = True
+        allow_reuse_address = True
+
+        def __init__(self, address: DaemonAddress, daemon: "CompilerDaemon"):
+            self.daemon = daemon
+            super().__init__(address, CompilerDaemon._Handler)
+
+    def __init__(
+        self,
+        address: DaemonAddress = kDefaultDaemonAddress,
+        compiler_factory: Callable[[], ScalaCompilerInstance] = ScalaCompilerInstance,
+    ) -> None:
+        self.compiler_factory = compiler_factory
+        self.compiler = compiler_factory()
+        self.jobs: "queue.Queue[Optional[Tuple[edgrpc.CompilerRequest, Future[edgrpc.CompilerResult]]]]" = queue.Queue()
+        self.jobs_completed = 0
+        self._server = self._Server(address, self)
+        self._worker = threading.Thread(target=self._run_jobs, daemon=True)
+        self._worker.start()
+
+    @property
+    def address(self) -> DaemonAddress:
+        """Returns the bound address, useful when started on port 0."""
+        return self._server.server_address[0], self._server.server_address[1]  # type: ignore
+
+    def submit(self, request: edgrpc.CompilerRequest) -> "Future[edgrpc.CompilerResult]":
+        """Queues a compiler request, returning a future for its result. Thread-safe."""
+        future: "Future[edgrpc.CompilerResult]" = Future()
+        self.jobs.put((request, future))
+        return future
+
+    def _run_jobs(self) -> None:
+        while True:
+            job = self.jobs.get()
+            if job is None:
+                return
+            request, future = job
+            try:
+                result = self.compiler.compile_request(request)
+            except BaseException as e:  # report as a compiler error instead of killing the connection
+                result = edgrpc.CompilerResult(
+                    errors=[
+                        edgrpc.ErrorRecord(
+                            path=edgir.LocalPath(),
+                            kind="Internal error",
+                            name="",
+                            details="".join(traceback.TracebackException.from_exception(e).format()),
+                        )
+                    ]
+                )
+                self._restart_compiler()
+            self.jobs_completed += 1
+            future.set_result(result)
+
+    def _restart_compiler(self) -> None:
+        """Discards the current compiler instance, which is started again on the next job."""
+        process = self.compiler.process
+        if process is not None:
+            process.kill()  # may be blocked mid-protocol
+            try:
+                self.compiler.close()
+            except OSError:  # pipes may already be broken
+                pass
+        self.compiler = self.compiler_factory()
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def shutdown(self) -> None:
+        """Stops accepting connections and stops the job worker after the queued jobs complete.
+        Must not be called from the thread running serve_forever."""
+        self._server.shutdown()
+        self._server.server_close()
+        self.jobs.put(None)
+        self._worker.join()
+        if self.compiler.process is not None:
+            self.compiler.close()
+
+
+class CompilerDaemonClient:
+    """Client to a CompilerDaemon, with the same compile interface as ScalaCompilerInstance.
+    The top-level block is elaborated locally, everything else is elaborated by the daemon."""
+
+    def __init__(self, address: DaemonAddress = kDefaultDaemonAddress) -> None:
+        self.address = address
+        self._socket: Optional[socket.socket] = None
+        self._file: Optional[IO[bytes]] = None
+
+    def _connect(self) -> IO[bytes]:
+        if self._file is None:
+            self._socket = socket.create_connection(self.address)
+            self._file = cast(IO[bytes], self._socket.makefile("rwb"))
+        return self._file
+
+    def compile_request(self, request: edgrpc.CompilerRequest) -> edgrpc.CompilerResult:
+        """Sends a compiler request to the daemon and blocks until its result is available."""
+        file = self._connect()
+        BufferSerializer[edgrpc.CompilerRequest](file).write(request)
+        result = BufferDeserializer(edgrpc.CompilerResult, file).read()
+        if result is None:
+            raise ConnectionError(f"compiler daemon at {self.address} closed the connection")
+        return result
+
+    def compile(
+        self, block: Type[Block], refinements: Refinements = Refinements(), *, ignore_errors: bool = False
+    ) -> CompiledDesign:
+        result = self.compile_request(ScalaCompilerInstance.build_request(block, refinements))
+        design = CompiledDesign.from_compiler_result(result)
+        if result.errors and not ignore_errors:
+            raise CompilerCheckError(f"error during compilation:\n{design.errors_str()}")
+        return design
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
@@ -3,56 +3,59 @@ from __future__ import annotations
 from typing import *
 from abc import abstractmethod
 
-from typing_extensions import override
+from typing_extensions import TypeAlias, override
 
 from .. import edgir
 from .Builder import builder
 from .IdentityDict import IdentityDict
-from .IdentitySet import IdentitySet
 
 ElementType = TypeVar("ElementType")
 
 
 class SubElementDict(Generic[ElementType]):
-    def __init__(self, anon_prefix: Optional[str] = None) -> None:
-        self.anons = IdentitySet[ElementType]()  # TODO this should be order-preserving?
+    """Named sub-elements of one kind (eg, parameters, ports) of a LibraryElement, registered in its
+    SubElementManager, which holds the names of all sub-elements."""
+
+    def __init__(self, manager: SubElementManager, anon_prefix: Optional[str] = None) -> None:
+        self.manager = manager
+        self.anons: Dict[int, ElementType] = {}  # id -> registered but unnamed elements, in registration order
         self.anon_prefix = anon_prefix
         self.container: Dict[str, ElementType] = {}
-        self.names = IdentityDict[ElementType, str]()  # TODO unify w/ container?
         self.keys_list: List[str] = []
         self.closed = False
 
     def register(self, item: ElementType) -> ElementType:
         assert not self.closed, "adding items after closed"
-        self.anons.add(item)
+        self.manager._register(item, self)
+        self.anons[id(item)] = item
         return item
 
     def add_element(self, name: str, item: Any) -> None:
         assert not self.closed, "naming items after closed"
-        assert item in self.anons, f"attempted to add {name}={item}, but did not pre-register"
-        self.anons.remove(item)
+        anon = self.anons.pop(id(item), None)
+        assert anon is not None and anon is item, f"attempted to add {name}={item}, but did not pre-register"
         assert name not in self.container, f"attempted to reassign {name}={item}"
 
-        self.container[name] = item
-        self.names[item] = name
+        self.container[name] = anon
         self.keys_list.append(name)
+        self.manager._set_name(anon, name)
 
     # TODO should this be automatically called?
     def finalize(self) -> None:
         if self.anon_prefix is None:
-            assert not self.anons, f"can't have unnamed objects: {self.anons}"
+            assert not self.anons, f"can't have unnamed objects: {list(self.anons.values())}"
         else:
-            for id, elt in enumerate(self.anons):
+            for id, elt in enumerate(self.anons.values()):
                 name = f"{self.anon_prefix}_{id}"
                 assert name not in self.container, f"duplicate name {name}"
                 self.container[name] = elt
-                self.names[elt] = name
                 self.keys_list.append(name)
-            self.anons = IdentitySet[ElementType]()  # TODO needs clear operation
+                self.manager._set_name(elt, name)
+            self.anons = {}
         self.closed = True
 
     def all_values_temp(self) -> Iterable[ElementType]:  # TODO needs better API name, reconcile w/ values?
-        return list(self.container.values()) + list(self.anons)
+        return list(self.container.values()) + list(self.anons.values())
 
     # TODO the below allows this to be used like a dict, is this a good idea?
     # TODO should these make sure the dict is closed?
@@ -75,50 +78,93 @@ class SubElementDict(Generic[ElementType]):
         return item in self.container
 
     def name_of(self, elt: ElementType) -> Optional[str]:
-        if elt in self.names:
-            return self.names[elt]
-        else:
+        entry = self.manager.elements.get(id(elt))
+        if entry is None or entry.item is not elt:
             return None
+        elif entry.sub_dict is self:
+            return entry.name
+        elif self in entry.other_dicts:  # also registered here, under a different name
+            for name, value in self.container.items():
+                if value is elt:
+                    return name
+        return None
+
+
+class SubElementEntry:
+    """Registry entry of a sub-element in a SubElementManager"""
+
+    __slots__ = ("item", "sub_dict", "name", "other_dicts")
+
+    def __init__(self, item: Any, sub_dict: SubElementDict[Any]) -> None:
+        self.item = item  # also keeps the item alive, so its id is not reused
+        self.sub_dict = sub_dict  # the first dict the item was registered in
+        self.name: Optional[str] = None  # None while anonymous, otherwise the first name given
+        # other dicts the item was also registered in, eg a parameter used directly as a constraint by require
+        self.other_dicts: List[SubElementDict[Any]] = []
 
 
 class SubElementManager:
+    """Registry of the sub-elements of a LibraryElement, keyed by identity, across all its SubElementDicts,
+    so naming and looking up the names of elements doesn't need to search each SubElementDict."""
+
     def __init__(self) -> None:
         self.dicts: List[Tuple[Union[Type[Any], Tuple[Type[Any], ...]], SubElementDict[Any]]] = []
-        self.aliases = IdentityDict[Any, Any]()
+        self.elements: Dict[int, SubElementEntry] = {}  # id -> entry, for all registered elements
+        self.names: Dict[str, Any] = {}  # name -> element, for all named elements
+        self.aliases: Dict[int, Tuple[Any, Any]] = {}  # id(src) -> (src, target)
 
     def new_dict(
         self, filter_type: Union[Type[ElementType], Tuple[Type[ElementType], ...]], anon_prefix: Optional[str] = None
     ) -> SubElementDict[ElementType]:
-        sub_dict = SubElementDict[ElementType](anon_prefix)
+        sub_dict: SubElementDict[ElementType] = SubElementDict(self, anon_prefix)
         self.dicts.append((filter_type, sub_dict))
         return sub_dict
 
     def add_alias(self, src: Any, target: Any) -> None:
-        self.aliases[src] = target
+        assert id(src) not in self.aliases, f"attempted to overwrite alias of {src}"
+        self.aliases[id(src)] = (src, target)
+
+    def _register(self, item: Any, sub_dict: SubElementDict[Any]) -> None:
+        entry = self.elements.get(id(item))
+        if entry is None or entry.item is not item:
+            self.elements[id(item)] = SubElementEntry(item, sub_dict)
+        elif entry.sub_dict is sub_dict:  # registering again in the same dict is allowed only as a no-op
+            assert entry.name is None, f"attempted to register {item} again after naming"
+        else:  # registering in another dict is allowed, the element keeps its first name
+            assert sub_dict not in entry.other_dicts, f"attempted to register {item} again"
+            entry.other_dicts.append(sub_dict)
+
+    def _set_name(self, item: Any, name: str) -> None:
+        entry = self.elements[id(item)]
+        if entry.name is None:
+            entry.name = name
+        self.names[name] = item
 
     def add_element(self, name: str, item: Any) -> None:
         if isinstance(item, ElementDict):
             item._set_parent((name, self))
         else:
-            assigned = []
-            for tpe, dict in self.dicts:
-                if item in dict.anons:
-                    dict.add_element(name, item)
-                    assigned.append(dict)
-                else:  # require not conflicting name, or direct reassignment
-                    assert name not in dict.container or dict.names.get(item, None) == name, f"duplicate name {name}"
-            assert len(assigned) <= 1, f"assigned {item} to multiple SubElementDict {assigned}"
+            entry = self.elements.get(id(item))
+            if entry is not None and entry.item is item:
+                assigned = [sub_dict for sub_dict in [entry.sub_dict] + entry.other_dicts if id(item) in sub_dict.anons]
+            else:
+                assigned = []
+            if assigned:  # name a registered element
+                assert len(assigned) == 1, f"assigned {item} to multiple SubElementDict {assigned}"
+                assert name not in self.names, f"duplicate name {name}"
+                assigned[0].add_element(name, item)
+            else:  # require not conflicting name, or direct reassignment
+                assert self.names.get(name, item) is item, f"duplicate name {name}"
 
     def name_of(self, item: Any) -> Optional[str]:
-        if item in self.aliases:
-            item = self.aliases[item]
-        name_candidates = [sub_dict.name_of(item) for sub_dict_type, sub_dict in self.dicts]
-        name_candidates_filtered = [name_candidate for name_candidate in name_candidates if name_candidate is not None]
-        assert len(name_candidates_filtered) <= 1, f"more than 1 name candidates {name_candidates} for {item}"
-        if not name_candidates_filtered:
-            return None
+        alias = self.aliases.get(id(item))
+        if alias is not None and alias[0] is item:
+            item = alias[1]
+        entry = self.elements.get(id(item))
+        if entry is not None and entry.item is item:
+            return entry.name
         else:
-            return name_candidates_filtered[0]
+            return None
 
 
 class ElementDict(Generic[ElementType]):
@@ -149,10 +195,55 @@ class ElementDict(Generic[ElementType]):
         return self.container.values()
 
 
+class RefMap:
+    """Identity map of Refables to their edgir.LocalPath.
+    Paths are built as tuples of steps, since most are extensions of a shared prefix, and only converted to
+    LocalPath (and cached) when looked up, since most references in a block are never serialized."""
+
+    def __init__(self) -> None:
+        self.paths: Dict[int, edgir.LocalPathSteps] = {}
+        self.keys_dict: Dict[int, Refable] = {}  # keep keys alive, so ids are not reused
+        self.protos: Dict[int, edgir.LocalPath] = {}
+
+    def add(self, key: Refable, path: edgir.LocalPathSteps) -> None:
+        key_id = id(key)
+        assert key_id not in self.paths, f"attempted to overwrite {key}={self.paths[key_id]} with new {path}"
+        self.paths[key_id] = path
+        self.keys_dict[key_id] = key
+
+    def path(self, key: Refable) -> edgir.LocalPathSteps:
+        """Returns the path of a Refable as a tuple of steps"""
+        key_id = id(key)
+        assert key_id in self.paths, "key %s (%s) not found" % (key_id, key)
+        return self.paths[key_id]
+
+    def __getitem__(self, key: Refable) -> edgir.LocalPath:
+        """Returns the path of a Refable as a LocalPath, which is shared and must not be modified"""
+        key_id = id(key)
+        proto = self.protos.get(key_id)
+        if proto is None:
+            assert key_id in self.paths, "key %s (%s) not found" % (key_id, key)
+            proto = self.protos[key_id] = edgir.localpath_concat(*self.paths[key_id])
+        return proto
+
+    GetDefaultType = TypeVar("GetDefaultType")
+
+    def get(self, key: Refable, default: GetDefaultType) -> Union[edgir.LocalPath, GetDefaultType]:
+        if id(key) not in self.paths:
+            return default
+        return self[key]
+
+    def __contains__(self, item: object) -> bool:
+        return id(item) in self.paths
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+
 class Refable:
     """Object that could be referenced into a edgir.LocalPath"""
 
-    RefMapType = IdentityDict["Refable", edgir.LocalPath]
+    RefMapType: TypeAlias = RefMap
 
     @override
     def __repr__(self) -> str:
@@ -168,15 +259,15 @@ class Refable:
             "Note: 'and' and 'or' do not work on BoolExpr, use '&' or '|' instead."
         )
 
-    def _create_ref_map(self, prefix: edgir.LocalPath = edgir.LocalPath()) -> RefMapType:
+    def _create_ref_map(self, prefix: edgir.LocalPathSteps = ()) -> RefMapType:
         """Wrapper around _build_ref_map for top-level refmap construction."""
-        ref_map = IdentityDict[Refable, edgir.LocalPath]()
+        ref_map = RefMap()
         self._build_ref_map(ref_map, prefix)
         return ref_map
 
-    def _build_ref_map(self, ref_map: Refable.RefMapType, prefix: edgir.LocalPath) -> None:
+    def _build_ref_map(self, ref_map: Refable.RefMapType, prefix: edgir.LocalPathSteps) -> None:
         """Adds the references contained by this object to the parameter refmap."""
-        ref_map[self] = prefix
+        ref_map.add(self, prefix)
 
 
 class EltPropertiesBase:
@@ -199,6 +290,7 @@ class LibraryElement(Refable):
     """Defines a library element, which optionally contains other library elements."""
 
     _elt_properties: Dict[Tuple[Type[LibraryElement], EltPropertiesBase], Any] = {}
+    _def_names: Dict[Type[LibraryElement], str] = {}  # memoized _static_def_name, shared by all instances
 
     @override
     def __repr__(self) -> str:
@@ -245,6 +337,9 @@ class LibraryElement(Refable):
     def _static_def_name(cls) -> str:
         """If this library element is defined by class (all instances have an equivalent library definition),
         returns the definition name. Otherwise, should crash."""
+        def_name = LibraryElement._def_names.get(cls)
+        if def_name is not None:
+            return def_name
         if cls.__module__ == "__main__":
             # when the top-level design is run as main, the module name is __main__ which is meaningless
             # and breaks when the HDL server tries to resolve the __main__ reference (to itself),
@@ -255,7 +350,8 @@ class LibraryElement(Refable):
             module = os.path.splitext(os.path.basename(inspect.getfile(cls)))[0]
         else:
             module = cls.__module__
-        return module + "." + cls.__name__
+        def_name = LibraryElement._def_names[cls] = module + "." + cls.__name__
+        return def_name
 
     def _get_def_name(self) -> str:
         """Returns the definition name"""
@@ -286,13 +382,24 @@ class HasMetadata(LibraryElement):
 
     BaseType = TypeVar("BaseType", bound="HasMetadata")
 
+    # (class, base_type) -> memoized _get_bases_of, shared by all instances
+    _bases_of: Dict[Tuple[Type[HasMetadata], Type[HasMetadata]], Tuple[List[Any], List[Any]]] = {}
+
     @classmethod
     def _get_bases_of(cls, base_type: Type[BaseType]) -> Tuple[List[Type[BaseType]], List[Type[BaseType]]]:
         """Returns all the base classes of this class, as a list of direct superclasses (including through non_library
         elements) and a list of additional (indirect) superclasses. Direct superclasses are in MRO order, indirect
         superclasses order is not defined (but MRO in current practice).
+        The returned lists are new copies and may be modified by the caller.
 
         mypy currently does not allow passing in abstract types, so generally calls to this need type: ignore."""
+        bases = HasMetadata._bases_of.get((cls, base_type))
+        if bases is None:
+            bases = HasMetadata._bases_of[(cls, base_type)] = cls._compute_bases_of(base_type)
+        return list(bases[0]), list(bases[1])
+
+    @classmethod
+    def _compute_bases_of(cls, base_type: Type[BaseType]) -> Tuple[List[Type[BaseType]], List[Type[BaseType]]]:
         direct_bases: Set[Type[HasMetadata.BaseType]] = set()
 
         def process_direct_base(bcls: Type[HasMetadata.BaseType]) -> None:
@@ -102,15 +102,10 @@ class DesignTop(Block):
                 raise TypeError
             assert isinstance(multipack_block, MultipackBlock)
             multipack_name = self._name_of_child(multipack_block, self)
-            multipack_ref_base = edgir.LocalPath()
-            multipack_ref_base.steps.add().name = multipack_name
-            multipack_ref_map = multipack_block._create_ref_map(multipack_ref_base)
+            multipack_ref_map = multipack_block._create_ref_map((multipack_name,))
 
             packing_rule = multipack_block._get_block_packing_rule(multipack_part)
-            packed_ref_base = edgir.LocalPath()
-            for packed_path_part in packed_path:
-                packed_ref_base.steps.add().name = packed_path_part
-            packed_ref_map = multipack_part_block._create_ref_map(packed_ref_base)
+            packed_ref_map = multipack_part_block._create_ref_map(tuple(packed_path))
 
             if isinstance(multipack_part, Block):
                 part_name = multipack_block._name_of_child(multipack_part, self)
@@ -97,7 +97,7 @@ class GeneratorBlock(Block):
         if (
             self._elaboration_state != BlockElaborationState.post_generate
         ):  # only write generator on the stub definition
-            ref_map = self._create_ref_map()
+            ref_map = self._get_ref_map()
             pb = edgir.HierarchyBlock()
             self._populate_def_proto_block_base(pb)
             pb.generator.SetInParent()  # even if rest of the fields are empty, make sure to create a record
@@ -133,7 +133,7 @@ class GeneratorBlock(Block):
             self._elaboration_state = BlockElaborationState.generate
 
             # Translate parameter values to function arguments
-            ref_map = self._create_ref_map()
+            ref_map = self._get_ref_map()
             generate_values_map = {path.SerializeToString(): value for (path, value) in generate_values}
 
             assert (self.__class__, AbstractBlockProperty) not in self._elt_properties  # abstract blocks can't generate
@@ -27,7 +27,7 @@ from .Binding import InitParamBinding, AssignBinding
 from .Blocks import BaseBlock, Connection, BlockElaborationState, AbstractBlockProperty, BaseBlockMeta
 from .ConstraintExpr import BoolLike, FloatLike, IntLike, RangeLike, StringLike
 from .ConstraintExpr import ConstraintExpr, BoolExpr, FloatExpr, IntExpr, RangeExpr, StringExpr
-from .Core import Refable, non_library
+from .Core import Refable, RefMap, non_library
 from .HdlUserExceptions import *
 from .IdentityDict import IdentityDict
 from .IdentitySet import IdentitySet
@@ -356,7 +356,7 @@ class Block(BaseBlock, metaclass=BlockMeta):
 
     @override
     def _build_ref_map(
-        self, ref_map: Refable.RefMapType, prefix: edgir.LocalPath, *, interface_only: bool = False
+        self, ref_map: Refable.RefMapType, prefix: edgir.LocalPathSteps, *, interface_only: bool = False
     ) -> None:
         super()._build_ref_map(ref_map, prefix)
         for mixin in self._mixins:
@@ -364,7 +364,7 @@ class Block(BaseBlock, metaclass=BlockMeta):
         if not interface_only:
             for name, block in self._blocks.items():
                 assert isinstance(block, Block)
-                block._build_ref_map(ref_map, edgir.localpath_concat(prefix, name), interface_only=True)
+                block._build_ref_map(ref_map, prefix + (name,), interface_only=True)
 
     @override
     def _populate_def_proto_block_base(self, pb: edgir.BlockLikeTypes) -> None:
@@ -376,7 +376,7 @@ class Block(BaseBlock, metaclass=BlockMeta):
             if isinstance(param.binding, InitParamBinding) and param.binding.value is not None:
                 # default values can't depend on anything so the ref_map is empty
                 param_typed_value = param._to_expr_type(param.binding.value)
-                param_typed_value._populate_expr_proto(pb.param_defaults[param_name], IdentityDict())
+                param_typed_value._populate_expr_proto(pb.param_defaults[param_name], RefMap())
 
     def _populate_def_proto_hierarchy(self, pb: edgir.HierarchyBlock, ref_map: Refable.RefMapType) -> None:
         self._blocks.finalize()
@@ -502,7 +502,7 @@ class Block(BaseBlock, metaclass=BlockMeta):
     @override
     def _def_to_proto(self) -> edgir.HierarchyBlock:
         assert not self._mixins  # blocks with mixins can only be instantiated anonymously
-        ref_map = self._create_ref_map()
+        ref_map = self._get_ref_map()
 
         pb = edgir.HierarchyBlock()
         pb.prerefine_class.target.name = (
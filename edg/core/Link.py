@@ -42,7 +42,7 @@ class Link(BaseBlock, metaclass=LinkMeta):
 
     @override
     def _def_to_proto(self) -> edgir.Link:
-        ref_map = self._create_ref_map()
+        ref_map = self._get_ref_map()
 
         pb = edgir.Link()
         self._populate_def_proto_block_base(pb)
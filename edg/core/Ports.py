@@ -10,7 +10,7 @@ from typing_extensions import TypeVar, override
 from .Binding import ParamBinding, IsConnectedBinding, NameBinding
 from .Builder import builder
 from .ConstraintExpr import ConstraintExpr, BoolExpr, StringExpr
-from .Core import Refable, HasMetadata, SubElementDict, non_library
+from .Core import Refable, RefMap, HasMetadata, SubElementDict, non_library
 from .HdlUserExceptions import *
 from .IdentityDict import IdentityDict
 from .. import edgir
@@ -245,7 +245,7 @@ class Port(BasePort, Generic[PortLinkType]):
         for name, port in self._ports.items():
             port._populate_portlike_proto(edgir.add_pair(pb.ports, name))
 
-        self._populate_metadata(pb.meta, self._metadata, IdentityDict())  # TODO use ref map
+        self._populate_metadata(pb.meta, self._metadata, RefMap())  # TODO use ref map
 
         return pb
 
@@ -254,16 +254,16 @@ class Port(BasePort, Generic[PortLinkType]):
         return type(self)
 
     @override
-    def _build_ref_map(self, ref_map: Refable.RefMapType, prefix: edgir.LocalPath) -> None:
+    def _build_ref_map(self, ref_map: Refable.RefMapType, prefix: edgir.LocalPathSteps) -> None:
         super()._build_ref_map(ref_map, prefix)
-        ref_map[self.is_connected()] = edgir.localpath_concat(prefix, edgir.IS_CONNECTED)
-        ref_map[self.name()] = edgir.localpath_concat(prefix, edgir.NAME)
+        ref_map.add(self.is_connected(), prefix + (edgir.IS_CONNECTED,))
+        ref_map.add(self.name(), prefix + (edgir.NAME,))
         for name, param in self._parameters.items():
-            param._build_ref_map(ref_map, edgir.localpath_concat(prefix, name))
+            param._build_ref_map(ref_map, prefix + (name,))
         for name, port in self._ports.items():
-            port._build_ref_map(ref_map, edgir.localpath_concat(prefix, name))
+            port._build_ref_map(ref_map, prefix + (name,))
         if self._link_instance is not None:
-            self._link_instance._build_ref_map(ref_map, edgir.localpath_concat(prefix, edgir.CONNECTED_LINK))
+            self._link_instance._build_ref_map(ref_map, prefix + (edgir.CONNECTED_LINK,))
 
     @override
     def _get_initializers(self, path_prefix: List[str]) -> List[Tuple[ConstraintExpr, List[str], ConstraintExpr]]:
@@ -1,4 +1,4 @@
-from typing import Optional, Any, Type, Iterable, Union, Dict, List, Tuple
+from typing import Optional, Any, Type, Iterable, Union, Dict, List, Tuple, Callable, Hashable, TypeVar, TYPE_CHECKING
 
 import os
 import subprocess
@@ -12,11 +12,18 @@ from .HierarchyBlock import Block
 from .DesignTop import DesignTop
 from .Refinements import Refinements
 
+if TYPE_CHECKING:
+    from .TransformUtil import Path
+    from ..electronics_model.NetlistGenerator import Netlist, NetlistTransform
+
 
 class CompilerCheckError(BaseException):
     pass
 
 
+MemoType = TypeVar("MemoType")
+
+
 class CompiledDesign:
     @staticmethod
     def from_compiler_result(result: edgrpc.CompilerResult) -> "CompiledDesign":
@@ -42,12 +49,15 @@ class CompiledDesign:
         self.design = design
         self.contents = design.contents  # convenience accessor
         self.errors = errors
-        self._values = {path.SerializeToString(): edgir.valuelit_to_lit(value) for path, value in values}
+        self._values: Dict[Tuple[Union[str, "edgir.Reserved.V", bytes], ...], edgir.LitTypes] = {
+            self._path_key(path): edgir.valuelit_to_lit(value) for path, value in values
+        }
         self._block_to_link_ports = {block_port.SerializeToString(): link_port for block_port, link_port in connections}
         self._link_to_block_ports: Dict[bytes, List[edgir.LocalPath]] = {}
         for block_port, link_port in connections:
             link_port_str = link_port.SerializeToString()
             self._link_to_block_ports.setdefault(link_port_str, []).append(block_port)
+        self._memos: Dict[Hashable, Any] = {}  # results derived from this design, see memoize
 
     def errors_str(self) -> str:
         err_strs = []
@@ -58,23 +68,75 @@ class CompiledDesign:
             err_strs.append(f"{error.kind} @ {error_pathname}: {error.details}")
         return "\n".join([f"- {err_str}" for err_str in err_strs])
 
+    @staticmethod
+    def _path_key(path: edgir.LocalPath) -> Tuple[Union[str, "edgir.Reserved.V", bytes], ...]:
+        """Returns the value index key for a LocalPath: a tuple of the step names, or reserved param values,
+        which is the same as the iterable form of the path passed into get_value."""
+        key: List[Union[str, "edgir.Reserved.V", bytes]] = []
+        for step in path.steps:
+            if step.HasField("name"):
+                key.append(step.name)
+            elif step.HasField("reserved_param"):
+                key.append(step.reserved_param)
+            else:  # not expected in values, but keep it distinct from names
+                key.append(step.SerializeToString())
+        return tuple(key)
+
     # Reserved.V is a string because it doesn't load properly at runtime
-    # Serialized strings are used since proto objects are mutable and unhashable
+    # Values are indexed by tuple paths since proto objects are mutable and unhashable, and so lookups by
+    # (the common case) iterable paths don't need to build and serialize a proto
     def get_value(
         self, path: Union[edgir.LocalPath, Iterable[Union[str, "edgir.Reserved.V"]]]
     ) -> Optional[edgir.LitTypes]:
         if isinstance(path, edgir.LocalPath):
-            localpath = path
+            return self._values.get(self._path_key(path), None)
         else:
-            localpath = edgir.LocalPathList(path)
-        return self._values.get(localpath.SerializeToString(), None)
+            return self._values.get(tuple(path), None)
+
+    def get_values(
+        self, prefix: Iterable[Union[str, "edgir.Reserved.V"]], names: Iterable[Union[str, "edgir.Reserved.V"]]
+    ) -> List[Optional[edgir.LitTypes]]:
+        """Returns the values of each name under the common prefix path (eg, several parameters of a block),
+        in the order of names, and None for names without a value."""
+        prefix_key = tuple(prefix)
+        return [self._values.get(prefix_key + (name,), None) for name in names]
 
     def append_values(self, values: List[Tuple[edgir.LocalPath, edgir.ValueLit]]) -> None:
-        """Append solved values to this design, such as from a refinement pass"""
+        """Append solved values to this design, such as from a refinement pass.
+        This invalidates memoized results, which may depend on these values."""
+        self._memos.clear()
         for value_path, value_value in values:
-            value_path_str = value_path.SerializeToString()
-            assert value_path_str not in self._values
-            self._values[value_path_str] = edgir.valuelit_to_lit(value_value)
+            value_path_key = self._path_key(value_path)
+            assert value_path_key not in self._values
+            self._values[value_path_key] = edgir.valuelit_to_lit(value_value)
+
+    def memoize(self, key: Hashable, fn: Callable[[], MemoType]) -> MemoType:
+        """Returns a result derived from this design (such as its netlists), computing it with fn only if it has not
+        been computed since the design was created or its values last changed, so backends can share the result.
+        Memoized results are shared, and must not be modified."""
+        if key in self._memos:
+            return self._memos[key]  # type: ignore
+        result = fn()
+        self._memos[key] = result
+        return result
+
+    def netlists(self, transform: Optional["NetlistTransform"] = None) -> Dict["Path", "Netlist"]:
+        """Returns the netlist of each board in the design, by board scope path, generated on first use and
+        shared by backends. If generated here, transform may be a NetlistTransform that has already traversed
+        the design (for example, as part of a FusedTransform), whose result is used.
+        The result must not be modified."""
+        from ..electronics_model.NetlistGenerator import NetlistTransform
+
+        if transform is not None:
+            return self.memoize(NetlistTransform, transform.netlists)
+        return self.memoize(NetlistTransform, lambda: NetlistTransform(self).run())
+
+    def netlist(self, scope: Optional["Path"] = None) -> Optional["Netlist"]:
+        """Returns the netlist of the board at scope (by default, the top-level board), or None if there is
+        no board there. See netlists."""
+        from .TransformUtil import Path
+
+        return self.netlists().get(scope if scope is not None else Path.empty())
 
     def get_connected_link_port(self, block_port: edgir.LocalPath) -> Optional[edgir.LocalPath]:
         """For a block port, return the connected link side port."""
@@ -111,6 +173,26 @@ class ScalaCompilerInstance:
     def compile(
         self, block: Type[Block], refinements: Refinements = Refinements(), *, ignore_errors: bool = False
     ) -> CompiledDesign:
+        result = self.compile_request(self.build_request(block, refinements))
+        assert result.HasField("design")
+        design = CompiledDesign.from_compiler_result(result)
+        if result.errors and not ignore_errors:
+            raise CompilerCheckError(f"error during compilation:\n{design.errors_str()}")
+        return design
+
+    @staticmethod
+    def build_request(block: Type[Block], refinements: Refinements = Refinements()) -> edgrpc.CompilerRequest:
+        """Elaborates the top-level block and builds the compiler request, including the top-level refinements."""
+        block_obj = block()
+        request = edgrpc.CompilerRequest(design=edgir.Design(contents=builder.elaborate_toplevel(block_obj)))
+        if isinstance(block_obj, DesignTop):
+            refinements = block_obj.refinements() + refinements
+        refinements.populate_proto(request.refinements)
+        return request
+
+    def compile_request(self, request: edgrpc.CompilerRequest) -> edgrpc.CompilerResult:
+        """Runs a compiler request to completion, serving HDL requests from the compiler in this process.
+        Returns the raw compiler result."""
         from ..hdl_server.__main__ import process_request
 
         self.check_started()
@@ -120,19 +202,11 @@ class ScalaCompilerInstance:
         assert self.process.stdout is not None
         request_serializer = BufferSerializer[edgrpc.CompilerRequest](self.process.stdin)
 
-        block_obj = block()
-        request = edgrpc.CompilerRequest(design=edgir.Design(contents=builder.elaborate_toplevel(block_obj)))
-        if isinstance(block_obj, DesignTop):
-            refinements = block_obj.refinements() + refinements
-        refinements.populate_proto(request.refinements)
-
         # write the initial request to the compiler process
         request_serializer.write(request)
 
         # until the compiler gives back the response, this acts as the HDL server,
         # taking requests in the opposite direction
-        assert self.process.stdin is not None
-        assert self.process.stdout is not None
         hdl_request_deserializer = BufferDeserializer(edgrpc.HdlRequest, self.process.stdout)
         hdl_response_serializer = BufferSerializer[edgrpc.HdlResponse](self.process.stdin)
         while True:
@@ -152,11 +226,7 @@ class ScalaCompilerInstance:
         sys.stdout.buffer.flush()
 
         assert result is not None
-        assert result.HasField("design")
-        design = CompiledDesign.from_compiler_result(result)
-        if result.errors and not ignore_errors:
-            raise CompilerCheckError(f"error during compilation:\n{design.errors_str()}")
-        return design
+        return result
 
     def close(self) -> None:
         assert self.process is not None
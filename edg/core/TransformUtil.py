@@ -300,21 +300,68 @@ class Transform:
         else:
             raise ValueError(f"_traverse_linklike encountered unknown type {elt} at {context}")
 
-    def transform_design(self, design: edgir.Design) -> edgir.Design:
-        design_copy = edgir.Design()
-        design_copy.CopyFrom(design)  # create a copy so we can mutate in-place
-
+    def _traverse_design(self, design: edgir.Design) -> None:
         # TODO: toplevel is nonuniform w/ BlockLike, so we copy transform_blocklike and traverse_blocklike
         # TODO: this can't handle instantiation at the top level
-        root_context = TransformContext(Path.empty(), design_copy)
-        self.visit_block(root_context, design_copy.contents)
+        root_context = TransformContext(Path.empty(), design)
+        self.visit_block(root_context, design.contents)
 
         # TODO dedup w/ _transform_blocklike
-        for port_pair in design_copy.contents.ports:
+        for port_pair in design.contents.ports:
             self._traverse_portlike(root_context.append_port(port_pair.name), port_pair.value)
-        for link_pair in design_copy.contents.links:
+        for link_pair in design.contents.links:
             self._traverse_linklike(root_context.append_link(link_pair.name), link_pair.value)
-        for block_pair in design_copy.contents.blocks:
+        for block_pair in design.contents.blocks:
             self._traverse_blocklike(root_context.append_block(block_pair.name), block_pair.value)
 
+    def transform_design(self, design: edgir.Design) -> edgir.Design:
+        """Traverses a copy of the design, which the visit_* operations may modify in-place, and returns the copy."""
+        design_copy = edgir.Design()
+        design_copy.CopyFrom(design)  # create a copy so we can mutate in-place
+        self._traverse_design(design_copy)
         return design_copy
+
+    def visit_design(self, design: edgir.Design) -> None:
+        """Traverses the design without copying it, for transforms that only read the design.
+        The visit_* operations must not modify the design."""
+        self._traverse_design(design)
+
+
+class FusedTransform(Transform):
+    """Runs several read-only transforms in a single traversal of the design (with visit_design), calling each
+    visit_* operation on each transform in order.
+    Each transform sees the same visits as if it were run by itself, but transforms cannot depend on results
+    from other transforms in the same traversal."""
+
+    def __init__(self, transforms: Iterable[Transform]) -> None:
+        self.transforms = list(transforms)
+
+    @override
+    def visit_block(self, context: TransformContext, block: edgir.HierarchyBlock) -> None:
+        for transform in self.transforms:
+            transform.visit_block(context, block)
+
+    @override
+    def visit_link(self, context: TransformContext, link: edgir.Link) -> None:
+        for transform in self.transforms:
+            transform.visit_link(context, link)
+
+    @override
+    def visit_linkarray(self, context: TransformContext, link: edgir.LinkArray) -> None:
+        for transform in self.transforms:
+            transform.visit_linkarray(context, link)
+
+    @override
+    def visit_blocklike(self, context: TransformContext, block: edgir.BlockLike) -> None:
+        for transform in self.transforms:
+            transform.visit_blocklike(context, block)
+
+    @override
+    def visit_portlike(self, context: TransformContext, port: edgir.PortLike) -> None:
+        for transform in self.transforms:
+            transform.visit_portlike(context, port)
+
+    @override
+    def visit_linklike(self, context: TransformContext, link: edgir.LinkLike) -> None:
+        for transform in self.transforms:
+            transform.visit_linklike(context, link)
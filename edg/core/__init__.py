@@ -31,5 +31,6 @@ from .BaseBackend import BaseBackend
 
 from .BufferSerializer import BufferDeserializer, BufferSerializer
 from .ScalaCompilerInterface import ScalaCompiler, CompiledDesign, CompilerCheckError
+from .CompilerDaemon import CompilerDaemon, CompilerDaemonClient
 from .Refinements import Refinements, ParamValue
 from .CompiledDesignExport import CompiledDesignExportTransform
@@ -127,6 +127,16 @@ class BlockProtoTestCase(unittest.TestCase):
         self.assertEqual(self.pb.ports[1].name, "base_port_constr")
         self.assertEqual(self.pb.ports[1].value.lib_elem.target.name, "edg.core.test_elaboration_common.TestPortBase")
 
+    def test_superclass_cached(self) -> None:  # per-class metadata is shared by instances
+        direct_bases, indirect_bases = TestBlock._get_bases_of(Block)
+        direct_bases.clear()  # returned lists may be modified without affecting later instances
+        indirect_bases.clear()
+
+        pb = TestBlock()._elaborated_def_to_proto()
+        self.assertEqual(pb.superclasses, self.pb.superclasses)
+        self.assertEqual(pb.super_superclasses, self.pb.super_superclasses)
+        self.assertEqual(pb.meta, self.pb.meta)
+
     def test_port_def(self) -> None:
         self.assertEqual(len(self.pb.ports), 4)
         self.assertEqual(self.pb.ports[3].name, "port_lit")
@@ -64,3 +64,28 @@ class BufferDeserializerTestCase(unittest.TestCase):
         self.assertEqual(pb_deserialized, pb1)
         pb_deserialized = deserializer.read()
         self.assertEqual(pb_deserialized, pb2)
+
+
+class BufferRoundtripTestCase(unittest.TestCase):
+    def test_roundtrip_interleaved(self) -> None:
+        # includes a message larger than the initial receive buffer, and stdout data between messages
+        pbs = []
+        for length in [1, 200, 10000, 5]:
+            pb = edgir.ValueLit()
+            pb.text.val = "!" * length
+            pbs.append(pb)
+
+        buffer = io.BytesIO()
+        serializer = BufferSerializer[edgir.ValueLit](buffer)
+        for i, pb in enumerate(pbs):
+            buffer.write(f"print{i}\n".encode("utf-8"))
+            serializer.write(pb)
+        buffer.write(b"end")
+
+        for read_buffer in [io.BytesIO(buffer.getvalue()), io.BufferedReader(io.BytesIO(buffer.getvalue()), 16)]:
+            deserializer = BufferDeserializer(edgir.ValueLit, read_buffer)  # type: ignore[arg-type]
+            for i, pb in enumerate(pbs):
+                self.assertEqual(deserializer.read(), pb)
+                self.assertEqual(deserializer.read_stdout(), f"print{i}\n".encode("utf-8"))
+            self.assertIsNone(deserializer.read())
+            self.assertEqual(deserializer.read_stdout(), b"end")
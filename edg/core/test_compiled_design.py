@@ -0,0 +1,66 @@
+import unittest
+from typing import List
+
+from .. import edgir
+from . import TransformUtil
+from .ScalaCompilerInterface import CompiledDesign
+
+
+class CompiledDesignValuesTestCase(unittest.TestCase):
+    def test_get_value(self) -> None:
+        compiled = CompiledDesign(
+            edgir.Design(),
+            [
+                (edgir.LocalPathList(["block", "param"]), edgir.lit_to_valuelit(1.0)),
+                (edgir.LocalPathList(["block", "port", edgir.IS_CONNECTED]), edgir.lit_to_valuelit(True)),
+            ],
+            [],
+            [],
+        )
+        self.assertEqual(compiled.get_value(["block", "param"]), 1.0)
+        self.assertEqual(compiled.get_value(("block", "param")), 1.0)
+        self.assertEqual(compiled.get_value(edgir.LocalPathList(["block", "param"])), 1.0)
+        self.assertEqual(compiled.get_value(["block", "port", edgir.IS_CONNECTED]), True)
+        self.assertEqual(compiled.get_value(edgir.LocalPathList(["block", "port", edgir.IS_CONNECTED])), True)
+        self.assertEqual(compiled.get_value(["block", "missing"]), None)
+        self.assertEqual(compiled.get_value(["block"]), None)
+
+    def test_get_values(self) -> None:
+        compiled = CompiledDesign(
+            edgir.Design(),
+            [
+                (edgir.LocalPathList(["block", "a"]), edgir.lit_to_valuelit("x")),
+                (edgir.LocalPathList(["block", "b"]), edgir.lit_to_valuelit(2.0)),
+            ],
+            [],
+            [],
+        )
+        self.assertEqual(compiled.get_values(("block",), ("b", "missing", "a")), [2.0, None, "x"])
+
+        compiled.append_values([(edgir.LocalPathList(["block", "missing"]), edgir.lit_to_valuelit(True))])
+        self.assertEqual(compiled.get_values(["block"], ["missing"]), [True])
+        with self.assertRaises(AssertionError):  # no overwriting values
+            compiled.append_values([(edgir.LocalPathList(["block", "a"]), edgir.lit_to_valuelit("y"))])
+
+    def test_memoize(self) -> None:
+        compiled = CompiledDesign(edgir.Design(), [], [], [])
+        calls: List[None] = []
+
+        def compute() -> int:
+            calls.append(None)
+            return len(calls)
+
+        self.assertEqual(compiled.memoize("key", compute), 1)
+        self.assertEqual(compiled.memoize("key", compute), 1)
+        self.assertEqual(compiled.memoize("other", compute), 2)
+        self.assertEqual(len(calls), 2)
+
+        compiled.append_values([(edgir.LocalPathList(["block", "a"]), edgir.lit_to_valuelit(1.0))])
+        self.assertEqual(compiled.memoize("key", compute), 3)  # invalidated by new values
+        self.assertEqual(compiled.memoize("key", compute), 3)
+
+    def test_netlists(self) -> None:
+        compiled = CompiledDesign(edgir.Design(), [], [], [])
+        netlists = compiled.netlists()
+        self.assertIs(compiled.netlists(), netlists)  # generated once, shared by backends
+        self.assertIsNone(compiled.netlist(TransformUtil.Path.empty().append_block("missing")))
@@ -0,0 +1,85 @@
+import threading
+import unittest
+
+from typing_extensions import override
+
+from .. import edgir
+from .. import edgrpc
+from .CompilerDaemon import CompilerDaemon, CompilerDaemonClient
+from .ScalaCompilerInterface import ScalaCompilerInstance
+
+
+class EchoCompilerInstance(ScalaCompilerInstance):
+    """Compiler that returns the request design, to test the daemon transport without a JVM.
+    Like a compiler with its pipes left mid-protocol, an instance is unusable after an error."""
+
+    instances = 0
+
+    def __init__(self) -> None:
+        super().__init__()
+        EchoCompilerInstance.instances += 1
+        self.failed = False
+
+    @override
+    def compile_request(self, request: edgrpc.CompilerRequest) -> edgrpc.CompilerResult:
+        if self.failed:
+            raise BrokenPipeError("compiler reused after an error")
+        if request.design.contents.self_class.target.name == "error":
+            self.failed = True
+            raise ValueError("test error")
+        return edgrpc.CompilerResult(design=request.design)
+
+
+class CompilerDaemonTestCase(unittest.TestCase):
+    @override
+    def setUp(self) -> None:
+        EchoCompilerInstance.instances = 0
+        self.daemon = CompilerDaemon(("127.0.0.1", 0), EchoCompilerInstance)
+        self.server_thread = threading.Thread(target=self.daemon.serve_forever)
+        self.server_thread.start()
+
+    @override
+    def tearDown(self) -> None:
+        self.daemon.shutdown()
+        self.server_thread.join()
+
+    @staticmethod
+    def make_request(name: str) -> edgrpc.CompilerRequest:
+        request = edgrpc.CompilerRequest()
+        request.design.contents.self_class.target.name = name
+        return request
+
+    def test_multiple_clients(self) -> None:
+        clients = [CompilerDaemonClient(self.daemon.address) for i in range(4)]
+        results = {}
+
+        def run_client(i: int) -> None:
+            results[i] = [clients[i].compile_request(self.make_request(f"block{i}_{j}")) for j in range(3)]
+
+        threads = [threading.Thread(target=run_client, args=(i,)) for i in range(len(clients))]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        for client in clients:
+            client.close()
+
+        for i in range(len(clients)):
+            self.assertEqual(
+                [result.design.contents.self_class.target.name for result in results[i]],
+                [f"block{i}_{j}" for j in range(3)],
+            )
+        self.assertEqual(self.daemon.jobs_completed, 12)
+
+    def test_error(self) -> None:
+        client = CompilerDaemonClient(self.daemon.address)
+        result = client.compile_request(self.make_request("error"))
+        self.assertFalse(result.HasField("design"))
+        self.assertEqual(result.errors[0].kind, "Internal error")
+        self.assertIn("test error", result.errors[0].details)
+
+        # daemon should continue to serve requests after an error, with a new compiler instance
+        result = client.compile_request(self.make_request("block"))
+        self.assertEqual(result.design.contents.self_class.target.name, "block")
+        self.assertEqual(EchoCompilerInstance.instances, 2)
+        client.close()
@@ -0,0 +1,52 @@
+import unittest
+
+from typing_extensions import override
+
+from .. import edgir
+
+from . import *
+from .Blocks import BlockElaborationState
+from .test_elaboration_common import TestBlockSink, TestPortSink
+
+
+class RefMapBlock(Block):
+    def __init__(self) -> None:
+        super().__init__()
+        self.sinks = self.Port(Vector(TestPortSink()))
+
+    @override
+    def contents(self) -> None:
+        super().contents()
+        self.block = self.Block(TestBlockSink())
+
+
+class RefMapTestCase(unittest.TestCase):
+    def test_paths(self) -> None:
+        block = RefMapBlock()
+        block._elaborated_def_to_proto()
+        ref_map = block._create_ref_map(("top",))
+
+        self.assertEqual(ref_map.path(block), ("top",))
+        self.assertEqual(ref_map.path(block.sinks._length), ("top", "sinks", edgir.LENGTH))
+        self.assertEqual(ref_map.path(block.block.sink.float_param), ("top", "block", "sink", "float_param"))
+        self.assertEqual(
+            ref_map[block.block.sink.float_param], edgir.LocalPathList(["top", "block", "sink", "float_param"])
+        )
+        self.assertEqual(ref_map[block.sinks._length], edgir.localpath_concat("top", "sinks", edgir.LENGTH))
+        self.assertIs(ref_map[block.sinks._length], ref_map[block.sinks._length])  # converted once
+
+        other_port = TestPortSink()
+        self.assertNotIn(other_port, ref_map)
+        self.assertIsNone(ref_map.get(other_port, None))
+
+    def test_elaboration_ref_map(self) -> None:
+        block = RefMapBlock()
+        init_ref_map = block._get_ref_map()
+        self.assertIs(block._get_ref_map(), init_ref_map)
+
+        block._elaborated_def_to_proto()
+        self.assertEqual(block._elaboration_state, BlockElaborationState.post_contents)
+        elaborated_ref_map = block._get_ref_map()
+        self.assertIsNot(elaborated_ref_map, init_ref_map)  # rebuilt with the block contents
+        self.assertIn(block.block.sink, elaborated_ref_map)
+        self.assertNotIn(block.block.sink, init_ref_map)
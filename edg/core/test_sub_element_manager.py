@@ -0,0 +1,90 @@
+import unittest
+
+from .. import edgir
+from . import *
+from .Core import SubElementManager
+
+
+class RequireParamBlock(Block):
+    def __init__(self) -> None:
+        super().__init__()
+        self.param = self.Parameter(BoolExpr())
+        self.require(self.param)  # the parameter is also registered as a constraint
+
+
+class SubElementManagerTestCase(unittest.TestCase):
+    def test_naming(self) -> None:
+        manager = SubElementManager()
+        ports = manager.new_dict(object)
+        params = manager.new_dict(object)
+        port, param, unnamed = object(), object(), object()
+        ports.register(port)
+        params.register(param)
+        params.register(unnamed)
+
+        manager.add_element("port", port)
+        manager.add_element("param", param)
+        manager.add_element("other", object())  # not registered, ignored
+        self.assertEqual(manager.name_of(port), "port")
+        self.assertEqual(ports.name_of(port), "port")
+        self.assertIsNone(params.name_of(port))  # in a different dict
+        self.assertEqual(params.name_of(param), "param")
+        self.assertIsNone(manager.name_of(unnamed))
+        self.assertEqual(list(ports.items()), [("port", port)])
+        self.assertEqual(list(params.all_values_temp()), [param, unnamed])
+
+        manager.add_element("port", port)  # direct reassignment allowed
+        with self.assertRaises(AssertionError):
+            manager.add_element("port", param)  # duplicate name across dicts
+        with self.assertRaises(AssertionError):
+            manager.add_element("param", unnamed)
+        with self.assertRaises(AssertionError):
+            manager.add_element("port", object())
+        with self.assertRaises(AssertionError):
+            params.register(param)  # already named in this dict
+
+    def test_multiple_dicts(self) -> None:
+        manager = SubElementManager()
+        params = manager.new_dict(object)
+        constraints = manager.new_dict(object, anon_prefix="anon")
+        param = object()
+        params.register(param)
+        manager.add_element("param", param)
+        constraints.register(param)  # registering in another dict is allowed
+        constraints.finalize()
+
+        self.assertEqual(manager.name_of(param), "param")  # keeps the first name
+        self.assertEqual(params.name_of(param), "param")
+        self.assertEqual(constraints.name_of(param), "anon_0")
+        self.assertEqual(list(constraints.keys_ordered()), ["anon_0"])
+
+    def test_require_param(self) -> None:
+        block = RequireParamBlock()
+        pb = block._elaborated_def_to_proto()
+        self.assertEqual([param.name for param in pb.params], ["param"])
+        self.assertEqual(pb.constraints[0].value.ref, edgir.LocalPathList(["param"]))
+        self.assertEqual(block.manager.name_of(block.param), "param")
+
+    def test_anon(self) -> None:
+        manager = SubElementManager()
+        connects = manager.new_dict(object, anon_prefix="anon")
+        named, anon0, anon1 = object(), object(), object()
+        connects.register(anon0)
+        connects.register(named)
+        connects.register(anon1)
+        manager.add_element("named", named)
+        connects.finalize()
+
+        self.assertEqual(list(connects.keys_ordered()), ["named", "anon_0", "anon_1"])
+        self.assertEqual(manager.name_of(anon1), "anon_1")
+        with self.assertRaises(AssertionError):
+            manager.add_element("anon_0", object())
+
+    def test_alias(self) -> None:
+        manager = SubElementManager()
+        ports = manager.new_dict(object)
+        port, alias = object(), object()
+        ports.register(port)
+        manager.add_element("port", port)
+        manager.add_alias(alias, port)
+        self.assertEqual(manager.name_of(alias), "port")
@@ -0,0 +1,75 @@
+import unittest
+from typing import List, Tuple
+
+from typing_extensions import override
+
+from .. import edgir
+from . import TransformUtil
+from .TransformUtil import TransformContext
+
+
+class RecordingTransform(TransformUtil.Transform):
+    def __init__(self) -> None:
+        self.visits: List[Tuple[str, TransformUtil.Path]] = []
+
+    @override
+    def visit_block(self, context: TransformContext, block: edgir.HierarchyBlock) -> None:
+        self.visits.append(("block", context.path))
+
+    @override
+    def visit_link(self, context: TransformContext, link: edgir.Link) -> None:
+        self.visits.append(("link", context.path))
+
+    @override
+    def visit_portlike(self, context: TransformContext, port: edgir.PortLike) -> None:
+        self.visits.append(("port", context.path))
+
+
+class DesignCheckingTransform(TransformUtil.Transform):
+    def __init__(self) -> None:
+        self.designs: List[edgir.Design] = []
+
+    @override
+    def visit_block(self, context: TransformContext, block: edgir.HierarchyBlock) -> None:
+        self.designs.append(context.design)
+
+
+class FusedTransformTestCase(unittest.TestCase):
+    @override
+    def setUp(self) -> None:
+        self.design = edgir.Design()
+        port = self.design.contents.ports.add()
+        port.name = "port"
+        port.value.port.SetInParent()
+        inner = self.design.contents.blocks.add()
+        inner.name = "inner"
+        inner_port = inner.value.hierarchy.ports.add()
+        inner_port.name = "port"
+        inner_port.value.port.SetInParent()
+        inner_block = inner.value.hierarchy.blocks.add()
+        inner_block.name = "leaf"
+        inner_block.value.hierarchy.SetInParent()
+        link = self.design.contents.links.add()
+        link.name = "link"
+        link.value.link.SetInParent()
+
+    def test_fused_visits(self) -> None:
+        separate = RecordingTransform()
+        separate.transform_design(self.design)
+
+        fused1 = RecordingTransform()
+        fused2 = RecordingTransform()
+        TransformUtil.FusedTransform([fused1, fused2]).visit_design(self.design)
+        self.assertEqual(fused1.visits, separate.visits)
+        self.assertEqual(fused2.visits, separate.visits)
+        self.assertIn(("block", TransformUtil.Path.empty().append_block("inner", "leaf")), fused1.visits)
+
+    def test_visit_no_copy(self) -> None:
+        checking = DesignCheckingTransform()
+        checking.visit_design(self.design)
+        self.assertTrue(checking.designs)
+        self.assertTrue(all(design is self.design for design in checking.designs))
+
+        copy_checking = DesignCheckingTransform()
+        copy_checking.transform_design(self.design)
+        self.assertTrue(all(design is not self.design for design in copy_checking.designs))
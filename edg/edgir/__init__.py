@@ -1,4 +1,4 @@
-from typing import Union, Optional, Iterable, TYPE_CHECKING, List, cast, overload, NamedTuple
+from typing import Union, Optional, Iterable, TYPE_CHECKING, List, Tuple, cast, overload, NamedTuple
 
 from google.protobuf.internal.containers import RepeatedCompositeFieldContainer
 
@@ -149,6 +149,10 @@ class Allocate:
             self.suggested_name = suggested_name
 
 
+# LocalPath as a tuple of steps, cheap to extend by a prefix and hashable; convert with localpath_concat(*steps)
+LocalPathSteps = Tuple[Union[str, Allocate, "Reserved.V"], ...]
+
+
 def localpath_concat(
     *elts: Union[LocalPath, str, Allocate, "Reserved.V"]
 ) -> LocalPath:  # TODO workaround for broken enum typing
@@ -23,8 +23,10 @@ class GenerateBom(BaseBackend):  # creates and populates .csv file
     @override
     def run(self, design: CompiledDesign, args: Dict[str, str] = {}) -> List[Tuple[edgir.LocalPath, str]]:
         assert not args
-        bom_list = BomTransform(design).run()
+        return self.generate(BomTransform(design).run())
 
+    def generate(self, bom_list: Dict[BomItem, List[str]]) -> List[Tuple[edgir.LocalPath, str]]:
+        """Generates the BOM from a BomTransform result"""
         bom_string = io.StringIO()
         csv_data = [
             "Id",
@@ -69,16 +71,16 @@ class BomTransform(TransformUtil.Transform):
 
     @override
     def visit_block(self, context: TransformUtil.TransformContext, block: edgir.BlockTypes) -> None:
-        footprint = self.design.get_value(context.path.to_tuple() + ("fp_footprint",))
-        refdes = self.design.get_value(context.path.to_tuple() + ("fp_refdes",))
+        path = context.path.to_tuple()
+        footprint, refdes = self.design.get_values(path, ("fp_footprint", "fp_refdes"))
         if footprint is not None and refdes is not None:
-            value = self.design.get_value(context.path.to_tuple() + ("fp_value",)) or ""
-            jlc_number = self.design.get_value(context.path.to_tuple() + ("lcsc_part",)) or ""
-            manufacturer = self.design.get_value(context.path.to_tuple() + ("fp_mfr",)) or ""
-            part = self.design.get_value(context.path.to_tuple() + ("fp_part",)) or ""
-            pnp_rot = self.design.get_value(context.path.to_tuple() + ("fp_pnp_rot",))
-            pnp_offset_x = self.design.get_value(context.path.to_tuple() + ("fp_pnp_offset_x",))
-            pnp_offset_y = self.design.get_value(context.path.to_tuple() + ("fp_pnp_offset_y",))
+            value, jlc_number, manufacturer, part, pnp_rot, pnp_offset_x, pnp_offset_y = self.design.get_values(
+                path, ("fp_value", "lcsc_part", "fp_mfr", "fp_part", "fp_pnp_rot", "fp_pnp_offset_x", "fp_pnp_offset_y")
+            )
+            value = value or ""
+            jlc_number = jlc_number or ""
+            manufacturer = manufacturer or ""
+            part = part or ""
             assert (
                 isinstance(footprint, str)
                 and isinstance(refdes, str)
@@ -104,5 +106,5 @@ class BomTransform(TransformUtil.Transform):
             self.bom_list.setdefault(bom_item, []).append(refdes)
 
     def run(self) -> Dict[BomItem, List[str]]:
-        self.transform_design(self.design.design)
+        self.visit_design(self.design.design)
         return self.bom_list
@@ -1,6 +1,8 @@
 import inspect
 import os
+import sys
 from abc import abstractmethod
+from types import CodeType
 from typing import Type, Any, Optional, Mapping, Dict, List, Callable, Tuple, TypeVar, cast, Union
 
 from typing_extensions import override
@@ -19,6 +21,12 @@ from .KiCadSchematicParser import (
     KiCadSymbol,
     KiCadLibSymbol,
 )
+from .KiCadSchematicCache import KiCadSchematicCache
+
+# process-wide cache of parsed schematics, initialized on first use, optionally on-disk with EDG_SCHEMATIC_CACHE_DIR
+_schematic_cache: Optional[KiCadSchematicCache] = None
+# (schematic file path, inline HDL code) -> compiled code
+_inline_code_cache: Dict[Tuple[str, str], CodeType] = {}
 
 
 @non_library
@@ -165,6 +173,15 @@ class KiCadSchematicBlock(Block):
 
         return port
 
+    @staticmethod
+    def _compile_inline(filepath: str, inline_code: str) -> CodeType:
+        """Returns the compiled code for an inline HDL expression, cached since library schematics are
+        imported every time their block is instantiated."""
+        code = _inline_code_cache.get((filepath, inline_code))
+        if code is None:
+            code = _inline_code_cache[(filepath, inline_code)] = compile(inline_code, filepath, "eval")
+        return code
+
     def _port_from_path(self, path: str) -> Optional[BasePort]:
         """Returns the corresponding Port given a path string, recursing into bundles as needed"""
 
@@ -184,6 +201,7 @@ class KiCadSchematicBlock(Block):
     """
     Import the schematic file specified by the filepath.
     locals specifies variables available to any inline HDL.
+    eval_globals specifies the global scope for inline HDL and edg_blackbox handlers, defaulting to the caller's globals.
     nodes specifies connections to the schematic's boundary ports, where they do not match by name to this 
       Block's boundary ports
     conversions specifies port type conversions (akin to .adapt_to) for Passive-typed ports in the schematic.
@@ -200,6 +218,7 @@ class KiCadSchematicBlock(Block):
         filepath: str,
         locals: Mapping[str, Any] = {},
         *,
+        eval_globals: Optional[Dict[str, Any]] = None,
         nodes: Mapping[str, Optional[BasePort]] = {},
         conversions: Mapping[str, HasPassivePort] = {},
         auto_adapt: bool = False,
@@ -219,9 +238,14 @@ class KiCadSchematicBlock(Block):
             "edg_importable:Opamp": Opamp,
         }
 
-        with open(filepath, "r", encoding="utf-8") as file:
-            file_data = file.read()
-        sch = KiCadSchematic(file_data)
+        # use the caller's globals, since this needs to reflect the caller's imports
+        # this only gets the immediate caller frame, instead of inspect.stack() which processes the whole stack
+        container_globals = eval_globals if eval_globals is not None else sys._getframe(1).f_globals
+
+        global _schematic_cache
+        if _schematic_cache is None:
+            _schematic_cache = KiCadSchematicCache.from_env()
+        sch = _schematic_cache.load(filepath)
 
         blocks_pins: Dict[str, Mapping[str, BasePort]] = {}
 
@@ -230,7 +254,6 @@ class KiCadSchematicBlock(Block):
                 handler: Type[KiCadBlackboxBase] = KiCadBlackbox  # default
                 if "edg_blackbox" in symbol.properties:
                     handler_name = symbol.properties["edg_blackbox"]
-                    container_globals = inspect.stack()[1][0].f_globals
                     assert (
                         handler_name in container_globals
                     ), f"edg_blackbox handler {handler_name} must be imported into current global scope"
@@ -263,8 +286,7 @@ class KiCadSchematicBlock(Block):
                         assert f"Value{suffix}" in symbol.properties, f"missing Value{suffix} of Value{max_value}"
                         inline_code += "\n" + symbol.properties[f"Value{suffix}"]
 
-                # use the caller's globals, since this needs to reflect the caller's imports
-                block_model = eval(inline_code, inspect.stack()[1][0].f_globals, locals)
+                block_model = eval(self._compile_inline(filepath, inline_code), container_globals, locals)
                 block = self.Block(block_model)
                 assert isinstance(
                     block, KiCadImportableBlock
@@ -0,0 +1,73 @@
+import hashlib
+import os
+import pickle
+from typing import Dict, Optional, Tuple
+
+from ..util.CacheUtil import SourceHasher, atomic_write, cache_dir_from_env
+from . import KiCadSchematicParser
+from .KiCadSchematicParser import KiCadSchematic, SchematicOrder
+
+
+class KiCadSchematicCache:
+    """Cache of parsed schematics, so schematic blocks instantiated many times (like library subcircuits used in
+    several places, or re-instantiated on each elaboration request) only parse their schematic file once.
+
+    Schematics are cached in memory by path and order, and reloaded when the file's modification time or size changes.
+    Optionally, parsed schematics are also stored on disk as pickles keyed by the file contents, the order, and
+    the source of the parser, so they can be reused across processes.
+
+    Cached schematics are shared, and must not be modified."""
+
+    kFileSuffix = ".sch.pickle"
+
+    @staticmethod
+    def from_env() -> "KiCadSchematicCache":
+        """Returns an in-memory cache, which is also stored on disk if the EDG_SCHEMATIC_CACHE_DIR environment
+        variable is set."""
+        return KiCadSchematicCache(cache_dir_from_env("EDG_SCHEMATIC_CACHE_DIR"))
+
+    def __init__(self, cache_dir: Optional[str] = None) -> None:
+        self.cache_dir = cache_dir
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+        self.parses = 0  # number of schematics actually parsed, for testing and statistics
+        # (absolute path, order) -> ((mtime_ns, size), schematic)
+        self._schematics: Dict[Tuple[str, SchematicOrder], Tuple[Tuple[int, int], KiCadSchematic]] = {}
+        self._sources = SourceHasher()
+
+    def _disk_path(self, data: bytes, order: SchematicOrder) -> Optional[str]:
+        if self.cache_dir is None:
+            return None
+        hasher = hashlib.sha256(self._sources.module_hash(KiCadSchematicParser.__name__).encode("utf-8"))
+        hasher.update(order.value.encode("utf-8"))
+        hasher.update(data)
+        return os.path.join(self.cache_dir, hasher.hexdigest() + self.kFileSuffix)
+
+    def load(self, filepath: str, order: SchematicOrder = SchematicOrder.xy) -> KiCadSchematic:
+        """Returns the parsed schematic for the file, from the cache if up-to-date."""
+        path_key = (os.path.abspath(filepath), order)
+        stat = os.stat(filepath)
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        cached = self._schematics.get(path_key)
+        if cached is not None and cached[0] == file_key:
+            return cached[1]
+
+        with open(filepath, "rb") as f:
+            data = f.read()
+        disk_path = self._disk_path(data, order)
+        sch: Optional[KiCadSchematic] = None
+        if disk_path is not None:
+            try:
+                with open(disk_path, "rb") as f:
+                    sch = pickle.load(f)
+            except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+                sch = None
+        if sch is None:
+            sch = KiCadSchematic(data.decode("utf-8"), order)
+            self.parses += 1
+            if disk_path is not None:
+                with atomic_write(disk_path) as f:
+                    pickle.dump(sch, f, pickle.HIGHEST_PROTOCOL)
+
+        self._schematics[path_key] = (file_key, sch)
+        return sch
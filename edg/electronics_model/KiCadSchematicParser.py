@@ -1,11 +1,13 @@
 import itertools
 from enum import Enum
-from typing import List, Any, Dict, Tuple, TypeVar, Type, Set, NamedTuple, Union, Iterable, cast
+from typing import List, Any, Dict, Tuple, TypeVar, Type, NamedTuple, Union, cast
 
 import math
 import sexpdata  # type: ignore
 from typing_extensions import override
 
+from .KiCadSexpReader import read_toplevel
+
 # This defines the minimum resolvable grid, so all coordinates are rounded to integer
 # coordinates to exact position equality checks can be made without worrying about
 # float precision issues.
@@ -255,57 +257,95 @@ class SchematicOrder(Enum):
 class KiCadSchematic:
     T = TypeVar("T")
 
+    # top-level elements used in parsing, others are skipped when reading the file
+    kElements = frozenset(
+        ["lib_symbols", "symbol", "wire", "label", "global_label", "hierarchical_label", "no_connect"]
+    )
+    # graphical and other elements not used in parsing, which are skipped (at any depth) when reading the file
+    kSkippedElements = frozenset(
+        ["effects", "stroke", "fill", "uuid", "polyline", "rectangle", "circle", "arc", "bezier", "text", "instances"]
+    )
+
     @staticmethod
     def _connected_components(connected: List[List[T]]) -> List[List[T]]:
         """Given a list of connections (as a list components in that connection),
         returns the set of connected components by combining connections where components
         are connected to each other.
-        Somewhat maintains order"""
-        # transform the list of connections into an adjacency list
-        adjacency: Dict[KiCadSchematic.T, List[KiCadSchematic.T]] = {}
-        for components in connected:
+        Somewhat maintains order: components are ordered by a depth-first traversal starting from the first
+        component, where visiting a component first adds all the components in its connections (in order),
+        then traverses into them.
+
+        Runs in time linear with the total size of the connections. Components are interned as integers, and each
+        connection is only added once, and traversed with a cursor shared by all its components that skips
+        components already seen."""
+        # intern components, and build the list of connections for each component
+        ids: Dict[KiCadSchematic.T, int] = {}
+        elts: List[KiCadSchematic.T] = []
+        connections: List[List[int]] = []
+        component_connections: List[List[int]] = []  # by component id, connection indices in order
+        for connection_index, components in enumerate(connected):
+            connection = []
             for component in components:
-                adjacency.setdefault(component, []).extend(components)
-        # traverse the graph and build connected components
-        all_components = list(itertools.chain(*connected))
-        seen_components = set()
+                component_id = ids.get(component)
+                if component_id is None:
+                    component_id = ids[component] = len(elts)
+                    elts.append(component)
+                    component_connections.append([])
+                connection.append(component_id)
+                component_connections[component_id].append(connection_index)
+            connections.append(connection)
+
+        seen = [False] * len(elts)  # whether the component has been visited
+        added = [False] * len(elts)  # whether the component has been added to a connected component
+        connections_added = [False] * len(connections)  # whether all the connection's components have been added
+        connections_cursor = [0] * len(connections)  # components in the connection before this have been seen
+
+        def visit(component_id: int, connection_components: List[KiCadSchematic.T]) -> None:
+            seen[component_id] = True
+            for connection_index in component_connections[component_id]:
+                if not connections_added[connection_index]:
+                    connections_added[connection_index] = True
+                    for connected_id in connections[connection_index]:
+                        if not added[connected_id]:
+                            added[connected_id] = True
+                            connection_components.append(elts[connected_id])
+
         connected_components: List[List[KiCadSchematic.T]] = []
-        for component in all_components:
-            if component in seen_components:  # already seen and part of another connection
+        for root_id in range(len(elts)):  # ids are in order of first appearance in connected
+            if seen[root_id]:  # already seen and part of another connection
                 continue
-            connection_components = []
-
-            def traverse_component(component: KiCadSchematic.T) -> None:
-                if component in seen_components:  # already seen, don't need to traverse again
-                    return
-                seen_components.add(component)
-
-                for connected in adjacency.get(component, []):
-                    if connected not in connection_components:
-                        connection_components.append(connected)
-
-                for connected in adjacency.get(component, []):
-                    traverse_component(connected)
-
-            traverse_component(component)
+            connection_components: List[KiCadSchematic.T] = []
+            visit(root_id, connection_components)
+            stack = [(root_id, 0)]  # traversal stack of (component id, index into its connections)
+            while stack:
+                component_id, index = stack[-1]
+                component_connection_indices = component_connections[component_id]
+                next_id = None
+                while index < len(component_connection_indices):
+                    connection_index = component_connection_indices[index]
+                    connection = connections[connection_index]
+                    cursor = connections_cursor[connection_index]
+                    while cursor < len(connection) and seen[connection[cursor]]:
+                        cursor += 1
+                    connections_cursor[connection_index] = cursor
+                    if cursor < len(connection):
+                        next_id = connection[cursor]
+                        break
+                    index += 1
+
+                if next_id is not None:
+                    stack[-1] = (component_id, index)
+                    visit(next_id, connection_components)
+                    stack.append((next_id, 0))
+                else:
+                    stack.pop()
             connected_components.append(connection_components)
         return connected_components
 
-    @staticmethod
-    def _deduplicate_list(elts: Iterable[T]) -> List[T]:
-        """Deduplicates a list while preserving order, keeping the first unique element"""
-        seen: Set[KiCadSchematic.T] = set()
-        output = []
-        for elt in elts:
-            if elt not in seen:
-                output.append(elt)
-                seen.add(elt)
-        return output
-
     def __init__(self, data: str, order: SchematicOrder = SchematicOrder.xy):
-        schematic_top = sexpdata.loads(data)
-        assert parse_symbol(schematic_top[0]) == "kicad_sch"
-        sexp_dict = group_by_car(schematic_top)
+        sexp_dict: Dict[str, List[List[Any]]] = {}
+        for elt in read_toplevel(data, "kicad_sch", self.kElements, self.kSkippedElements):
+            sexp_dict.setdefault(parse_symbol(elt[0]), []).append(elt)
 
         self.lib_symbols = {
             symbol.name: symbol
@@ -369,9 +409,9 @@ class KiCadSchematic:
 
         # transform that into a list of elements
         # make sure all elements are seeded in the list
+        # elements are only at one point and points are unique within a connected component, so there are no duplicates
         nets_elts: List[List[Union[KiCadPin, KiCadTunnel, KiCadMarker]]] = [  # transform points into KiCad elements
-            self._deduplicate_list(itertools.chain(*[elts_by_point.get(point, []) for point in points]))
-            for points in wires_points
+            list(itertools.chain(*[elts_by_point.get(point, []) for point in points])) for points in wires_points
         ]
 
         # sanity check to ensure there aren't any degenerate connections
@@ -0,0 +1,136 @@
+import re
+from typing import Any, Dict, Iterator, List, Tuple, AbstractSet
+
+import sexpdata  # type: ignore
+
+# whitespace, then one of: open paren, close paren, string (with escapes), or atom
+_TOKEN_RE = re.compile(r'\s*(?:(\()|(\))|"((?:[^"\\]|\\.)*)"|([^\s()"]+))', re.DOTALL)
+_STRING_ESCAPE_RE = re.compile(r"\\.", re.DOTALL)
+# tokens that affect nesting when skipping a subtree, strings are matched so parens inside them are ignored
+_SKIP_RE = re.compile(r'[()]|"(?:[^"\\]|\\.)*"', re.DOTALL)
+_NUMBER_START = frozenset("0123456789+-.")
+_FLOAT_WORDS = frozenset(["inf", "infinity", "nan"])  # non-numeric spellings accepted by float
+
+
+def _parse_atom(token: str) -> Any:
+    """Converts an atom token to a value, with the same conventions as sexpdata."""
+    if token == "nil":
+        return []
+    elif token == "t":
+        return True
+    if token[0] in _NUMBER_START:  # avoid the cost of exceptions for the common case of symbols
+        try:
+            return int(token)
+        except ValueError:
+            try:
+                return float(token)
+            except ValueError:
+                pass
+    elif token.lower() in _FLOAT_WORDS:
+        return float(token)
+    return sexpdata.Symbol(token)
+
+
+def _parse_string(contents: str) -> str:
+    if "\\" not in contents:
+        return contents
+    return _STRING_ESCAPE_RE.sub(lambda match: sexpdata.String.unquote(match.group()), contents)
+
+
+def _skip_list(data: str, pos: int) -> int:
+    """Given the position after an opening paren, returns the position after its closing paren,
+    without parsing the contents."""
+    depth = 1
+    for match in _SKIP_RE.finditer(data, pos):
+        token = data[match.start()]
+        if token == "(":
+            depth += 1
+        elif token == ")":
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    raise ValueError("unexpected end of s-expression, missing )")
+
+
+def _peek_car(data: str, pos: int) -> str:
+    """Given the position after an opening paren, returns the list's car if it is an atom, or empty-string."""
+    match = _TOKEN_RE.match(data, pos)
+    if match is None or match.group(4) is None:
+        return ""
+    return match.group(4)
+
+
+def _parse_list(data: str, pos: int, skip: AbstractSet[str], atoms: Dict[str, Any]) -> Tuple[List[Any], int]:
+    """Given the position after an opening paren, parses the list (discarding sub-lists with a car in skip)
+    and returns it and the position after its closing paren.
+    Atom values are shared through the atoms dict (by token), since they are immutable and highly repetitive."""
+    out: List[Any] = []
+    parents: List[List[Any]] = []  # enclosing lists of out, innermost last
+    while True:
+        match = _TOKEN_RE.match(data, pos)
+        if match is None:
+            raise ValueError(f"unexpected end of s-expression at {pos}, missing )")
+        pos = match.end()
+        open_paren, close_paren, string, atom = match.groups()
+        if open_paren is not None:
+            car_match = _TOKEN_RE.match(data, pos)
+            if car_match is not None and car_match.group(4) is not None:
+                atom = car_match.group(4)
+                if atom in skip:
+                    pos = _skip_list(data, pos)
+                    continue
+                pos = car_match.end()  # consume the car here
+            else:
+                atom = None
+            parents.append(out)
+            out.append([])
+            out = out[-1]
+            if atom is None:
+                continue
+        elif close_paren is not None:
+            if not parents:
+                return out, pos
+            out = parents.pop()
+            continue
+        elif string is not None:
+            out.append(_parse_string(string))
+            continue
+
+        if atom == "nil":  # mutable, so cannot be shared
+            out.append([])
+        else:
+            value = atoms.get(atom)
+            if value is None:
+                value = atoms[atom] = _parse_atom(atom)
+            out.append(value)
+
+
+def read_toplevel(
+    data: str, root: str, keep: AbstractSet[str], skip: AbstractSet[str] = frozenset()
+) -> Iterator[List[Any]]:
+    """Reads a KiCad s-expression file of the form (root ...), yielding only the elements of the root list
+    that are lists with a car in keep, in file order. Other elements are skipped without being parsed,
+    as are nested lists (at any depth in kept elements) with a car in skip.
+    Values are represented as in sexpdata, with lists as Python lists and atoms as sexpdata.Symbol."""
+    match = _TOKEN_RE.match(data, 0)
+    if match is None or match.group(1) is None or _peek_car(data, match.end()) != root:
+        raise ValueError(f"expected s-expression starting with ({root}")
+    root_match = _TOKEN_RE.match(data, match.end())
+    assert root_match is not None  # checked by _peek_car
+    pos = root_match.end()
+    atoms: Dict[str, Any] = {}
+    while True:
+        match = _TOKEN_RE.match(data, pos)
+        if match is None:
+            raise ValueError(f"unexpected end of s-expression at {pos}, missing )")
+        pos = match.end()
+        if match.group(1) is not None:
+            car = _peek_car(data, pos)
+            if car in keep:
+                elt, pos = _parse_list(data, pos, skip, atoms)
+                yield elt
+            else:
+                pos = _skip_list(data, pos)
+        elif match.group(2) is not None:
+            return
+        # otherwise, discard atoms in the root list
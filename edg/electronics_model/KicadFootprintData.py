@@ -1,42 +1,153 @@
-from typing import Optional, List, Tuple, Dict
-
-from pydantic import RootModel, BaseModel
+import hashlib
+import json
+import mmap
 import os
+import struct
+from typing import Optional, Tuple, Dict, Union
+
+
+class FootprintIndex:
+    """Compact precompiled index of the footprint data table, mapping footprint name to area and bounding box.
+    Entries are looked up lazily by binary search over the memory-mapped file, so queries only decode the
+    entries they touch instead of parsing the entire JSON table.
 
+    Layout (little-endian): magic, sha256 of the source JSON, entry count N, then N+1 offsets (uint32) into
+    the names blob, then N entries of (area, x_min, y_min, x_max, y_max) as doubles, then the names blob with
+    UTF-8 encoded names sorted by their bytes."""
 
-class FootprintData(BaseModel):
-    area: float
-    bbox: Tuple[float, float, float, float]  # [x_min, y_min, x_max, y_max]
+    kMagic = b"EDGFPIX1"  # bump the version on format changes
+    kHeader = struct.Struct("<8s32sI")
+    kOffset = struct.Struct("<I")
+    kEntry = struct.Struct("<5d")
 
+    @classmethod
+    def write(
+        cls, path: str, source_hash: bytes, table: Dict[str, Tuple[float, Tuple[float, float, float, float]]]
+    ) -> None:
+        names = sorted(name.encode("utf-8") for name in table.keys())
+        offsets = [0]
+        for name in names:
+            offsets.append(offsets[-1] + len(name))
+        with open(path, "wb") as f:
+            f.write(cls.kHeader.pack(cls.kMagic, source_hash, len(names)))
+            f.write(struct.pack(f"<{len(offsets)}I", *offsets))
+            for name in names:
+                area, bbox = table[name.decode("utf-8")]
+                f.write(cls.kEntry.pack(area, *bbox))
+            f.write(b"".join(names))
+
+    def __init__(self, data: Union[bytes, mmap.mmap]) -> None:
+        magic, self.source_hash, self._count = self.kHeader.unpack_from(data, 0)
+        if magic != self.kMagic:
+            raise ValueError("not a footprint index")
+        self._data = data
+        self._offsets_pos = self.kHeader.size
+        self._entries_pos = self._offsets_pos + (self._count + 1) * self.kOffset.size
+        self._names_pos = self._entries_pos + self._count * self.kEntry.size
+        if len(data) != self._names_pos + self._name_offset(self._count):
+            raise ValueError("truncated footprint index")
 
-class FootprintJson(RootModel[Dict[str, FootprintData]]):  # script relpath imports are weird so this is duplicated here
-    root: dict[str, FootprintData]  # footprint name -> data
+    def _name_offset(self, index: int) -> int:
+        return int(self.kOffset.unpack_from(self._data, self._offsets_pos + index * self.kOffset.size)[0])
+
+    def _name(self, index: int) -> bytes:
+        start, end = struct.unpack_from("<2I", self._data, self._offsets_pos + index * self.kOffset.size)
+        return self._data[self._names_pos + start : self._names_pos + end]
+
+    def get(self, footprint: str) -> Optional[Tuple[float, Tuple[float, float, float, float]]]:
+        """Returns the (area, bbox) of a footprint, or None if not in the index"""
+        key = footprint.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            mid = (low + high) // 2
+            if self._name(mid) < key:
+                low = mid + 1
+            else:
+                high = mid
+        if low >= self._count or self._name(low) != key:
+            return None
+        area, x_min, y_min, x_max, y_max = self.kEntry.unpack_from(
+            self._data, self._entries_pos + low * self.kEntry.size
+        )
+        return area, (x_min, y_min, x_max, y_max)
 
 
 class FootprintDataTable:
-    _table: Optional[FootprintJson] = None
+    """Area and bounding box of KiCad footprints, from the table generated by resources/build_kicad_footprint_table.py.
+    Lookups use the precompiled index (regenerated with the JSON table by the build script) if it is up-to-date with
+    the JSON table, otherwise the JSON table is parsed."""
+
+    kJsonPath = os.path.join(os.path.dirname(__file__), "resources", "kicad_footprints.json")
+    kIndexPath = os.path.join(os.path.dirname(__file__), "resources", "kicad_footprints.idx")
+
+    _index: Optional[FootprintIndex] = None
+    _table: Optional[Dict[str, Tuple[float, Tuple[float, float, float, float]]]] = None  # fallback if index stale
+    _cache: Dict[str, Optional[Tuple[float, Tuple[float, float, float, float]]]] = {}  # looked up entries
 
     @classmethod
-    def _get_table(cls) -> FootprintJson:
-        if cls._table is None:
-            with open(os.path.join(os.path.dirname(__file__), "resources", "kicad_footprints.json"), "r") as f:
-                cls._table = FootprintJson.model_validate_json(f.read())
-        return cls._table
+    def _json_hash(cls, json_path: Optional[str] = None) -> bytes:
+        with open(json_path or cls.kJsonPath, "rb") as f:
+            return hashlib.sha256(f.read()).digest()
+
+    @classmethod
+    def _read_json(cls, json_path: Optional[str] = None) -> Dict[str, Tuple[float, Tuple[float, float, float, float]]]:
+        with open(json_path or cls.kJsonPath, "r") as f:
+            table = json.load(f)
+        return {
+            name: (
+                float(elt["area"]),
+                (float(elt["bbox"][0]), float(elt["bbox"][1]), float(elt["bbox"][2]), float(elt["bbox"][3])),
+            )
+            for name, elt in table.items()
+        }
+
+    @classmethod
+    def _load_index(cls) -> Optional[FootprintIndex]:
+        """Returns the precompiled index, or None if it does not exist or is out of date with the JSON table"""
+        try:
+            with open(cls.kIndexPath, "rb") as f:
+                index = FootprintIndex(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+        except (FileNotFoundError, ValueError, struct.error):  # ValueError includes empty files
+            return None
+        if index.source_hash != cls._json_hash():
+            return None
+        return index
+
+    @classmethod
+    def build_index(cls, json_path: Optional[str] = None, index_path: Optional[str] = None) -> None:
+        """Regenerates the precompiled index from the JSON table"""
+        FootprintIndex.write(index_path or cls.kIndexPath, cls._json_hash(json_path), cls._read_json(json_path))
+
+    @classmethod
+    def _get(cls, footprint: str) -> Optional[Tuple[float, Tuple[float, float, float, float]]]:
+        if footprint in cls._cache:
+            return cls._cache[footprint]
+        if cls._index is None and cls._table is None:
+            cls._index = cls._load_index()
+            if cls._index is None:
+                cls._table = cls._read_json()
+        if cls._index is not None:
+            elt = cls._index.get(footprint)
+        else:
+            assert cls._table is not None
+            elt = cls._table.get(footprint)
+        cls._cache[footprint] = elt
+        return elt
 
     @classmethod
     def area_of(cls, footprint: str) -> float:
         """Returns the area of a footprint, returning infinity if unavailable"""
-        elt = cls._get_table().root.get(footprint)
+        elt = cls._get(footprint)
         if elt is None:
             return float("inf")
         else:
-            return elt.area
+            return elt[0]
 
     @classmethod
     def bbox_of(cls, footprint: str) -> Optional[Tuple[float, float, float, float]]:
         """Returns the bounding box of a footprint, returning None if unavailable"""
-        elt = cls._get_table().root.get(footprint)
+        elt = cls._get(footprint)
         if elt is None:
             return None
         else:
-            return elt.bbox
+            return elt[1]
@@ -5,12 +5,16 @@ from typing_extensions import override
 from .. import edgir
 from ..core import *
 from . import footprint as kicad
-from .NetlistGenerator import NetlistTransform
+from .NetlistGenerator import Netlist
 
 
 class NetlistBackend(BaseBackend):
     @override
     def run(self, design: CompiledDesign, args: Dict[str, str] = {}) -> List[Tuple[edgir.LocalPath, str]]:
+        return self.generate(design.netlists(), args)
+
+    @staticmethod
+    def _refdes_mode(args: Dict[str, str]) -> kicad.RefdesMode:
         if set(args.keys()) - {"RefdesMode"} != set():
             raise ValueError("Invalid argument found in args")
         refdes_mode_arg = args.get("RefdesMode", "refdesPathNameValue")
@@ -20,9 +24,29 @@ class NetlistBackend(BaseBackend):
             refdes_mode = kicad.RefdesMode.PathnameAsValue
         else:
             raise ValueError(f"Invalid RefdesMode value {refdes_mode_arg}")
+        return refdes_mode
 
-        board_netlists = NetlistTransform(design).run()
+    def generate(
+        self, board_netlists: Dict[TransformUtil.Path, Netlist], args: Dict[str, str] = {}
+    ) -> List[Tuple[edgir.LocalPath, str]]:
+        """Generates netlist files from a NetlistTransform result"""
+        refdes_mode = self._refdes_mode(args)
         return [
             (netlist_path.to_local_path(), kicad.generate_netlist(netlist, refdes_mode))
             for (netlist_path, netlist) in board_netlists.items()
         ]
+
+    def write(
+        self, board_netlists: Dict[TransformUtil.Path, Netlist], filename_prefix: str, args: Dict[str, str] = {}
+    ) -> None:
+        """Writes netlist files from a NetlistTransform result directly to disk, one per board, named
+        {filename_prefix}.net for the top-level board and {filename_prefix}_{board path}.net for others"""
+        refdes_mode = self._refdes_mode(args)
+        for netlist_path, netlist in board_netlists.items():
+            path_str = edgir.local_path_to_str_list(netlist_path.to_local_path())
+            if not path_str:
+                net_filename = filename_prefix + ".net"
+            else:
+                net_filename = filename_prefix + "_" + "_".join(path_str) + ".net"
+            with open(net_filename, "w", encoding="utf-8") as net_file:
+                kicad.write_netlist(net_file, netlist, refdes_mode)
@@ -1,4 +1,4 @@
-from functools import cmp_to_key
+from collections import deque
 from itertools import chain
 from typing import *
 
@@ -148,13 +148,10 @@ class NetlistTransform(BoardScopedTransform):
                     scope_obj.assert_connected.append((src_path, dst_path))
 
         if "fp_is_footprint" in block.meta.members.node and scope_obj is not None:
-            footprint_name = self._design.get_value(path.to_tuple() + ("fp_footprint",))
-            footprint_pinning = self._design.get_value(path.to_tuple() + ("fp_pinning",))
-            mfr = self._design.get_value(path.to_tuple() + ("fp_mfr",))
-            part = self._design.get_value(path.to_tuple() + ("fp_part",))
-            value = self._design.get_value(path.to_tuple() + ("fp_value",))
-            refdes = self._design.get_value(path.to_tuple() + ("fp_refdes",))
-            lcsc_part = self._design.get_value(path.to_tuple() + ("lcsc_part",))
+            footprint_name, footprint_pinning, mfr, part, value, refdes, lcsc_part = self._design.get_values(
+                path.to_tuple(),
+                ("fp_footprint", "fp_pinning", "fp_mfr", "fp_part", "fp_value", "fp_refdes", "lcsc_part"),
+            )
 
             assert isinstance(footprint_name, str)
             assert isinstance(footprint_pinning, list)
@@ -295,18 +292,6 @@ class NetlistTransform(BoardScopedTransform):
     @staticmethod
     def name_net(net: Iterable[TransformUtil.Path], path_ordering: Dict[TransformUtil.Path, int]) -> TransformUtil.Path:
         """Names a net based on all the paths of ports and links that are part of the net."""
-        # higher criteria are preferred, True or larger number is preferred
-        CRITERIA: List[Callable[[TransformUtil.Path], Union[bool, int]]] = [
-            lambda pin: not (pin.blocks and pin.blocks[-1].startswith("(adapter)")),
-            lambda pin: not (pin.links and (pin.links[0].startswith("anon") or pin.links[0].startswith("_"))),
-            lambda pin: -len(pin.blocks),  # prefer shorter block paths
-            lambda pin: len(pin.links),  # prefer longer link paths
-            lambda pin: -len(pin.ports),  # prefer shorter (or no) port lengths
-            lambda pin: not (pin.ports and pin.ports[-1].isnumeric()),  # disprefer number-only ports
-            lambda pin: -path_ordering.get(
-                pin.port_component(must_have_port=False), len(path_ordering)
-            ),  # prefer earlier paths
-        ]
 
         def prune_net_component(path: TransformUtil.Path) -> TransformUtil.Path:
             # prune out the net interior link, if it exists
@@ -317,28 +302,20 @@ class NetlistTransform(BoardScopedTransform):
             else:
                 return path
 
-        net = map(prune_net_component, net)
-
-        def pin_name_goodness(pin1: TransformUtil.Path, pin2: TransformUtil.Path) -> int:
-            assert not pin1.params and not pin2.params
-            for test in CRITERIA:
-                pin1_result = test(pin1)
-                pin2_result = test(pin2)
-                if pin1_result == pin2_result:
-                    continue
-                if isinstance(pin1_result, bool) and isinstance(pin2_result, bool):
-                    if pin1_result:
-                        return -1
-                    else:
-                        return 1
-                elif isinstance(pin1_result, int) and isinstance(pin2_result, int):
-                    return pin2_result - pin1_result
-                else:
-                    raise ValueError("mismatched result types")
-            return 0
-
-        best_path = sorted(net, key=cmp_to_key(pin_name_goodness))[0]
-        return best_path
+        def name_key(path: TransformUtil.Path) -> Tuple[bool, bool, int, int, int, bool, int]:
+            # criteria in priority order, where lower values are preferred
+            assert not path.params
+            return (
+                bool(path.blocks and path.blocks[-1].startswith("(adapter)")),  # disprefer adapters
+                bool(path.links and (path.links[0].startswith("anon") or path.links[0].startswith("_"))),
+                len(path.blocks),  # prefer shorter block paths
+                -len(path.links),  # prefer longer link paths
+                len(path.ports),  # prefer shorter (or no) port lengths
+                bool(path.ports and path.ports[-1].isnumeric()),  # disprefer number-only ports
+                path_ordering.get(path.port_component(must_have_port=False), len(path_ordering)),  # prefer earlier
+            )
+
+        return min(map(prune_net_component, net), key=name_key)  # first of the best, like a stable sort
 
     def scope_to_netlist(self, scope: BoardScope) -> Netlist:
         path_ordering = {path: i for i, path in enumerate(self.path_traverse_order)}
@@ -347,16 +324,19 @@ class NetlistTransform(BoardScopedTransform):
         seen: Set[TransformUtil.Path] = set()
         nets: List[List[TransformUtil.Path]] = []  # lists preserve ordering
 
-        for port, conns in scope.edges.items():
+        for port in scope.edges.keys():
             if port not in seen:
-                curr_net: List[TransformUtil.Path] = []
-                frontier: List[TransformUtil.Path] = [port]  # use BFS to maintain ordering instead of simpler DFS
+                # use BFS to maintain ordering instead of simpler DFS
+                # pins are added when first queued, which is the same order as when first dequeued
+                seen.add(port)
+                curr_net: List[TransformUtil.Path] = [port]
+                frontier: Deque[TransformUtil.Path] = deque([port])
                 while frontier:
-                    pin = frontier.pop(0)
-                    if pin not in seen:
-                        seen.add(pin)
-                        curr_net.append(pin)
-                        frontier.extend(scope.edges[pin])
+                    for connected in scope.edges[frontier.popleft()]:
+                        if connected not in seen:
+                            seen.add(connected)
+                            curr_net.append(connected)
+                            frontier.append(connected)
                 nets.append(curr_net)
 
         pin_to_net: Dict[TransformUtil.Path, List[TransformUtil.Path]] = {}  # values share reference to nets
@@ -397,11 +377,14 @@ class NetlistTransform(BoardScopedTransform):
         assert isinstance(board_refdes_prefix, str)
         return Netlist(board_refdes_prefix, scope.path, netlist_footprints, netlist_nets)
 
-    def run(self) -> Dict[TransformUtil.Path, Netlist]:
-        self.transform_design(self._design.design)
-
+    def netlists(self) -> Dict[TransformUtil.Path, Netlist]:
+        """Returns the netlist for each board, after the design has been traversed"""
         return {path: self.scope_to_netlist(scope) for path, scope in self.scopes.items() if scope is not None}
 
+    def run(self) -> Dict[TransformUtil.Path, Netlist]:
+        self.visit_design(self._design.design)
+        return self.netlists()
+
 
 class PathShortener:
     """Given a bunch of blocks with full paths, determine path shortenings that eliminate
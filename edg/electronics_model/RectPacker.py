@@ -0,0 +1,108 @@
+from abc import abstractmethod
+from typing import List, Tuple
+
+from typing_extensions import override
+
+
+class RectPacker:
+    """Abstract base class for a rectangle packing strategy, which places rectangles (as (width, height)) in a region
+    starting at (0, 0) with a limited width and growing in +y, without overlap.
+    Rectangles are placed in the order given, which the caller may sort to improve packing."""
+
+    @abstractmethod
+    def pack(self, sizes: List[Tuple[float, float]], max_width: float) -> List[Tuple[float, float]]:
+        """Returns the (x, y) position of the top-left corner of each rectangle, index-aligned with sizes.
+        Rectangles wider than max_width are still placed, extending past it."""
+        raise NotImplementedError()
+
+
+class ShelfPacker(RectPacker):
+    """Places rectangles left to right in rows, where a rectangle may be stacked below the previous one if it fits
+    within that one's row. Fast, but leaves gaps where rows have uneven heights."""
+
+    @override
+    def pack(self, sizes: List[Tuple[float, float]], max_width: float) -> List[Tuple[float, float]]:
+        positions: List[Tuple[float, float]] = []
+        # track the y limits and y position of the prior elements
+        x_stack: List[Tuple[float, float, float]] = []  # [(x pos of next, y pos, y limit)]
+        for width, height in sizes:
+            if not x_stack:  # only on first component
+                next_y = 0.0
+            else:
+                next_y = x_stack[-1][1]  # y position of the next element
+
+            while True:  # advance rows as needed
+                if not x_stack:
+                    break
+                if x_stack[-1][0] + width > max_width:  # out of X space, advance a row
+                    _, _, next_y = x_stack.pop()
+                    continue
+                if next_y + height > x_stack[-1][2]:  # out of Y space, advance a row
+                    _, _, next_y = x_stack.pop()
+                    continue
+                break
+
+            if not x_stack:
+                next_x = 0.0
+            else:
+                next_x = x_stack[-1][0]
+            positions.append((next_x, next_y))
+            x_stack.append((next_x + width, next_y, next_y + height))
+        return positions
+
+
+class SkylinePacker(RectPacker):
+    """Skyline (bottom-left) packing, which tracks the lowest free y at each x as a list of segments, and places
+    each rectangle at the position along the skyline where it ends up highest (lowest y), breaking ties by x.
+    This fills gaps next to tall elements that shelf packing would leave empty.
+    Cost per rectangle is proportional to the number of skyline segments, which stays small relative to the number
+    of rectangles since placements merge and cover segments."""
+
+    kEpsilon = 1e-9  # tolerance for floating point width comparisons
+
+    @override
+    def pack(self, sizes: List[Tuple[float, float]], max_width: float) -> List[Tuple[float, float]]:
+        if not sizes:
+            return []
+        region_width = max(max_width, max(width for width, _ in sizes))
+        skyline: List[Tuple[float, float, float]] = [(0.0, region_width, 0.0)]  # (x, width, y), sorted by x
+        positions: List[Tuple[float, float]] = []
+        for width, height in sizes:
+            best_index = 0
+            best_x = 0.0
+            best_y = float("inf")
+            for i, (seg_x, _, _) in enumerate(skyline):
+                if seg_x + width > region_width + self.kEpsilon:
+                    break  # segments are sorted by x, so no later segment fits either
+                y = 0.0  # rectangle rests on the highest segment it spans
+                j = i
+                while j < len(skyline) and skyline[j][0] < seg_x + width - self.kEpsilon and y < best_y:
+                    y = max(y, skyline[j][2])
+                    j += 1
+                if y < best_y:
+                    best_index, best_x, best_y = i, seg_x, y
+            positions.append((best_x, best_y))
+            self._place(skyline, best_index, best_x, width, best_y + height)
+        return positions
+
+    @classmethod
+    def _place(cls, skyline: List[Tuple[float, float, float]], index: int, x: float, width: float, y: float) -> None:
+        """Updates the skyline with a segment of (x, width) at y, starting at the segment at index."""
+        end = index
+        x_max = x + width
+        while end < len(skyline) and skyline[end][0] + skyline[end][1] <= x_max + cls.kEpsilon:
+            end += 1  # segments fully covered by the new segment
+        replacement = [(x, width, y)]
+        if end < len(skyline):  # trim the partially covered segment, if any
+            seg_x, seg_width, seg_y = skyline[end]
+            if seg_x < x_max:
+                replacement.append((x_max, seg_x + seg_width - x_max, seg_y))
+                end += 1
+            elif seg_y == y:  # merge with the right neighbor at the same height
+                replacement[0] = (x, width + seg_width, y)
+                end += 1
+        if index > 0 and skyline[index - 1][2] == y:  # merge with the left neighbor at the same height
+            prev_x, prev_width, _ = skyline[index - 1]
+            replacement[0] = (prev_x, prev_width + replacement[0][1], y)
+            index -= 1
+        skyline[index:end] = replacement
@@ -45,5 +45,5 @@ class RefdesTransform(BoardScopedTransform):
             self.block_refdes_list.append((context.path, self.board_refdes_prefix + refdes_prefix + str(refdes_id)))
 
     def run(self) -> List[Tuple[TransformUtil.Path, str]]:
-        self.transform_design(self._design.design)
+        self.visit_design(self._design.design)
         return self.block_refdes_list
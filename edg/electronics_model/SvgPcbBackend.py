@@ -1,14 +1,15 @@
 import importlib
 import inspect
 import math
-from typing import List, Tuple, NamedTuple, Dict, Union, Set
+from typing import List, Tuple, NamedTuple, Dict, Union, Set, Optional
 
 from typing_extensions import override
 
 from .. import edgir
 from .KicadFootprintData import FootprintDataTable
 from ..core import *
-from .NetlistGenerator import NetlistTransform, NetBlock, Netlist
+from .NetlistGenerator import NetBlock, Netlist
+from .RectPacker import RectPacker, SkylinePacker
 from .SvgPcbTemplateBlock import SvgPcbTemplateBlock
 
 
@@ -20,37 +21,53 @@ class PlacedBlock(NamedTuple):
     elts: List[Tuple[Union["PlacedBlock", TransformUtil.Path], Tuple[float, float]]]  # name -> elt, (x, y)
     height: float
     width: float
+    area: float = 0.0  # total bounding box area of all footprints in this block, excluding borders
+
+    def density(self) -> float:
+        """Returns the fraction of this block's area covered by footprint bounding boxes, as a packing metric"""
+        if self.width <= 0 or self.height <= 0:
+            return 0.0
+        return self.area / (self.width * self.height)
+
+
+BBox = Tuple[float, float, float, float]  # [x_min, y_min, x_max, y_max]
 
 
 class BlackBoxBlock(NamedTuple):
     path: TransformUtil.Path
-    bbox: Tuple[float, float, float, float]
+    bbox: BBox
 
 
-def arrange_blocks(blocks: List[NetBlock], additional_blocks: List[BlackBoxBlock] = []) -> PlacedBlock:
+def arrange_blocks(
+    blocks: List[NetBlock], additional_blocks: List[BlackBoxBlock] = [], packer: Optional[RectPacker] = None
+) -> PlacedBlock:
+    """Arranges footprints (and black-box blocks, like SVGPCB templates) grouped by their top-level block,
+    packing each level with the packer (defaulting to skyline packing)."""
     FOOTPRINT_BORDER = 1  # mm
     BLOCK_BORDER = 2  # mm
+    if packer is None:
+        packer = SkylinePacker()
 
-    # create list of blocks by path
-    block_subblocks: Dict[Tuple[str, ...], List[str]] = {}  # list to maintain sortedness
-    block_footprints: Dict[Tuple[str, ...], List[Union[NetBlock, BlackBoxBlock]]] = {}
+    # create list of blocks by path, dicts as insertion-ordered sets to maintain sortedness
+    block_subblocks: Dict[Tuple[str, ...], Dict[str, None]] = {}
+    block_footprints: Dict[Tuple[str, ...], List[Tuple[Union[NetBlock, BlackBoxBlock], Optional[BBox]]]] = {}
+    footprint_bboxes: Dict[str, Optional[BBox]] = {}  # footprint name -> bbox, so each is only looked up once
 
     # for here, we only group one level deep
-    for block in blocks:
-        containing_path = block.full_path.blocks[0 : min(len(block.full_path.blocks) - 1, 1)]
-        block_footprints.setdefault(containing_path, []).append(block)
-        for i in range(len(containing_path)):
-            subblocks_list = block_subblocks.setdefault(tuple(containing_path[:i]), list())
-            if containing_path[i] not in subblocks_list:
-                subblocks_list.append(containing_path[i])
-
-    for blackbox in additional_blocks:
-        containing_path = blackbox.path.blocks[0 : min(len(blackbox.path.blocks) - 1, 1)]
-        block_footprints.setdefault(containing_path, []).append(blackbox)
+    all_blocks: List[Union[NetBlock, BlackBoxBlock]] = [*blocks, *additional_blocks]
+    for block in all_blocks:
+        if isinstance(block, NetBlock):
+            path = block.full_path
+            if block.footprint not in footprint_bboxes:
+                footprint_bboxes[block.footprint] = FootprintDataTable.bbox_of(block.footprint)
+            bbox = footprint_bboxes[block.footprint]
+        else:
+            path = block.path
+            bbox = block.bbox
+        containing_path = path.blocks[0 : min(len(path.blocks) - 1, 1)]
+        block_footprints.setdefault(containing_path, []).append((block, bbox))
         for i in range(len(containing_path)):
-            subblocks_list = block_subblocks.setdefault(tuple(containing_path[:i]), list())
-            if containing_path[i] not in subblocks_list:
-                subblocks_list.append(containing_path[i])
+            block_subblocks.setdefault(tuple(containing_path[:i]), {})[containing_path[i]] = None
 
     def arrange_hierarchy(root: Tuple[str, ...]) -> PlacedBlock:
         """Recursively arranges the immediate components of a hierarchy, treating each element
@@ -58,69 +75,42 @@ def arrange_blocks(blocks: List[NetBlock], additional_blocks: List[BlackBoxBlock
         # TODO don't count borders as part of a block's width / height
         ASPECT_RATIO = 16 / 9
 
-        sub_placed: List[Tuple[float, float, Union[PlacedBlock, NetBlock, BlackBoxBlock]]] = (
+        sub_placed: List[Tuple[float, float, Union[PlacedBlock, NetBlock, BlackBoxBlock], Optional[BBox]]] = (
             []
-        )  # (width, height, entry)
-        for subblock in block_subblocks.get(root, list()):
+        )  # (width, height, entry, footprint bbox)
+        area = 0.0
+        for subblock in block_subblocks.get(root, {}):
             subplaced = arrange_hierarchy(root + (subblock,))
-            sub_placed.append((subplaced.width + BLOCK_BORDER, subplaced.height + BLOCK_BORDER, subplaced))
-
-        for footprint in block_footprints.get(root, []):
-            if isinstance(footprint, NetBlock):
-                bbox = FootprintDataTable.bbox_of(footprint.footprint) or (1, 1, 1, 1)
-                entry: Union[PlacedBlock, NetBlock, BlackBoxBlock] = footprint
-            elif isinstance(footprint, BlackBoxBlock):
-                bbox = footprint.bbox
-                entry = footprint
-            else:
-                raise TypeError()
-            width = bbox[2] - bbox[0] + FOOTPRINT_BORDER
-            height = bbox[3] - bbox[1] + FOOTPRINT_BORDER
-            # use refdes as key so it's globally unique, for when this is run with blocks grouped together
-            sub_placed.append((width, height, entry))
+            sub_placed.append((subplaced.width + BLOCK_BORDER, subplaced.height + BLOCK_BORDER, subplaced, None))
+            area += subplaced.area
+
+        for footprint, bbox in block_footprints.get(root, []):
+            size_bbox = bbox or (1, 1, 1, 1)
+            width = size_bbox[2] - size_bbox[0] + FOOTPRINT_BORDER
+            height = size_bbox[3] - size_bbox[1] + FOOTPRINT_BORDER
+            sub_placed.append((width, height, footprint, bbox))
+            area += (width - FOOTPRINT_BORDER) * (height - FOOTPRINT_BORDER)
 
-        total_area = sum(width * height for width, height, _ in sub_placed)
+        total_area = sum(width * height for width, height, _, _ in sub_placed)
         max_width = math.sqrt(total_area * ASPECT_RATIO)
 
+        sub_placed.sort(key=lambda x: -x[1])  # by height
+        positions = packer.pack([(width, height) for width, height, _, _ in sub_placed], max_width)
+
         x_max = 0.0
         y_max = 0.0
-        # track the y limits and y position of the prior elements
-        x_stack: List[Tuple[float, float, float]] = []  # [(x pos of next, y pos, y limit)]
         elts: List[Tuple[Union[PlacedBlock, TransformUtil.Path], Tuple[float, float]]] = []
-        for width, height, entry in sorted(sub_placed, key=lambda x: -x[1]):  # by height
-            if not x_stack:  # only on first component
-                next_y = 0.0
-            else:
-                next_y = x_stack[-1][1]  # y position of the next element
-
-            while True:  # advance rows as needed
-                if not x_stack:
-                    break
-                if x_stack[-1][0] + width > max_width:  # out of X space, advance a row
-                    _, _, next_y = x_stack.pop()
-                    continue
-                if next_y + height > x_stack[-1][2]:  # out of Y space, advance a row
-                    _, _, next_y = x_stack.pop()
-                    continue
-                break
-
-            if not x_stack:
-                next_x = 0.0
-            else:
-                next_x = x_stack[-1][0]
-
+        for (width, height, entry, bbox), (next_x, next_y) in zip(sub_placed, positions):
             if isinstance(entry, PlacedBlock):  # assumed (0, 0) at top left
                 elts.append((entry, (next_x, next_y)))
             elif isinstance(entry, NetBlock):  # account for footprint origin, flipping y-axis
-                bbox = FootprintDataTable.bbox_of(entry.footprint) or (0, 0, 0, 0)
+                bbox = bbox or (0, 0, 0, 0)
                 elts.append((entry.full_path, (next_x - bbox[0], next_y + bbox[3])))
             elif isinstance(entry, BlackBoxBlock):  # account for footprint origin, flipping y-axis
-                bbox = entry.bbox
-                elts.append((entry.path, (next_x - bbox[0], next_y - bbox[0])))
-            x_stack.append((next_x + width, next_y, next_y + height))
+                elts.append((entry.path, (next_x - entry.bbox[0], next_y - entry.bbox[0])))
             x_max = max(x_max, next_x + width)
             y_max = max(y_max, next_y + height)
-        return PlacedBlock(elts=elts, width=x_max, height=y_max)
+        return PlacedBlock(elts=elts, width=x_max, height=y_max, area=area)
 
     return arrange_hierarchy(())
 
@@ -183,18 +173,19 @@ class SvgPcbTransform(TransformUtil.Transform):
             pass
 
     def run(self) -> List[SvgPcbGeneratedBlock]:
-        self.transform_design(self.design.design)
+        self.visit_design(self.design.design)
         return self._svgpcb_blocks
 
 
 class SvgPcbBackend(BaseBackend):
     @override
     def run(self, design: CompiledDesign, args: Dict[str, str] = {}) -> List[Tuple[edgir.LocalPath, str]]:
-        netlist = NetlistTransform(design).run()[TransformUtil.Path.empty()]  # only generate for top-level board
-        result = self._generate(design, netlist)
+        netlist = design.netlist()  # only for top-level board
+        assert netlist is not None, "design has no top-level board"
+        result = self.generate(design, netlist)
         return [(edgir.LocalPath(), result)]
 
-    def _generate(self, design: CompiledDesign, netlist: Netlist) -> str:
+    def generate(self, design: CompiledDesign, netlist: Netlist) -> str:
         """Generates SVBPCB fragments as a structured result"""
 
         def block_matches_prefixes(block: NetBlock, prefixes: List[Tuple[str, ...]]) -> bool:
@@ -213,7 +204,6 @@ class SvgPcbBackend(BaseBackend):
         svgpcb_block_bboxes = [BlackBoxBlock(block.path, block.bbox) for block in svgpcb_blocks]
 
         # handle footprints
-        netlist = NetlistTransform(design).run()[TransformUtil.Path.empty()]  # only generate for top-level board
         svgpcb_block_prefixes = [block.path.to_tuple() for block in svgpcb_blocks]
         other_blocks = filter_blocks_by_pathname(netlist.blocks, svgpcb_block_prefixes)
         arranged_blocks = arrange_blocks(other_blocks, svgpcb_block_bboxes)
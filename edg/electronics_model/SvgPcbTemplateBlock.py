@@ -28,7 +28,7 @@ class SvgPcbTemplateBlock(Block):
         self._svgpcb_pathname_data = pathname
         self._svgpcb_design = design
         self._svgpcb_netlist = netlist
-        self._svgpcb_ref_map = self._create_ref_map(pathname.to_local_path())
+        self._svgpcb_ref_map = self._create_ref_map(pathname.to_tuple())
 
     def _svgpcb_pathname(self) -> str:
         """Infrastructure method, returns the pathname for this Block as a JS-code-friendly string."""
@@ -1,6 +1,7 @@
+import io
 import zlib  # for deterministic hash
 from enum import Enum, auto
-from typing import List
+from typing import List, TextIO
 
 from .NetlistGenerator import Netlist, NetBlock, Net, PathShortener
 from .. import edgir
@@ -86,8 +87,8 @@ def gen_block_prop_edg(block: NetBlock, short_path: List[str]) -> str:
     )
 
 
-def block_exp(blocks: List[NetBlock], shortener: PathShortener, refdes_mode: RefdesMode) -> str:
-    """Generate the blocks section of the netlist from a list of blocks.
+def write_block_exp(f: TextIO, blocks: List[NetBlock], shortener: PathShortener, refdes_mode: RefdesMode) -> None:
+    """Write the blocks section of the netlist from a list of blocks.
 
     Example:
     (components
@@ -100,35 +101,33 @@ def block_exp(blocks: List[NetBlock], shortener: PathShortener, refdes_mode: Ref
     (footprint OptoDevice:R_LDR_4.9x4.2mm_P2.54mm_Vertical)
     (tstamp R3))
     """
-    result = "(components"
+    f.write("(components")
     for block in blocks:
         short_path, short_class = shortener.shorten(block.full_path, block.path_classes)
-        result += (
-            "\n"
-            + gen_block_comp(block.refdes)
-            + "\n"
-            + "  "
-            + gen_block_value(block, short_path, refdes_mode)
-            + "\n"
-            + "  "
-            + gen_block_footprint(block.footprint)
-            + "\n"
-            + "  "
-            + gen_block_prop_sheetname(short_path)
-            + "\n"
-            + "  "
-            + gen_block_prop_sheetfile(short_class)
-            + "\n"
-            + "  "
-            + gen_block_prop_edg(block, short_path)
-            + "\n"
-            + "  "
-            + gen_block_sheetpath(short_path[:-1])
-            + "\n"
-            + "  "
-            + gen_block_tstamp(short_path)
-        )
-    return result + ")"
+        f.write("\n")
+        f.write(gen_block_comp(block.refdes))
+        f.write("\n  ")
+        f.write(gen_block_value(block, short_path, refdes_mode))
+        f.write("\n  ")
+        f.write(gen_block_footprint(block.footprint))
+        f.write("\n  ")
+        f.write(gen_block_prop_sheetname(short_path))
+        f.write("\n  ")
+        f.write(gen_block_prop_sheetfile(short_class))
+        f.write("\n  ")
+        f.write(gen_block_prop_edg(block, short_path))
+        f.write("\n  ")
+        f.write(gen_block_sheetpath(short_path[:-1]))
+        f.write("\n  ")
+        f.write(gen_block_tstamp(short_path))
+    f.write(")")
+
+
+def block_exp(blocks: List[NetBlock], shortener: PathShortener, refdes_mode: RefdesMode) -> str:
+    """Generate the blocks section of the netlist as a string, see write_block_exp."""
+    f = io.StringIO()
+    write_block_exp(f, blocks, shortener, refdes_mode)
+    return f.getvalue()
 
 
 ###############################################################################################################################################################################################
@@ -144,8 +143,11 @@ def gen_net_pin(block_name: str, pin_name: str) -> str:
     return "(node (ref {}) (pin {}))".format(block_name, pin_name)
 
 
-def net_exp(refdes_prefix: str, subboard: TransformUtil.Path, nets: List[Net], blocks: List[NetBlock]) -> str:
-    """Given a dictionary of net names (strings) as keys and a list of connected Pins (namedtuples) as corresponding values
+def write_net_exp(
+    f: TextIO, refdes_prefix: str, subboard: TransformUtil.Path, nets: List[Net], blocks: List[NetBlock]
+) -> None:
+    """Given a dictionary of net names (strings) as keys and a list of connected Pins (namedtuples) as corresponding values,
+    write the nets section of the netlist
 
     Example:
     (nets
@@ -160,18 +162,27 @@ def net_exp(refdes_prefix: str, subboard: TransformUtil.Path, nets: List[Net], b
     """
     block_dict = {block.full_path: block for block in blocks}
 
-    result = "(nets"
+    f.write("(nets")
     for i, net in enumerate(nets):
         # apply subboard block and refdes prefix to ensure uniqueness when panelizing designs
         net_name = net.name
         if subboard.blocks:
             net_name = f"{subboard}_{net_name}"
         net_name = f"{refdes_prefix}{net_name}"
-        result += "\n" + gen_net_header(i + 1, net_name)
+        f.write("\n")
+        f.write(gen_net_header(i + 1, net_name))
         for pin in net.pins:
-            result += "\n  " + gen_net_pin(block_dict[pin.block_path].refdes, pin.pin_name)
-        result += ")"
-    return result + ")"
+            f.write("\n  ")
+            f.write(gen_net_pin(block_dict[pin.block_path].refdes, pin.pin_name))
+        f.write(")")
+    f.write(")")
+
+
+def net_exp(refdes_prefix: str, subboard: TransformUtil.Path, nets: List[Net], blocks: List[NetBlock]) -> str:
+    """Generate the nets section of the netlist as a string, see write_net_exp."""
+    f = io.StringIO()
+    write_net_exp(f, refdes_prefix, subboard, nets, blocks)
+    return f.getvalue()
 
 
 ###############################################################################################################################################################################################
@@ -179,14 +190,19 @@ def net_exp(refdes_prefix: str, subboard: TransformUtil.Path, nets: List[Net], b
 """4. Generate Full Netlist"""
 
 
-def generate_netlist(netlist: Netlist, refdes_mode: RefdesMode) -> str:
+def write_netlist(f: TextIO, netlist: Netlist, refdes_mode: RefdesMode) -> None:
+    """Writes the full netlist to a text stream (like a file or io.StringIO) incrementally, without building
+    the entire netlist in memory."""
     shortener = PathShortener(list(netlist.blocks))
-    return (
-        gen_header()
-        + "\n"
-        + block_exp(netlist.blocks, shortener, refdes_mode)
-        + "\n"
-        + net_exp(netlist.refdes_prefix, netlist.subboard, netlist.nets, netlist.blocks)
-        + "\n"
-        + ")"
-    )
+    f.write(gen_header())
+    f.write("\n")
+    write_block_exp(f, netlist.blocks, shortener, refdes_mode)
+    f.write("\n")
+    write_net_exp(f, netlist.refdes_prefix, netlist.subboard, netlist.nets, netlist.blocks)
+    f.write("\n)")
+
+
+def generate_netlist(netlist: Netlist, refdes_mode: RefdesMode) -> str:
+    f = io.StringIO()
+    write_netlist(f, netlist, refdes_mode)
+    return f.getvalue()
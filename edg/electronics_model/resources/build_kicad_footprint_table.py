@@ -1,9 +1,11 @@
 """
 Utility script that crawls a local KiCad installation's library files and builds the table of footprint area.
-This file is pregenerated and committed to the repository, and used by the parts tables.
+This file (and the precompiled index derived from it) is pregenerated and committed to the repository,
+and used by the parts tables.
 """
 
 import os
+import sys
 from typing import Dict, List, Tuple, Any, Optional
 import sexpdata  # type: ignore
 from pydantic import RootModel, BaseModel
@@ -18,6 +20,7 @@ KICAD_FP_DIRECTORIES = [
     os.path.join(os.path.dirname(__file__), "..", "..", "..", "..", "footprints", "OPL_Kicad_Library"),
 ]
 OUTPUT_FILE = "kicad_footprints.json"
+OUTPUT_INDEX_FILE = "kicad_footprints.idx"
 
 
 Point = Tuple[float, float]
@@ -156,3 +159,8 @@ if __name__ == "__main__":
     json = FootprintJson(fp_data_dict)
     with open(OUTPUT_FILE, "w") as f:
         f.write(json.model_dump_json(indent=2))
+
+    sys.path.append(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+    from edg.electronics_model.KicadFootprintData import FootprintDataTable
+
+    FootprintDataTable.build_index(OUTPUT_FILE, OUTPUT_INDEX_FILE)
@@ -0,0 +1,39 @@
+import json
+import os
+import tempfile
+import unittest
+
+from .KicadFootprintData import FootprintDataTable, FootprintIndex
+
+
+class FootprintDataTableTest(unittest.TestCase):
+    def test_index_current(self) -> None:
+        # if this fails, regenerate the index with FootprintDataTable.build_index()
+        self.assertIsNotNone(FootprintDataTable._load_index(), "footprint index out of date with JSON table")
+
+    def test_lookup(self) -> None:
+        with open(FootprintDataTable.kJsonPath) as f:
+            table = json.load(f)
+        for name in ["Resistor_SMD:R_0603_1608Metric", "Package_QFP:LQFP-48-1EP_7x7mm_P0.5mm_EP3.6x3.6mm"]:
+            self.assertEqual(FootprintDataTable.area_of(name), table[name]["area"])
+            self.assertEqual(FootprintDataTable.bbox_of(name), tuple(table[name]["bbox"]))
+        self.assertEqual(FootprintDataTable.area_of("Resistor_SMD:missing"), float("inf"))
+        self.assertIsNone(FootprintDataTable.bbox_of("Resistor_SMD:missing"))
+
+    def test_index(self) -> None:
+        table = {
+            "b": (2.0, (-1.0, -1.0, 1.0, 1.0)),
+            "a": (1.5, (0.0, 0.5, 1.0, 2.0)),
+            "µ": (3.0, (0.0, 0.0, 1.5, 2.0)),  # non-ascii names
+        }
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, "test.idx")
+            FootprintIndex.write(path, b"\x01" * 32, table)
+            with open(path, "rb") as f:
+                index = FootprintIndex(f.read())
+        self.assertEqual(index.source_hash, b"\x01" * 32)
+        for name, elt in table.items():
+            self.assertEqual(index.get(name), elt)
+        self.assertIsNone(index.get(""))
+        self.assertIsNone(index.get("aa"))
+        self.assertIsNone(index.get("z"))
@@ -54,6 +54,18 @@ class KiCadInlineBlock(KiCadSchematicBlock):
         self.import_kicad(self.file_path("resources", "test_kicad_import_inline.kicad_sch"))
 
 
+class KiCadInlineGlobalsBlock(KiCadSchematicBlock):
+    """Block using inline Python in the symbol value, with an explicit global scope instead of the caller's."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.PORT_A = self.Port(Passive())
+        self.import_kicad(
+            self.file_path("resources", "test_kicad_import_inline.kicad_sch"),
+            eval_globals={"Resistor": Resistor, "Capacitor": Capacitor, "Ohm": Ohm, "uFarad": uFarad, "Volt": Volt},
+        )
+
+
 class KiCadInlineBlockBadMultiline(KiCadSchematicBlock):
     """Schematic with bad multiline definition, starting before Value2"""
 
@@ -158,6 +170,9 @@ class KiCadImportProtoTestCase(unittest.TestCase):
     def test_inline_block(self) -> None:
         self.check_connectivity(KiCadInlineBlock)
 
+    def test_inline_globals_block(self) -> None:
+        self.check_connectivity(KiCadInlineGlobalsBlock)
+
     def test_inline_badmultiline(self) -> None:
         with self.assertRaises(AssertionError):
             self.check_connectivity(KiCadInlineBlockBadMultiline)
@@ -0,0 +1,48 @@
+import os
+import shutil
+import tempfile
+import unittest
+
+from typing_extensions import override
+
+from .KiCadSchematicCache import KiCadSchematicCache
+from .KiCadSchematicParser import SchematicOrder
+from .test_kicad_schematic_parser import net_to_tuple
+
+
+class KiCadSchematicCacheTest(unittest.TestCase):
+    @override
+    def setUp(self) -> None:
+        self.dir = tempfile.TemporaryDirectory()
+        self.filepath = os.path.join(self.dir.name, "test.kicad_sch")
+        shutil.copyfile(
+            os.path.join(os.path.dirname(__file__), "resources", "test_kicad_import.kicad_sch"), self.filepath
+        )
+
+    @override
+    def tearDown(self) -> None:
+        self.dir.cleanup()
+
+    def test_memory(self) -> None:
+        cache = KiCadSchematicCache()
+        sch = cache.load(self.filepath)
+        self.assertIs(cache.load(self.filepath), sch)
+        self.assertEqual(cache.parses, 1)
+
+        self.assertIsNot(cache.load(self.filepath, SchematicOrder.file), sch)  # order is part of the key
+        self.assertEqual(cache.parses, 2)
+
+        os.utime(self.filepath, ns=(0, 0))  # modified file
+        self.assertIsNot(cache.load(self.filepath), sch)
+        self.assertEqual(cache.parses, 3)
+
+    def test_disk(self) -> None:
+        cache_dir = os.path.join(self.dir.name, "cache")
+        sch = KiCadSchematicCache(cache_dir).load(self.filepath)
+
+        cache = KiCadSchematicCache(cache_dir)  # simulate a new process
+        loaded = cache.load(self.filepath)
+        self.assertEqual(cache.parses, 0)
+        self.assertEqual([net_to_tuple(net) for net in loaded.nets], [net_to_tuple(net) for net in sch.nets])
+        self.assertEqual([symbol.refdes for symbol in loaded.symbols], [symbol.refdes for symbol in sch.symbols])
+        self.assertEqual(loaded.lib_symbols.keys(), sch.lib_symbols.keys())
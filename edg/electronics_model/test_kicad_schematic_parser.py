@@ -119,3 +119,14 @@ class KiCadSchematicParserTest(unittest.TestCase):
         nets = [net_to_tuple(x) for x in sch.nets]
 
         self.assertIn(({(KiCadGlobalLabel, "a"), (KiCadGlobalLabel, "b")}, set()), nets)
+
+    def test_connected_components(self) -> None:
+        self.assertEqual(
+            KiCadSchematic._connected_components([[1, 2], [3], [2, 4], [5, 3], [6, 6]]),
+            [[1, 2, 4], [3, 5], [6]],
+        )
+
+    def test_connected_components_long(self) -> None:
+        # long chains previously exceeded the recursion limit
+        chain = KiCadSchematic._connected_components([[i, i + 1] for i in range(10000)])
+        self.assertEqual(chain, [list(range(10001))])
@@ -0,0 +1,34 @@
+import os
+import unittest
+
+import sexpdata  # type: ignore
+
+from .KiCadSchematicParser import group_by_car
+from .KiCadSexpReader import read_toplevel
+
+
+class KiCadSexpReaderTest(unittest.TestCase):
+    def test_values(self) -> None:
+        elts = list(read_toplevel('(top (a "str" sym 1 -2.5 "esc\\"aped\\\\" "(paren") (b))', "top", {"a"}))
+        self.assertEqual(elts, [[sexpdata.Symbol("a"), "str", sexpdata.Symbol("sym"), 1, -2.5, 'esc"aped\\', "(paren"]])
+
+    def test_skip(self) -> None:
+        data = '(top (a (keep 1) (skip (keep 2) ")(") (keep 3)) (other (a 4)) (a))'
+        elts = list(read_toplevel(data, "top", {"a"}, {"skip"}))
+        keep = sexpdata.Symbol("keep")
+        self.assertEqual(elts, [[sexpdata.Symbol("a"), [keep, 1], [keep, 3]], [sexpdata.Symbol("a")]])
+
+    def test_errors(self) -> None:
+        with self.assertRaises(ValueError):
+            list(read_toplevel("(other (a))", "top", {"a"}))
+        with self.assertRaises(ValueError):
+            list(read_toplevel("(top (a (b)", "top", {"a"}))
+        with self.assertRaises(ValueError):
+            list(read_toplevel("(top (c (b)", "top", {"a"}))
+
+    def test_matches_sexpdata(self) -> None:
+        with open(os.path.join(os.path.dirname(__file__), "resources", "test_kicad_import.kicad_sch"), "r") as f:
+            data = f.read()
+        keep = {"lib_symbols", "symbol", "wire", "label", "global_label"}
+        expected = [elt for car, elts in group_by_car(sexpdata.loads(data)).items() if car in keep for elt in elts]
+        self.assertCountEqual(list(read_toplevel(data, "kicad_sch", keep)), expected)
@@ -1,7 +1,9 @@
 import unittest
+from typing import Dict, List
 
-from ..core import TransformUtil
-from .NetlistGenerator import NetlistTransform
+from .. import edgir
+from ..core import TransformUtil, CompiledDesign
+from .NetlistGenerator import NetlistTransform, BoardScope, NetPin
 
 
 class NetlistNameTestCase(unittest.TestCase):
@@ -14,3 +16,49 @@ class NetlistNameTestCase(unittest.TestCase):
         self.assertEqual(NetlistTransform.name_net([path_block, path_portb, path_porta, path_link], order), path_link)
         self.assertEqual(NetlistTransform.name_net([path_block, path_portb, path_porta], order), path_block)
         self.assertEqual(NetlistTransform.name_net([path_portb, path_porta], order), path_porta)
+
+    def test_net_name_criteria(self) -> None:
+        root = TransformUtil.Path.empty()
+        adapter_port = root.append_block("(adapter)x").append_port("a")
+        block_port = root.append_block("block", "inner").append_port("a")
+        self.assertEqual(NetlistTransform.name_net([adapter_port, block_port], {}), block_port)  # no adapters
+
+        anon_link = root.append_link("anon_link")
+        named_link = root.append_link("named", "inner")
+        self.assertEqual(NetlistTransform.name_net([anon_link, block_port, named_link], {}), named_link)
+        self.assertEqual(NetlistTransform.name_net([anon_link, block_port], {}), block_port)
+
+        numbered_port = root.append_block("block").append_port("1")
+        named_port = root.append_block("block").append_port("a")
+        self.assertEqual(NetlistTransform.name_net([numbered_port, named_port], {}), named_port)
+
+        net_port = root.append_block("block").append_port("a", "net")  # interior net is pruned
+        self.assertEqual(NetlistTransform.name_net([net_port, numbered_port], {}), named_port)
+
+
+class NetlistNetsTestCase(unittest.TestCase):
+    def test_net_ordering(self) -> None:
+        root = TransformUtil.Path.empty()
+        ports = [root.append_block(f"b{i}").append_port("a") for i in range(2000)]
+        edges: Dict[TransformUtil.Path, List[TransformUtil.Path]] = {port: [] for port in ports}
+        for port1, port2 in zip(ports[:-1], ports[1:]):  # long chain, so nets are built in breadth-first order
+            edges[port1].append(port2)
+            edges[port2].append(port1)
+        edges[ports[0]].append(ports[-1])
+        edges[ports[-1]].append(ports[0])
+        scope = BoardScope(root, {}, edges, {port: [NetPin(port.block_component(), "1")] for port in ports}, [])
+
+        transform = NetlistTransform(CompiledDesign(edgir.Design(), [], [], []))
+        transform.path_traverse_order = [path for port in ports for path in (port.block_component(), port)]
+        nets = transform.scope_to_netlist(scope).nets
+        self.assertEqual(len(nets), 1)
+        self.assertEqual(nets[0].name, "b0.a")
+        expected_order = (
+            [ports[0], ports[1], ports[-1]]
+            + [  # interleaved from both ends
+                port for pair in zip(ports[2:1000], reversed(ports[1001:-1])) for port in pair
+            ]
+            + [ports[1000]]
+        )
+        self.assertEqual(nets[0].ports, expected_order)
+        self.assertEqual([pin.block_path for pin in nets[0].pins], [port.block_component() for port in ports])
@@ -0,0 +1,48 @@
+import io
+import os
+import tempfile
+import unittest
+
+from .. import edgir
+from ..core import TransformUtil
+from . import footprint as kicad
+from .NetlistBackend import NetlistBackend
+from .NetlistGenerator import Netlist, NetBlock, Net, NetPin
+
+
+class NetlistWriterTest(unittest.TestCase):
+    R1_PATH = TransformUtil.Path.empty().append_block("r1")
+    R2_PATH = TransformUtil.Path.empty().append_block("r2")
+    BLOCK_CLASS = edgir.LibraryPath(target=edgir.LocalStep(name="Resistor"))
+    NETLIST = Netlist(
+        "",
+        TransformUtil.Path.empty(),
+        [
+            NetBlock("R_0603", "R1", "", "1k", R1_PATH, [BLOCK_CLASS]),
+            NetBlock("R_0603", "R2", "", "2k", R2_PATH, [BLOCK_CLASS]),
+        ],
+        [
+            Net("a", [NetPin(R1_PATH, "1")], []),
+            Net("b", [NetPin(R1_PATH, "2"), NetPin(R2_PATH, "1")], []),
+        ],
+    )
+
+    def test_write_netlist(self) -> None:
+        f = io.StringIO()
+        kicad.write_netlist(f, self.NETLIST, kicad.RefdesMode.Conventional)
+        netlist_str = f.getvalue()
+        self.assertEqual(netlist_str, kicad.generate_netlist(self.NETLIST, kicad.RefdesMode.Conventional))
+        self.assertTrue(netlist_str.startswith('(export (version D)\n(components\n(comp (ref "R1")'))
+        self.assertIn('(net (code 2) (name "b")\n  (node (ref R1) (pin 2))\n  (node (ref R2) (pin 1)))', netlist_str)
+        self.assertTrue(netlist_str.endswith(")\n)"))
+
+    def test_backend_write(self) -> None:
+        board_netlists = {
+            TransformUtil.Path.empty(): self.NETLIST,
+            TransformUtil.Path.empty().append_block("sub"): self.NETLIST,
+        }
+        with tempfile.TemporaryDirectory() as temp_dir:
+            NetlistBackend().write(board_netlists, os.path.join(temp_dir, "board"), {"RefdesMode": "refdes"})
+            self.assertEqual(sorted(os.listdir(temp_dir)), ["board.net", "board_sub.net"])
+            with open(os.path.join(temp_dir, "board_sub.net"), encoding="utf-8") as f:
+                self.assertEqual(f.read(), NetlistBackend().generate(board_netlists, {"RefdesMode": "refdes"})[1][1])
@@ -42,6 +42,8 @@ class PartPlacerTestCase(unittest.TestCase):
         self.assertEqual(arranged.elts[2][0], TransformUtil.Path.empty().append_block("R2"))
         self.assertAlmostEqual(arranged.elts[2][1][0], 12.78, places=2)
         self.assertAlmostEqual(arranged.elts[2][1][1], 3.19, places=2)
+        self.assertAlmostEqual(arranged.area, 10.3**2 + 2 * 2.96 * 1.46, places=1)  # from footprint bboxes
+        self.assertAlmostEqual(arranged.density(), arranged.area / (arranged.width * arranged.height))
 
     def test_placement_hierarchical(self) -> None:
         u1 = NetBlock(
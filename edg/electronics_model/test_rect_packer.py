@@ -0,0 +1,45 @@
+import random
+import unittest
+from typing import List, Tuple
+
+from .RectPacker import RectPacker, ShelfPacker, SkylinePacker
+
+
+class RectPackerTest(unittest.TestCase):
+    def check_packing(
+        self, packer: RectPacker, sizes: List[Tuple[float, float]], max_width: float
+    ) -> List[Tuple[float, float]]:
+        """Packs and checks that rectangles are within the width and do not overlap, returning the positions"""
+        positions = packer.pack(sizes, max_width)
+        self.assertEqual(len(positions), len(sizes))
+        rects = [(x, y, x + width, y + height) for (x, y), (width, height) in zip(positions, sizes)]
+        for i, (x0, y0, x1, y1) in enumerate(rects):
+            self.assertGreaterEqual(x0, 0)
+            self.assertGreaterEqual(y0, 0)
+            self.assertLessEqual(x1, max(max_width, sizes[i][0]) + 1e-6)
+            for ox0, oy0, ox1, oy1 in rects[i + 1 :]:
+                overlaps = x0 < ox1 - 1e-6 and ox0 < x1 - 1e-6 and y0 < oy1 - 1e-6 and oy0 < y1 - 1e-6
+                self.assertFalse(overlaps, f"{(x0, y0, x1, y1)} overlaps {(ox0, oy0, ox1, oy1)}")
+        return positions
+
+    def test_skyline(self) -> None:
+        # tall element on the left, then a row of short elements that fill the space to its right
+        positions = self.check_packing(SkylinePacker(), [(4, 4), (2, 1), (2, 1), (2, 1), (2, 1)], 8)
+        self.assertEqual(positions, [(0, 0), (4, 0), (6, 0), (4, 1), (6, 1)])
+
+    def test_skyline_fills_gaps(self) -> None:
+        # the shelf packer starts a new row below the tallest element, skyline fits it partially beside
+        sizes: List[Tuple[float, float]] = [(4, 4), (3, 3), (3, 3)]
+        self.assertEqual(self.check_packing(ShelfPacker(), sizes, 8), [(0, 0), (4, 0), (0, 4)])
+        self.assertEqual(self.check_packing(SkylinePacker(), sizes, 8), [(0, 0), (4, 0), (4, 3)])
+
+    def test_oversize(self) -> None:
+        positions = self.check_packing(SkylinePacker(), [(10, 1), (1, 1)], 5)
+        self.assertEqual(positions, [(0, 0), (0, 1)])
+
+    def test_random(self) -> None:
+        rng = random.Random(0)
+        sizes = [(rng.uniform(0.5, 10), rng.uniform(0.5, 10)) for _ in range(300)]
+        sizes.sort(key=lambda size: -size[1])
+        self.check_packing(ShelfPacker(), sizes, 80)
+        self.check_packing(SkylinePacker(), sizes, 80)
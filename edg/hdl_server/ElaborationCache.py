@@ -0,0 +1,210 @@
+import hashlib
+import importlib
+import os
+from typing import Dict, Iterator, Optional, Type, TypeVar, Tuple, List
+
+import google.protobuf as protobuf
+
+from .. import edgir
+from .. import edgrpc
+from ..core import LibraryElement
+from ..util.CacheUtil import SourceHasher, atomic_write, cache_dir_from_env, files_stat_hash
+
+CachedMessageType = TypeVar("CachedMessageType", bound=protobuf.message.Message)
+
+
+class ElaborationCache:
+    """Persistent, content-addressed on-disk cache of elaborated library elements and generator results,
+    so unchanged elements can be served without instantiating any Python objects.
+
+    Entries are keyed by the request (library path and generator values) and the source of the modules defining
+    the element's class and all its superclasses. For generators using parts tables, the key also includes the
+    table's data files and parameters (see PartsTableBase), and generators whose tables do not declare their
+    sources are not cached.
+    Entries also record the source of the modules defining the classes (and their superclasses) of the
+    sub-blocks, links and ports they reference, and are discarded when those change.
+    Other data read by the class (eg, helper modules or data files outside parts tables) is NOT tracked,
+    so the cache should be cleared when those change.
+
+    Entries are stored as one file per entry, of the referenced sources hash followed by the serialized proto.
+    When the total size exceeds max_bytes, the least recently used entries are evicted."""
+
+    kFileSuffix = ".pb"
+    kVersion = 2  # bump on format changes, mixed into keys so old entries are not read
+    kReferencesHashLength = 64  # hex sha256
+
+    @staticmethod
+    def from_env() -> Optional["ElaborationCache"]:
+        """Returns a cache if enabled by the EDG_ELABORATION_CACHE_DIR environment variable, otherwise None."""
+        cache_dir = cache_dir_from_env("EDG_ELABORATION_CACHE_DIR")
+        if cache_dir is None:
+            return None
+        return ElaborationCache(cache_dir)
+
+    def __init__(self, cache_dir: str, max_bytes: int = 1024 * 1024 * 1024) -> None:
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        os.makedirs(cache_dir, exist_ok=True)
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._sources = SourceHasher()
+        self._class_modules: Dict[str, List[str]] = {}  # def name -> modules of the class and its superclasses
+        self._total_bytes = sum(size for _, _, size in self._entries())
+
+    def stats_str(self) -> str:
+        return f"{self.hits} hits, {self.misses} misses, {self.evictions} evictions, {self._total_bytes} bytes"
+
+    def _entries(self) -> List[Tuple[float, str, int]]:
+        """Returns all entries in the cache directory, as (access time, path, size)."""
+        entries = []
+        for filename in os.listdir(self.cache_dir):
+            if filename.endswith(self.kFileSuffix):
+                path = os.path.join(self.cache_dir, filename)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:  # may be concurrently evicted by another process
+                    continue
+                entries.append((stat.st_mtime, path, stat.st_size))
+        return entries
+
+    def _key(self, kind: str, cls: Type[LibraryElement], request: protobuf.message.Message) -> Optional[str]:
+        """Returns the cache key for a request, or None if the result cannot be cached."""
+        hasher = hashlib.sha256()
+        hasher.update(f"{kind};{self.kVersion};".encode("utf-8"))
+        hasher.update(request.SerializeToString(deterministic=True))
+        hasher.update(self._sources.modules_hash(mro.__module__ for mro in cls.__mro__).encode("utf-8"))
+        if kind == "generator":
+            from ..abstract_parts.PartsTablePart import PartsTableBase  # only imported if generators are cached
+
+            if issubclass(cls, PartsTableBase):  # the result depends on the table data
+                sources = cls._table_sources()
+                if sources is None:
+                    return None
+                try:
+                    hasher.update(files_stat_hash(sources).encode("utf-8"))
+                except OSError:
+                    return None
+                hasher.update(repr(cls._table_params()).encode("utf-8"))
+        return hasher.hexdigest()
+
+    @staticmethod
+    def _port_references(port: edgir.PortLike) -> Iterator[edgir.LibraryPath]:
+        if port.HasField("lib_elem"):
+            yield port.lib_elem
+        elif port.HasField("array"):
+            yield port.array.self_class
+            for array_port in port.array.ports.ports:
+                yield from ElaborationCache._port_references(array_port.value)
+
+    @staticmethod
+    def _references(message: protobuf.message.Message) -> Iterator[edgir.LibraryPath]:
+        """Returns the library elements referenced by an elaborated block, link or port."""
+        if isinstance(message, edgir.Library.NS.Val):
+            which = message.WhichOneof("type")
+            if which is None:
+                return
+            message = getattr(message, which)
+        if isinstance(message, (edgir.HierarchyBlock, edgir.Link, edgir.Port)):
+            for port in message.ports:
+                yield from ElaborationCache._port_references(port.value)
+        if isinstance(message, edgir.HierarchyBlock):
+            for block in message.blocks:
+                if block.value.HasField("lib_elem"):
+                    yield block.value.lib_elem.base
+                    yield from block.value.lib_elem.mixins
+        if isinstance(message, (edgir.HierarchyBlock, edgir.Link)):
+            for link in message.links:
+                if link.value.HasField("lib_elem"):
+                    yield link.value.lib_elem
+                elif link.value.HasField("array"):
+                    yield link.value.array.self_class
+
+    def _references_hash(self, message: protobuf.message.Message) -> Optional[bytes]:
+        """Returns the source hash of the classes referenced by an elaborated element, or None if a referenced
+        class no longer exists."""
+        module_names: List[str] = []
+        for path in self._references(message):
+            class_modules = self._class_modules.get(path.target.name)
+            if class_modules is None:
+                module_name, _, class_name = path.target.name.rpartition(".")
+                try:
+                    cls = getattr(importlib.import_module(module_name), class_name)
+                    class_modules = [mro.__module__ for mro in cls.__mro__]
+                except (ImportError, AttributeError, ValueError, TypeError):
+                    return None
+                self._class_modules[path.target.name] = class_modules
+            module_names.extend(class_modules)
+        return self._sources.modules_hash(module_names).encode("utf-8")
+
+    def _get(self, key: Optional[str], message_type: Type[CachedMessageType]) -> Optional[CachedMessageType]:
+        if key is None:
+            return None
+        path = os.path.join(self.cache_dir, key + self.kFileSuffix)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        message = message_type()
+        try:
+            message.ParseFromString(data[self.kReferencesHashLength :])
+            valid = data[: self.kReferencesHashLength] == self._references_hash(message)
+        except protobuf.message.DecodeError:
+            valid = False
+        if not valid:  # stale or corrupt, replaced on the following put
+            self.misses += 1
+            return None
+        os.utime(path)  # mark as recently used
+        self.hits += 1
+        return message
+
+    def put(self, key: Optional[str], message: protobuf.message.Message) -> None:
+        """Stores an elaborated result, using the key from a previous get. Does nothing if the key is None
+        (the result cannot be cached), or if the elaborated result references classes that cannot be found."""
+        if key is None:
+            return
+        references_hash = self._references_hash(message)
+        if references_hash is None:
+            return
+        path = os.path.join(self.cache_dir, key + self.kFileSuffix)
+        data = references_hash + message.SerializeToString()
+        try:
+            self._total_bytes -= os.stat(path).st_size  # replaced below
+        except FileNotFoundError:
+            pass
+        with atomic_write(path) as f:
+            f.write(data)
+        self._total_bytes += len(data)
+        if self._total_bytes > self.max_bytes:
+            self._evict()
+
+    def _evict(self) -> None:
+        entries = sorted(self._entries())
+        self._total_bytes = sum(size for _, _, size in entries)
+        for _, path, size in entries:
+            if self._total_bytes <= self.max_bytes * 3 // 4:  # leave some headroom to avoid evicting on every put
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self._total_bytes -= size
+            self.evictions += 1
+
+    def get_library_element(
+        self, cls: Type[LibraryElement], request: edgrpc.LibraryRequest
+    ) -> Tuple[Optional[str], Optional[edgir.Library.NS.Val]]:
+        """Returns the cache key (or None if uncacheable) and cached library element, if one exists."""
+        key = self._key("library", cls, request)
+        return key, self._get(key, edgir.Library.NS.Val)
+
+    def get_generator(
+        self, cls: Type[LibraryElement], request: edgrpc.GeneratorRequest
+    ) -> Tuple[Optional[str], Optional[edgir.HierarchyBlock]]:
+        """Returns the cache key (or None if uncacheable) and cached generated block, if one exists."""
+        key = self._key("generator", cls, request)
+        return key, self._get(key, edgir.HierarchyBlock)
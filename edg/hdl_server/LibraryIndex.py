@@ -0,0 +1,222 @@
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import sys
+from types import ModuleType
+from typing import Dict, List, NamedTuple, Optional, Set, Tuple, Type, cast
+
+from ..core import *
+from ..core.Core import NonLibraryProperty
+from ..util.CacheUtil import SourceHasher, atomic_write, cache_dir_from_env
+
+
+class LibraryElementIndexer:
+    """Indexer for libraries, recursively searches modules and their LibraryElements."""
+
+    def __init__(self) -> None:
+        self.seen_modules: Set[ModuleType] = set()
+        self.seen_elements: Set[Type[LibraryElement]] = set()
+        # class -> referenced modules if a LibraryElement, otherwise None, memoized across modules
+        self._element_modules: Dict[type, Optional[Dict[ModuleType, None]]] = {}
+
+    def index_module(self, module: ModuleType) -> Set[Type[LibraryElement]]:
+        assert not self.seen_elements and not self.seen_modules
+        self._search_module(module)
+        return self.seen_elements
+
+    @staticmethod
+    def is_searchable(module: ModuleType) -> bool:
+        return not (
+            module.__name__ in sys.builtin_module_names
+            or not hasattr(module, "__file__")  # apparently load six.moves breaks
+        )
+
+    def _search_module(self, module: ModuleType) -> None:
+        # avoid repeated work and re-indexing modules
+        if not self.is_searchable(module) or module in self.seen_modules:
+            return
+        self.seen_modules.add(module)
+
+        modules, elements = self.module_references(module)
+        self.seen_elements.update(elements)
+        for referenced in modules:
+            self._search_module(referenced)
+
+    def module_references(self, module: ModuleType) -> Tuple[List[ModuleType], List[Type[LibraryElement]]]:
+        """Returns the searchable modules referenced by a module (visible modules, and the modules defining its
+        LibraryElements, their superclasses and link types) and the LibraryElements in its namespace."""
+        modules: Dict[ModuleType, None] = {}  # ordered set
+        elements: List[Type[LibraryElement]] = []
+        for name, member in inspect.getmembers(module):
+            if inspect.ismodule(member):  # recurse into visible modules
+                modules[member] = None
+            elif inspect.isclass(member):
+                element_modules = self._element_modules_of(member)
+                if element_modules is not None:  # process elements
+                    elements.append(cast(Type[LibraryElement], member))  # checked by _element_modules_of
+                    modules.update(element_modules)
+        return [referenced for referenced in modules.keys() if self.is_searchable(referenced)], elements
+
+    def _element_modules_of(self, cls: type) -> Optional[Dict[ModuleType, None]]:
+        """Returns the modules referenced by a class (as an ordered set) if it is a LibraryElement, or None"""
+        if cls in self._element_modules:
+            return self._element_modules[cls]
+        element_modules: Optional[Dict[ModuleType, None]] = None
+        if (
+            issubclass(cls, LibraryElement)
+            and not issubclass(cls, DesignTop)
+            and (cls, NonLibraryProperty) not in cls._elt_properties
+        ):
+            element_modules = {importlib.import_module(mro.__module__): None for mro in cls.mro()}
+            if issubclass(cls, Port):  # TODO for some reason, Links not in __init__ are sometimes not found
+                obj = cls()  # TODO can these be class definitions?
+                if hasattr(obj, "link_type"):
+                    element_modules[importlib.import_module(obj.link_type.__module__)] = None
+        self._element_modules[cls] = element_modules
+        return element_modules
+
+
+class ModuleRecord(NamedTuple):
+    """Indexed references of a module, valid while the source of the module and referenced modules is unchanged."""
+
+    dependencies_hash: str  # of the source hashes of this module and all referenced modules
+    modules: List[str]  # referenced modules
+    elements: List[str]  # library elements in the namespace, by def name
+
+
+class LibraryIndex:
+    """Index of the library elements reachable from modules (as found by LibraryElementIndexer), so index_module
+    requests for unchanged code can be answered without importing modules, reflecting on their contents,
+    or instantiating ports to find their link types.
+
+    The index stores a record for each searched module, of the modules it references and the library elements in its
+    namespace. Records are reused while the source files of the module and all modules it references are unchanged,
+    otherwise only the modules with invalid records are imported and searched again.
+    Source files are hashed only when their modification time or size changes.
+    As with the ElaborationCache, code that defines elements dynamically (eg, from data files) is not tracked.
+
+    Records are kept in memory, and optionally stored on disk so they can be reused across processes."""
+
+    kFileName = "library_index.json"
+    kVersion = 2  # bump on format changes
+
+    @staticmethod
+    def from_env() -> "LibraryIndex":
+        """Returns an in-memory index, which is also stored on disk if the EDG_LIBRARY_INDEX_DIR environment
+        variable is set."""
+        return LibraryIndex(cache_dir_from_env("EDG_LIBRARY_INDEX_DIR"))
+
+    def __init__(self, cache_dir: Optional[str] = None) -> None:
+        self.cache_dir = cache_dir
+        self.searches = 0  # number of modules actually searched, for testing and statistics
+        self._paths: Dict[str, Optional[str]] = {}  # module name -> source file, None for modules without one
+        self._sources = SourceHasher()
+        self._records: Dict[str, ModuleRecord] = {}
+        self._current_hashes: Dict[str, Optional[str]] = {}  # module name -> source hash, checked this request
+        self._indexer = LibraryElementIndexer()  # shared to memoize element references
+        if cache_dir is not None:
+            os.makedirs(cache_dir, exist_ok=True)
+            self._load()
+
+    def _load(self) -> None:
+        assert self.cache_dir is not None
+        try:
+            with open(os.path.join(self.cache_dir, self.kFileName), "r") as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return
+        if data.get("version") != self.kVersion:
+            return
+        self._paths = data["paths"]
+        self._sources = SourceHasher(
+            {path: (mtime, size, file_hash) for path, (mtime, size, file_hash) in data["files"].items()}
+        )
+        self._records = {name: ModuleRecord(*record) for name, record in data["records"].items()}
+
+    def _save(self) -> None:
+        assert self.cache_dir is not None
+        with atomic_write(os.path.join(self.cache_dir, self.kFileName), "w") as f:
+            json.dump(
+                {
+                    "version": self.kVersion,
+                    "paths": self._paths,
+                    "files": self._sources.files,
+                    "records": self._records,
+                },
+                f,
+            )
+
+    def _module_hash(self, module_name: str) -> Optional[str]:
+        """Returns the current source hash of a module previously seen, or None if unknown or its file is missing"""
+        if module_name in self._current_hashes:
+            return self._current_hashes[module_name]
+        file_hash: Optional[str] = None
+        if module_name in self._paths:
+            path = self._paths[module_name]
+            if path is None:  # no source file, assumed constant
+                file_hash = ""
+            else:
+                try:
+                    file_hash = self._sources.file_hash(path)
+                except OSError:
+                    file_hash = None
+        self._current_hashes[module_name] = file_hash
+        return file_hash
+
+    def _imported_module_hash(self, module_name: str) -> str:
+        """Returns the current source hash of an imported module, recording its source file if needed"""
+        path = SourceHasher.module_file(module_name)
+        if module_name not in self._paths or self._paths[module_name] != path:  # new or moved module
+            self._paths[module_name] = path
+            self._current_hashes.pop(module_name, None)
+        file_hash = self._module_hash(module_name)
+        assert file_hash is not None  # file checked to exist above
+        return file_hash
+
+    def _dependencies_hash(self, module_names: List[str]) -> Optional[str]:
+        hasher = hashlib.sha256()
+        for module_name in module_names:
+            module_hash = self._module_hash(module_name)
+            if module_hash is None:
+                return None
+            hasher.update(f"{module_name}:{module_hash};".encode("utf-8"))
+        return hasher.hexdigest()
+
+    def _record(self, module_name: str) -> ModuleRecord:
+        record = self._records.get(module_name)
+        if record is not None and record.dependencies_hash == self._dependencies_hash([module_name] + record.modules):
+            return record
+
+        module = importlib.import_module(module_name)
+        modules, elements = self._indexer.module_references(module)
+        self.searches += 1
+        # modules are later imported by name, which in rare cases (like collections.abc) differs from the object
+        module_names = [referenced.__name__ for referenced in modules]
+        for referenced_name in [module_name] + module_names:
+            self._imported_module_hash(referenced_name)
+        dependencies_hash = self._dependencies_hash([module_name] + module_names)
+        assert dependencies_hash is not None
+        record = ModuleRecord(dependencies_hash, module_names, [element._static_def_name() for element in elements])
+        self._records[module_name] = record
+        return record
+
+    def index_module(self, module_name: str) -> List[str]:
+        """Returns the def names of all library elements reachable from a module"""
+        searches = self.searches
+        self._current_hashes = {}  # source files may change between requests
+        seen_modules: Set[str] = set()
+        elements: Dict[str, None] = {}  # ordered set
+        pending = [module_name]
+        while pending:
+            name = pending.pop()
+            if name in seen_modules:
+                continue
+            seen_modules.add(name)
+            record = self._record(name)
+            elements.update((element, None) for element in record.elements)
+            pending.extend(record.modules)
+        if self.cache_dir is not None and self.searches != searches:
+            self._save()
+        return list(elements.keys())
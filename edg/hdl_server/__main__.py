@@ -1,59 +1,21 @@
 import importlib
 import inspect
 import sys
-from types import ModuleType
-from typing import Set, Type, Tuple, TypeVar, cast, Optional
+from typing import Type, Tuple, TypeVar, cast, Optional
 
 from .. import edgir
 from .. import edgrpc
 from ..core import *
 from ..core.Core import NonLibraryProperty
+from .ElaborationCache import ElaborationCache
+from .LibraryIndex import LibraryIndex
 
 EDG_PROTO_VERSION = 14
 
-
-class LibraryElementIndexer:
-    """Indexer for libraries, recursively searches modules and their LibraryElements."""
-
-    def __init__(self) -> None:
-        self.seen_modules: Set[ModuleType] = set()
-        self.seen_elements: Set[Type[LibraryElement]] = set()
-
-    def index_module(self, module: ModuleType) -> Set[Type[LibraryElement]]:
-        assert not self.seen_elements and not self.seen_modules
-        self._search_module(module)
-        return self.seen_elements
-
-    def _search_module(self, module: ModuleType) -> None:
-        # avoid repeated work and re-indexing modules
-        if (
-            module.__name__ in sys.builtin_module_names
-            or not hasattr(module, "__file__")  # apparently load six.moves breaks
-            or module in self.seen_modules
-        ):
-            return
-        self.seen_modules.add(module)
-
-        for name, member in inspect.getmembers(module):
-            if inspect.ismodule(member):  # recurse into visible modules
-                self._search_module(member)
-
-            if (
-                inspect.isclass(member)
-                and issubclass(member, LibraryElement)
-                and not issubclass(member, DesignTop)
-                and member not in self.seen_elements
-                and (member, NonLibraryProperty) not in member._elt_properties
-            ):  # process elements
-                self.seen_elements.add(member)
-
-                for mro in member.mro():
-                    self._search_module(importlib.import_module(mro.__module__))
-
-                if issubclass(member, Port):  # TODO for some reason, Links not in __init__ are sometimes not found
-                    obj = member()  # TODO can these be class definitions?
-                    if hasattr(obj, "link_type"):
-                        self._search_module(importlib.import_module(obj.link_type.__module__))
+# optional persistent cache of elaborated elements, enabled by setting EDG_ELABORATION_CACHE_DIR
+elaboration_cache = ElaborationCache.from_env()
+# index of library elements by module, kept in memory and optionally on disk by setting EDG_LIBRARY_INDEX_DIR
+library_index = LibraryIndex.from_env()
 
 
 LibraryElementType = TypeVar("LibraryElementType", bound=LibraryElement)
@@ -95,31 +57,47 @@ def process_request(request: edgrpc.HdlRequest) -> Optional[edgrpc.HdlResponse]:
     response = edgrpc.HdlResponse()
     try:
         if request.HasField("index_module"):
-            module = importlib.import_module(request.index_module.name)
-            library = LibraryElementIndexer()
             indexed = [
-                edgir.LibraryPath(target=edgir.LocalStep(name=indexed._static_def_name()))
-                for indexed in library.index_module(module)
+                edgir.LibraryPath(target=edgir.LocalStep(name=indexed))
+                for indexed in library_index.index_module(request.index_module.name)
             ]
             response.index_module.indexed.extend(indexed)
         elif request.HasField("get_library_element"):
             cls = class_from_library(request.get_library_element.element, LibraryElement)  # type: ignore
-            obj, obj_proto = elaborate_class(cls)
-
-            response.get_library_element.element.CopyFrom(obj_proto)
-            if isinstance(obj, DesignTop):
-                obj.refinements().populate_proto(response.get_library_element.refinements)
+            cached_proto: Optional[edgir.Library.NS.Val] = None
+            if elaboration_cache is not None and not issubclass(cls, DesignTop):  # DesignTop also has refinements
+                cache_key, cached_proto = elaboration_cache.get_library_element(cls, request.get_library_element)
+
+            if cached_proto is not None:
+                response.get_library_element.element.CopyFrom(cached_proto)
+            else:
+                obj, obj_proto = elaborate_class(cls)
+
+                response.get_library_element.element.CopyFrom(obj_proto)
+                if isinstance(obj, DesignTop):
+                    obj.refinements().populate_proto(response.get_library_element.refinements)
+                elif elaboration_cache is not None:
+                    elaboration_cache.put(cache_key, obj_proto)
         elif request.HasField("elaborate_generator"):
             generator_type = class_from_library(request.elaborate_generator.element, GeneratorBlock)
-            generator_obj = generator_type()
+            cached_generated: Optional[edgir.HierarchyBlock] = None
+            if elaboration_cache is not None:
+                cache_key, cached_generated = elaboration_cache.get_generator(
+                    generator_type, request.elaborate_generator
+                )
 
-            response.elaborate_generator.generated.CopyFrom(
-                builder.elaborate_toplevel(
+            if cached_generated is not None:
+                response.elaborate_generator.generated.CopyFrom(cached_generated)
+            else:
+                generator_obj = generator_type()
+                generated = builder.elaborate_toplevel(
                     generator_obj,
                     is_generator=True,
                     generate_values=[(value.path, value.value) for value in request.elaborate_generator.values],
                 )
-            )
+                response.elaborate_generator.generated.CopyFrom(generated)
+                if elaboration_cache is not None:
+                    elaboration_cache.put(cache_key, generated)
         elif request.HasField("run_refinement"):
             refinement_pass_class = class_from_library(
                 request.run_refinement.refinement_pass, BaseRefinementPass  # type: ignore
@@ -170,6 +148,8 @@ def run_server() -> None:
     while True:
         request = stdin_deserializer.read()
         if request is None:  # end of stream
+            if elaboration_cache is not None:
+                print(f"Elaboration cache: {elaboration_cache.stats_str()}", file=sys.stderr)
             sys.exit(0)
 
         response = process_request(request)
@@ -0,0 +1,158 @@
+import os
+import sys
+import tempfile
+import unittest
+from typing import List, Optional, Type
+
+from typing_extensions import override
+
+from .. import edgir, edgrpc
+from ..abstract_parts.PartsTablePart import PartsTableBase
+from ..core import *
+from . import __main__ as hdl_server
+from .ElaborationCache import ElaborationCache
+
+
+class CountingGenerator(GeneratorBlock):
+    generate_count = 0
+
+    def __init__(self, float_preset: FloatLike = 0.0) -> None:
+        super().__init__()
+        self.float_param = self.Parameter(FloatExpr())
+        self.float_preset = self.ArgParameter(float_preset)
+        self.generator_param(self.float_preset)
+
+    @override
+    def generate(self) -> None:
+        CountingGenerator.generate_count += 1
+        self.assign(self.float_param, self.get(self.float_preset) * 2)
+
+
+class TableGenerator(PartsTableBase, CountingGenerator):
+    source: Optional[str] = None
+
+    @classmethod
+    @override
+    def _table_sources(cls) -> Optional[List[str]]:
+        return [cls.source] if cls.source is not None else None
+
+
+class ReferencingGenerator(CountingGenerator):
+    kDepModule = "elaboration_cache_dep"  # written by the test, so its source can change
+
+    @override
+    def generate(self) -> None:
+        super().generate()
+        self.dep = self.Block(getattr(sys.modules[self.kDepModule], "DepBlock")())
+
+
+class ElaborationCacheTestCase(unittest.TestCase):
+    @override
+    def setUp(self) -> None:
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.cache = ElaborationCache(self.cache_dir.name)
+        self.prev_cache = hdl_server.elaboration_cache
+        hdl_server.elaboration_cache = self.cache
+
+    @override
+    def tearDown(self) -> None:
+        hdl_server.elaboration_cache = self.prev_cache
+        self.cache_dir.cleanup()
+
+    @staticmethod
+    def generator_request(value: float, cls: Type[GeneratorBlock] = CountingGenerator) -> edgrpc.HdlRequest:
+        request = edgrpc.HdlRequest()
+        request.elaborate_generator.element.target.name = cls._static_def_name()
+        request_value = request.elaborate_generator.values.add()
+        request_value.path.CopyFrom(edgir.LocalPathList(["float_preset"]))
+        request_value.value.CopyFrom(edgir.lit_to_valuelit(value))
+        return request
+
+    def test_generator(self) -> None:
+        CountingGenerator.generate_count = 0
+        response1 = hdl_server.process_request(self.generator_request(3.0))
+        response2 = hdl_server.process_request(self.generator_request(3.0))
+        assert response1 is not None and response2 is not None
+        self.assertEqual(response1, response2)
+        self.assertEqual(CountingGenerator.generate_count, 1)  # second result from the cache
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+        hdl_server.process_request(self.generator_request(4.0))  # different values must not hit
+        self.assertEqual(CountingGenerator.generate_count, 2)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+
+        # a new cache on the same directory (eg, a new process) should hit
+        persisted_cache = ElaborationCache(self.cache_dir.name)
+        key, generated = persisted_cache.get_generator(
+            CountingGenerator, self.generator_request(3.0).elaborate_generator
+        )
+        self.assertEqual(generated, response1.elaborate_generator.generated)
+
+    def test_library_element(self) -> None:
+        request = edgrpc.HdlRequest()
+        request.get_library_element.element.target.name = CountingGenerator._static_def_name()
+        response1 = hdl_server.process_request(request)
+        response2 = hdl_server.process_request(request)
+        self.assertEqual(response1, response2)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_eviction(self) -> None:
+        block = edgir.HierarchyBlock()
+        block.self_class.target.name = "!" * 100
+        entry_size = ElaborationCache.kReferencesHashLength + block.ByteSize()
+        small_cache = ElaborationCache(self.cache_dir.name, max_bytes=entry_size * 4)
+        for i in range(5):
+            small_cache.put(f"key{i}", block)
+        self.assertEqual(small_cache.evictions, 2)  # evicted down to 3/4 of the maximum
+        self.assertIsNone(small_cache._get("key0", edgir.HierarchyBlock))
+        self.assertIsNone(small_cache._get("key1", edgir.HierarchyBlock))
+        self.assertEqual(small_cache._get("key4", edgir.HierarchyBlock), block)
+
+    def test_overwrite(self) -> None:
+        block = edgir.HierarchyBlock()
+        block.self_class.target.name = "!" * 100
+        self.cache.put("key", block)
+        self.cache.put("key", block)
+        self.assertEqual(self.cache._total_bytes, sum(size for _, _, size in self.cache._entries()))
+
+    def test_table_sources(self) -> None:
+        CountingGenerator.generate_count = 0
+        TableGenerator.source = None  # table data not declared, must not be cached
+        hdl_server.process_request(self.generator_request(3.0, TableGenerator))
+        hdl_server.process_request(self.generator_request(3.0, TableGenerator))
+        self.assertEqual(CountingGenerator.generate_count, 2)
+
+        TableGenerator.source = os.path.join(self.cache_dir.name, "table.csv")
+        with open(TableGenerator.source, "w") as f:
+            f.write("a")
+        hdl_server.process_request(self.generator_request(3.0, TableGenerator))
+        hdl_server.process_request(self.generator_request(3.0, TableGenerator))
+        self.assertEqual(CountingGenerator.generate_count, 3)
+
+        with open(TableGenerator.source, "w") as f:
+            f.write("ab")  # changes size, so the key changes
+        hdl_server.process_request(self.generator_request(3.0, TableGenerator))
+        self.assertEqual(CountingGenerator.generate_count, 4)
+
+    def test_references(self) -> None:
+        dep_dir = tempfile.TemporaryDirectory()
+        dep_path = os.path.join(dep_dir.name, ReferencingGenerator.kDepModule + ".py")
+        with open(dep_path, "w") as f:
+            f.write("from edg.core import Block\nclass DepBlock(Block):\n  pass\n")
+        sys.path.insert(0, dep_dir.name)
+        try:
+            __import__(ReferencingGenerator.kDepModule)
+            CountingGenerator.generate_count = 0
+            hdl_server.process_request(self.generator_request(3.0, ReferencingGenerator))
+            hdl_server.process_request(self.generator_request(3.0, ReferencingGenerator))
+            self.assertEqual(CountingGenerator.generate_count, 1)
+
+            with open(dep_path, "a") as f:
+                f.write("# changed\n")  # source of a referenced block changes, the entry is stale
+            hdl_server.process_request(self.generator_request(3.0, ReferencingGenerator))
+            self.assertEqual(CountingGenerator.generate_count, 2)
+            self.assertEqual((self.cache.hits, self.cache.misses), (1, 2))
+        finally:
+            sys.path.remove(dep_dir.name)
+            sys.modules.pop(ReferencingGenerator.kDepModule, None)
+            dep_dir.cleanup()
@@ -0,0 +1,79 @@
+import importlib
+import os
+import sys
+import tempfile
+import unittest
+
+from typing_extensions import override
+
+from .LibraryIndex import LibraryElementIndexer, LibraryIndex
+
+kPackage = "library_index_test_pkg"
+kInit = "from .blocks import *\n"
+kBlocks = """from edg.core import *
+
+
+class IndexedBlock(Block):
+    pass
+"""
+kBlocksAdded = kBlocks + """
+
+class AddedBlock(Block):
+    pass
+"""
+
+
+class LibraryIndexTestCase(unittest.TestCase):
+    @override
+    def setUp(self) -> None:
+        self.source_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = tempfile.TemporaryDirectory()
+        os.makedirs(os.path.join(self.source_dir.name, kPackage))
+        self.write("__init__.py", kInit)
+        self.write("blocks.py", kBlocks)
+        sys.path.insert(0, self.source_dir.name)
+
+    @override
+    def tearDown(self) -> None:
+        sys.path.remove(self.source_dir.name)
+        self.unload()
+        self.source_dir.cleanup()
+        self.cache_dir.cleanup()
+
+    def write(self, filename: str, contents: str) -> None:
+        with open(os.path.join(self.source_dir.name, kPackage, filename), "w") as f:
+            f.write(contents)
+
+    @staticmethod
+    def unload() -> None:  # as if in a new process
+        for name in [name for name in sys.modules.keys() if name.split(".")[0] == kPackage]:
+            del sys.modules[name]
+        importlib.invalidate_caches()
+
+    def test_matches_indexer(self) -> None:
+        index = LibraryIndex()
+        indexed = index.index_module(kPackage)
+        elements = LibraryElementIndexer().index_module(importlib.import_module(kPackage))
+        self.assertEqual(sorted(indexed), sorted(element._static_def_name() for element in elements))
+        self.assertIn(f"{kPackage}.blocks.IndexedBlock", indexed)
+
+    def test_persistent(self) -> None:
+        index = LibraryIndex(self.cache_dir.name)
+        indexed = index.index_module(kPackage)
+        self.assertGreater(index.searches, 0)
+
+        self.unload()
+        persisted_index = LibraryIndex(self.cache_dir.name)
+        self.assertEqual(persisted_index.index_module(kPackage), indexed)
+        self.assertEqual(persisted_index.searches, 0)  # answered without reflection
+        self.assertNotIn(kPackage, sys.modules)  # or importing the module
+
+    def test_incremental(self) -> None:
+        index = LibraryIndex(self.cache_dir.name)
+        self.assertNotIn(f"{kPackage}.blocks.AddedBlock", index.index_module(kPackage))
+
+        self.unload()
+        self.write("blocks.py", kBlocksAdded)
+        updated_index = LibraryIndex(self.cache_dir.name)
+        self.assertIn(f"{kPackage}.blocks.AddedBlock", updated_index.index_module(kPackage))
+        self.assertEqual(updated_index.searches, 2)  # only the changed module and the package re-exporting it
@@ -0,0 +1,841 @@
+# Generated by `python -m edg.tools.export_index`, regenerate after changing the exports.
+# Maps each name exported by the package to the module (relative to the package) it is loaded from.
+kExportIndex = {
+    "A1304": ".sensor",
+    "A4988": ".power",
+    "AaBattery": ".power",
+    "AaBatteryStack": ".power",
+    "Accelerometer": "..circuits",
+    "Ad8418a": ".analog",
+    "Afc01": ".connector",
+    "Afc07Top": ".connector",
+    "Ah1806": ".sensor",
+    "Al8861": ".power",
+    "AluminumCapacitor": "..circuits",
+    "Amp": "..circuits",
+    "Amphenol901143": ".connector",
+    "Amplifier": "..circuits",
+    "Ams1117": ".power",
+    "Analog": "..circuits",
+    "AnalogCapacitor": "..circuits",
+    "AnalogClampResistor": "..circuits",
+    "AnalogClampZenerDiode": "..circuits",
+    "AnalogCoaxTestPoint": "..circuits",
+    "AnalogDemuxer": "..circuits",
+    "AnalogFilter": "..circuits",
+    "AnalogIsolatedSwitch": "..circuits",
+    "AnalogLink": "..circuits",
+    "AnalogLowPassRc": "..circuits",
+    "AnalogMuxer": "..circuits",
+    "AnalogSeriesCapacitor": "..circuits",
+    "AnalogSeriesResistor": "..circuits",
+    "AnalogSetpointResistor": "..circuits",
+    "AnalogSink": "..circuits",
+    "AnalogSource": "..circuits",
+    "AnalogSwitch": "..circuits",
+    "AnalogSwitchTree": "..circuits",
+    "AnalogTestPoint": "..circuits",
+    "AnalogToDigital": "..circuits",
+    "Antenna": "..circuits",
+    "AnyPin": "..circuits",
+    "AnyPinAssign": "..circuits",
+    "Ap2204k": ".power",
+    "Ap2210": ".power",
+    "Ap3012": ".power",
+    "Ap3418": ".power",
+    "Ap7215": ".power",
+    "Apx803s": ".interface",
+    "ArrayBoolExpr": "..circuits",
+    "ArrayBoolLike": "..circuits",
+    "ArrayFloatExpr": "..circuits",
+    "ArrayFloatLike": "..circuits",
+    "ArrayIntExpr": "..circuits",
+    "ArrayIntLike": "..circuits",
+    "ArrayRangeExpr": "..circuits",
+    "ArrayRangeLike": "..circuits",
+    "ArrayStringExpr": "..circuits",
+    "ArrayStringLike": "..circuits",
+    "As7341": ".sensor",
+    "BananaJack": "..circuits",
+    "BananaSafetyJack": "..circuits",
+    "BaseBackend": "..circuits",
+    "BaseBlock": "..circuits",
+    "BaseDiode": "..circuits",
+    "BaseIoController": "..circuits",
+    "BaseIoControllerExportable": "..circuits",
+    "BaseIoControllerModelable": "..circuits",
+    "BaseIoControllerPinmapGenerator": "..circuits",
+    "BaseIoControllerWrapped": "..circuits",
+    "BaseIoControllerWrapper": "..circuits",
+    "BasePort": "..circuits",
+    "BaseRefinementPass": "..circuits",
+    "BaseTableFet": "..circuits",
+    "Battery": "..circuits",
+    "Bh1750": ".sensor",
+    "BidirectionalLevelShifter": "..circuits",
+    "Bit": "..circuits",
+    "BitBangAdapter": "..circuits",
+    "Bjt": "..circuits",
+    "BjtStandardFootprint": "..circuits",
+    "BldcDriver": "..circuits",
+    "Block": "..circuits",
+    "BlockInterfaceMixin": "..circuits",
+    "BlueSmirf": ".interface",
+    "Bme680": ".sensor",
+    "BoolExpr": "..circuits",
+    "BoolLike": "..circuits",
+    "BoostConverter": "..circuits",
+    "BoostConverterPowerPath": "..circuits",
+    "BootstrapCapacitor": "..circuits",
+    "BootstrapVoltageAdder": "..circuits",
+    "BrushedMotorDriver": "..circuits",
+    "BuckBoostConverterPowerPath": "..circuits",
+    "BuckConverter": "..circuits",
+    "BuckConverterPowerPath": "..circuits",
+    "BufferDeserializer": "..circuits",
+    "BufferSerializer": "..circuits",
+    "Bundle": "..circuits",
+    "Bwipx_1_001e": ".connector",
+    "Camera": "..circuits",
+    "CanControllerPort": "..circuits",
+    "CanControllerTestPoint": "..circuits",
+    "CanDiffLink": "..circuits",
+    "CanDiffPort": "..circuits",
+    "CanDiffTestPoint": "..circuits",
+    "CanEsdDiode": "..circuits",
+    "CanLogicLink": "..circuits",
+    "CanPassivePort": "..circuits",
+    "CanTransceiver": "..circuits",
+    "CanTransceiverPort": "..circuits",
+    "Capacitor": "..circuits",
+    "CapacitorStandardFootprint": "..circuits",
+    "Cbmud1200l": ".interface",
+    "CeramicCapacitor": "..circuits",
+    "CeramicResonator": "..circuits",
+    "Ch280qv10_Ct": ".display",
+    "Ch32v003": ".microcontroller",
+    "Ch32v203": ".microcontroller",
+    "Ch32vSdi2Header": ".microcontroller",
+    "Ch32vSdi2Header254": ".microcontroller",
+    "Ch32vSdi2Tc2030": ".microcontroller",
+    "Ch32vSdiHeader": ".microcontroller",
+    "Ch32vSdiHeader254": ".microcontroller",
+    "Ch32vSdiTc2030": ".microcontroller",
+    "CharlieplexedLedMatrix": "..circuits",
+    "CircuitPort": "..circuits",
+    "CircuitPortAdapter": "..circuits",
+    "CircuitPortBridge": "..circuits",
+    "CombinedCapacitor": "..circuits",
+    "Common": "..circuits",
+    "CompactKeystone5015": ".debug",
+    "Comparator": "..circuits",
+    "CompensatorType2": "..circuits",
+    "CompiledDesign": "..circuits",
+    "CompiledDesignExportTransform": "..circuits",
+    "CompilerCheckError": "..circuits",
+    "CompilerDaemon": "..circuits",
+    "CompilerDaemonClient": "..circuits",
+    "Connector": "..circuits",
+    "ConnectorResistiveSensor": "..circuits",
+    "ConnectorSpeaker": ".human_interface",
+    "ConstraintExpr": "..circuits",
+    "Cp2102": ".interface",
+    "CpuFanConnector": ".connector",
+    "CpuFanPwmControl": ".connector",
+    "Cr2032": ".power",
+    "Crystal": "..circuits",
+    "CrystalDriver": "..circuits",
+    "CrystalLink": "..circuits",
+    "CrystalPort": "..circuits",
+    "Ct3151": ".connector",
+    "CurrentSenseResistor": "..circuits",
+    "CurrentSensor": "..circuits",
+    "CustomSyncBuckBoostConverterPwm": ".power",
+    "CustomSyncBuckConverterIndependent": ".power",
+    "DecouplingCapacitor": "..circuits",
+    "DefaultExportBlock": "..circuits",
+    "DeprecatedBlock": "..circuits",
+    "DescriptionString": "..circuits",
+    "DesignTop": "..circuits",
+    "Dg468": ".analog",
+    "DifferentialAmplifier": "..circuits",
+    "DigitalArrayTestPoint": "..circuits",
+    "DigitalBidir": "..circuits",
+    "DigitalBidirNotConnected": "..circuits",
+    "DigitalBidirSeriesResistor": "..circuits",
+    "DigitalCapacitor": "..circuits",
+    "DigitalClampResistor": "..circuits",
+    "DigitalDirectionSwitch": "..circuits",
+    "DigitalDirectionSwitchCenter": "..circuits",
+    "DigitalFilter": "..circuits",
+    "DigitalIsolator": "..circuits",
+    "DigitalJumper": "..circuits",
+    "DigitalLink": "..circuits",
+    "DigitalLowPassRc": "..circuits",
+    "DigitalLowPassRcArray": "..circuits",
+    "DigitalRotaryEncoder": "..circuits",
+    "DigitalRotaryEncoderSwitch": "..circuits",
+    "DigitalSeriesResistor": "..circuits",
+    "DigitalSingleSource": "..circuits",
+    "DigitalSink": "..circuits",
+    "DigitalSource": "..circuits",
+    "DigitalSourceConnected": "..circuits",
+    "DigitalSwitch": "..circuits",
+    "DigitalTestPoint": "..circuits",
+    "DigitalToAnalog": "..circuits",
+    "DigitalTvsDiode": "..circuits",
+    "Diode": "..circuits",
+    "DiodePowerMerge": "..circuits",
+    "DiodeStandardFootprint": "..circuits",
+    "DirectionSwitch": "..circuits",
+    "DirectionSwitchCenter": "..circuits",
+    "DiscreteApplication": "..circuits",
+    "DiscreteBoostConverter": "..circuits",
+    "DiscreteBuckConverter": "..circuits",
+    "DiscreteComponent": "..circuits",
+    "DiscreteRfWarning": "..circuits",
+    "DiscreteSemiconductor": "..circuits",
+    "Display": "..circuits",
+    "DistanceSensor": "..circuits",
+    "Dm3btDsfPejs": ".connector",
+    "Drv8313": ".power",
+    "Drv8833": ".power",
+    "Drv8870": ".power",
+    "DuckLogo": ".Labels",
+    "DummyAnalogSink": "..circuits",
+    "DummyAnalogSource": "..circuits",
+    "DummyCapacitorFootprint": "..circuits",
+    "DummyDevice": "..circuits",
+    "DummyDigitalSink": "..circuits",
+    "DummyDigitalSource": "..circuits",
+    "DummyGround": "..circuits",
+    "DummyPassive": "..circuits",
+    "DummyVoltageSink": "..circuits",
+    "DummyVoltageSource": "..circuits",
+    "Dvp8Camera": "..circuits",
+    "Dvp8Host": "..circuits",
+    "Dvp8Link": "..circuits",
+    "E93Lc_B": ".logic",
+    "EInk": "..circuits",
+    "ESeriesRatioUtil": "..circuits",
+    "ESeriesRatioValue": "..circuits",
+    "ESeriesUtil": "..circuits",
+    "Ec05e": ".human_interface",
+    "Ec11eWithSwitch": ".human_interface",
+    "Ec11j15WithSwitch": ".human_interface",
+    "ElementDict": "..circuits",
+    "EnvironmentalSensor": "..circuits",
+    "Er_Epd027_2": ".display",
+    "Er_Oled022_1": ".display",
+    "Er_Oled028_1": ".display",
+    "Er_Oled_091_3": ".display",
+    "Er_Oled_096_1_1": ".display",
+    "Er_Oled_096_1c": ".display",
+    "Er_Tft_128_3": ".display",
+    "Esp32_Wroom_32": ".microcontroller",
+    "Esp32c3": ".microcontroller",
+    "Esp32c3_Wroom02": ".microcontroller",
+    "Esp32s3_Wroom_1": ".microcontroller",
+    "EspAutoProgram": ".microcontroller",
+    "EspProgrammingAutoReset": ".microcontroller",
+    "EspProgrammingHeader": ".microcontroller",
+    "EspProgrammingPinHeader254": ".microcontroller",
+    "EspProgrammingTc2030": ".microcontroller",
+    "Farad": "..circuits",
+    "Fcr7350": ".connector",
+    "Feather_Nrf52840": ".microcontroller",
+    "FeedbackVoltageDivider": "..circuits",
+    "FerriteBead": "..circuits",
+    "FerriteBeadStandardFootprint": "..circuits",
+    "Fet": "..circuits",
+    "FetHalfBridge": "..circuits",
+    "FetHalfBridgeIndependent": "..circuits",
+    "FetHalfBridgePwmReset": "..circuits",
+    "FetStandardFootprint": "..circuits",
+    "Filter": "..circuits",
+    "FlirLepton": ".sensor",
+    "FloatExpr": "..circuits",
+    "FloatLike": "..circuits",
+    "FootprintBlock": "..circuits",
+    "FootprintDataTable": "..circuits",
+    "FootprintPassiveConnector": "..circuits",
+    "FootprintTouchPad": ".TouchPad",
+    "ForcedAnalogSignal": "..circuits",
+    "ForcedDigitalSinkCurrentDraw": "..circuits",
+    "ForcedVoltage": "..circuits",
+    "ForcedVoltageCurrent": "..circuits",
+    "ForcedVoltageCurrentDraw": "..circuits",
+    "ForcedVoltageCurrentLimit": "..circuits",
+    "Fpc030": ".connector",
+    "Fpc030Bottom": ".connector",
+    "Fpc030Top": ".connector",
+    "Fpc030TopBottom": ".connector",
+    "Fpc050": ".connector",
+    "Fpc050Bottom": ".connector",
+    "Fpc050BottomFlip": ".connector",
+    "Fpc050Pair": ".connector",
+    "Fpc050Top": ".connector",
+    "Fpga": "..circuits",
+    "Freenove_Esp32_Wrover": ".microcontroller",
+    "Freenove_Esp32s3_Wroom": ".microcontroller",
+    "Ft232hl": ".interface",
+    "Fusb302b": ".interface",
+    "Fuse": "..circuits",
+    "FuseStandardFootprint": "..circuits",
+    "G3VM_61GR2": ".analog",
+    "GHertz": "..circuits",
+    "GasSensor": "..circuits",
+    "GeneratorBlock": "..circuits",
+    "Ground": "..circuits",
+    "GroundJumper": "..circuits",
+    "GroundLink": "..circuits",
+    "GroundReference": "..circuits",
+    "GroundSource": "..circuits",
+    "GroundTestPoint": "..circuits",
+    "Gyroscope": "..circuits",
+    "HalfBridge": "..circuits",
+    "HalfBridgeDriver": "..circuits",
+    "HalfBridgeDriverIndependent": "..circuits",
+    "HalfBridgeDriverPwm": "..circuits",
+    "HalfBridgeIndependent": "..circuits",
+    "HalfBridgePwm": "..circuits",
+    "HasEspProgramming": ".microcontroller",
+    "HasPassivePort": "..circuits",
+    "Hdc1080": ".sensor",
+    "Henry": "..circuits",
+    "Hertz": "..circuits",
+    "HighSideSwitch": "..circuits",
+    "HiroseFh12sh": ".connector",
+    "HiroseFh35cshw": ".connector",
+    "Holyiot_18010": ".microcontroller",
+    "HumanInterface": "..circuits",
+    "HumiditySensor": "..circuits",
+    "I2cController": "..circuits",
+    "I2cControllerBitBang": "..circuits",
+    "I2cLink": "..circuits",
+    "I2cMaster": "..circuits",
+    "I2cPullup": "..circuits",
+    "I2cPullupPort": "..circuits",
+    "I2cSlave": "..circuits",
+    "I2cTarget": "..circuits",
+    "I2cTestPoint": "..circuits",
+    "I2sController": "..circuits",
+    "I2sLink": "..circuits",
+    "I2sTargetReceiver": "..circuits",
+    "Ice40up": ".microcontroller",
+    "IdDots4": ".Labels",
+    "IdealModel": "..circuits",
+    "IdentityDict": "..circuits",
+    "IdentitySet": "..circuits",
+    "ImplicitConnect": "..circuits",
+    "Imu_Lsm6ds3trc": ".sensor",
+    "InOut": "..circuits",
+    "Ina219": ".analog",
+    "Ina826": ".analog",
+    "IndicatorLed": "..circuits",
+    "IndicatorLedArray": "..circuits",
+    "IndicatorSinkLed": "..circuits",
+    "IndicatorSinkLedArray": "..circuits",
+    "IndicatorSinkLedResistor": "..circuits",
+    "IndicatorSinkPackedRgbLed": "..circuits",
+    "IndicatorSinkRgbLed": "..circuits",
+    "Inductor": "..circuits",
+    "Input": "..circuits",
+    "IntExpr": "..circuits",
+    "IntLike": "..circuits",
+    "IntegratorInverting": "..circuits",
+    "Interface": "..circuits",
+    "InternalBlock": "..circuits",
+    "InternalSubcircuit": "..circuits",
+    "IoController": "..circuits",
+    "IoControllerBle": "..circuits",
+    "IoControllerBluetooth": "..circuits",
+    "IoControllerCan": "..circuits",
+    "IoControllerDac": "..circuits",
+    "IoControllerDvp8": "..circuits",
+    "IoControllerI2cTarget": "..circuits",
+    "IoControllerI2s": "..circuits",
+    "IoControllerPowerOut": "..circuits",
+    "IoControllerPowerRequired": "..circuits",
+    "IoControllerSpiPeripheral": "..circuits",
+    "IoControllerTouchDriver": "..circuits",
+    "IoControllerUsb": "..circuits",
+    "IoControllerUsbCc": "..circuits",
+    "IoControllerUsbOut": "..circuits",
+    "IoControllerVin": "..circuits",
+    "IoControllerWifi": "..circuits",
+    "IoControllerWithSwdTargetConnector": "..circuits",
+    "IoExpander": "..circuits",
+    "Ir2301": ".power",
+    "Iso1050dub": ".interface",
+    "IsolatedCanTransceiver": "..circuits",
+    "JacdacDataInterface": ".Jacdac",
+    "JacdacDataPort": ".Jacdac",
+    "JacdacDeviceTop": ".Jacdac",
+    "JacdacEdgeConnector": ".Jacdac",
+    "JacdacMountingData1": ".Jacdac",
+    "JacdacMountingGnd2": ".Jacdac",
+    "JacdacMountingGnd4": ".Jacdac",
+    "JacdacMountingPwr3": ".Jacdac",
+    "JacdacPassivePort": ".Jacdac",
+    "JstPh": ".connector",
+    "JstPhKHorizontal": ".connector",
+    "JstPhKVertical": ".connector",
+    "JstPhSmVertical": ".connector",
+    "JstPhSmVerticalJlc": ".connector",
+    "JstShSmHorizontal": ".connector",
+    "JstXh": ".connector",
+    "JstXhAHorizontal": ".connector",
+    "JstXhAVertical": ".connector",
+    "Jumper": "..circuits",
+    "Keystone5000": ".debug",
+    "Keystone5015": ".debug",
+    "KiCadBlackbox": "..circuits",
+    "KiCadBlackboxBase": "..circuits",
+    "KiCadImportableBlock": "..circuits",
+    "KiCadInstantiableBlock": "..circuits",
+    "KiCadLibSymbol": "..circuits",
+    "KiCadSchematicBlock": "..circuits",
+    "KiCadSymbol": "..circuits",
+    "KicadImportablePortAdapter": "..circuits",
+    "L293dd": ".power",
+    "L74Ahct1g125": ".logic",
+    "L78l": ".power",
+    "LHighPassFilter": "..circuits",
+    "LLowPassFilter": "..circuits",
+    "LLowPassFilterWith2HNotch": "..circuits",
+    "Label": "..circuits",
+    "Lcd": "..circuits",
+    "Ld1117": ".power",
+    "Ldl1117": ".power",
+    "LeadFreeIndicator": ".Labels",
+    "Led": "..circuits",
+    "LedColor": "..circuits",
+    "LedColorLike": "..circuits",
+    "LedDriver": "..circuits",
+    "LedDriverPwm": "..circuits",
+    "LedDriverSwitchingConverter": "..circuits",
+    "LedStandardFootprint": "..circuits",
+    "LemurLogo": ".Labels",
+    "Li18650": ".power",
+    "LibraryElement": "..circuits",
+    "Light": "..circuits",
+    "LightSensor": "..circuits",
+    "LinearRegulator": "..circuits",
+    "LinearRegulatorDevice": "..circuits",
+    "Link": "..circuits",
+    "LipoConnector": ".connector",
+    "LiteralConstructor": "..circuits",
+    "Lm2664": ".power",
+    "Lm2733": ".power",
+    "Lm4871": ".human_interface",
+    "Lmr38020": ".power",
+    "Lmv321": ".analog",
+    "Lmv331": ".analog",
+    "LoadSwitch": "..circuits",
+    "LowPassAnalogDifferentialRc": "..circuits",
+    "LowPassRc": "..circuits",
+    "LowPassRcDac": "..circuits",
+    "Lp5907": ".power",
+    "Lpc1549_48": ".microcontroller",
+    "Lpc1549_64": ".microcontroller",
+    "Lsm6ds3trc": ".sensor",
+    "Lsm6dsv16x": ".sensor",
+    "Ltc3429": ".power",
+    "MHertz": "..circuits",
+    "MOhm": "..circuits",
+    "Mag_Qmc5883l": ".sensor",
+    "MagneticSensor": "..circuits",
+    "MagneticSwitch": "..circuits",
+    "Magnetometer": "..circuits",
+    "Max17048": ".power",
+    "Max98357a": ".human_interface",
+    "Mcp3201": ".analog",
+    "Mcp3561": ".analog",
+    "Mcp4728": ".analog",
+    "Mcp47f": ".analog",
+    "Mcp4921": ".analog",
+    "Mcp6001": ".analog",
+    "Mcp73831": ".power",
+    "Mdbt50q_1mv2": ".microcontroller",
+    "Mechanical": "..circuits",
+    "MechanicalKeyswitch": "..circuits",
+    "Memory": "..circuits",
+    "MergedAnalogSource": "..circuits",
+    "MergedDigitalSource": "..circuits",
+    "MergedSpiController": "..circuits",
+    "MergedVoltageSource": "..circuits",
+    "MiBit": "..circuits",
+    "MicroSdSocket": ".connector",
+    "Microcontroller": "..circuits",
+    "Microphone": "..circuits",
+    "Molex1040310811": ".connector",
+    "MolexSl": ".connector",
+    "MotorDriver": "..circuits",
+    "MountingHole": ".Mechanicals",
+    "MountingHole_M2_5": ".Mechanicals",
+    "MountingHole_M3": ".Mechanicals",
+    "MountingHole_M4": ".Mechanicals",
+    "MountingHole_NoPad_M2_5": ".Mechanicals",
+    "Mp2722": ".power",
+    "MultiBiDict": "..circuits",
+    "MultipackBlock": "..circuits",
+    "MultipackDevice": "..circuits",
+    "MultipackOpamp": "..circuits",
+    "MultipackOpampGenerator": "..circuits",
+    "Ncp3420": ".power",
+    "Neopixel": "..circuits",
+    "NeopixelArray": ".human_interface",
+    "NeopixelArrayCircular": ".human_interface",
+    "NetBlock": "..circuits",
+    "NetPackingBlock": "..circuits",
+    "NetlistBackend": "..circuits",
+    "Nhd_312_25664uc": ".display",
+    "Nlas4157": ".analog",
+    "Nonstrict3v3Compatible": "..circuits",
+    "NotConnectedPin": "..circuits",
+    "Nucleo_F303k8": ".microcontroller",
+    "Ohm": "..circuits",
+    "Oled": "..circuits",
+    "Opa189": ".analog",
+    "Opa197": ".analog",
+    "Opa2171": ".analog",
+    "Opa2189": ".analog",
+    "Opa2197": ".analog",
+    "Opa2333": ".analog",
+    "Opamp": "..circuits",
+    "OpampApplication": "..circuits",
+    "OpampCurrentSensor": "..circuits",
+    "OpampElement": "..circuits",
+    "OpampFollower": "..circuits",
+    "OpenDrainDriver": "..circuits",
+    "Oscillator": "..circuits",
+    "OscillatorReference": "..circuits",
+    "Outline_Pn1332": ".Mechanicals",
+    "Output": "..circuits",
+    "Ov2640": ".sensor",
+    "Ov2640_Fpc24": ".sensor",
+    "PackedBlockArray": "..circuits",
+    "PackedGround": "..circuits",
+    "PackedPassive": "..circuits",
+    "PackedVoltageSource": "..circuits",
+    "Pam8302a": ".human_interface",
+    "ParamValue": "..circuits",
+    "PartParserUtil": "..circuits",
+    "PartsTable": "..circuits",
+    "PartsTableAreaSelector": "..circuits",
+    "PartsTableBase": "..circuits",
+    "PartsTableColumn": "..circuits",
+    "PartsTableFootprintFilter": "..circuits",
+    "PartsTablePart": "..circuits",
+    "PartsTableRow": "..circuits",
+    "PartsTableSelector": "..circuits",
+    "PartsTableSelectorFootprint": "..circuits",
+    "Passive": "..circuits",
+    "PassiveComponent": "..circuits",
+    "PassiveConnector": "..circuits",
+    "PassiveLink": "..circuits",
+    "Pca9554": ".interface",
+    "Pcf2129": ".sensor",
+    "Pcf8574": ".interface",
+    "Pec11s": ".human_interface",
+    "PeripheralAnyResource": "..circuits",
+    "PeripheralFixedPin": "..circuits",
+    "PeripheralFixedResource": "..circuits",
+    "PeripheralPinAssign": "..circuits",
+    "Pesd1can": ".interface",
+    "Pesd5v0x1bt": ".connector",
+    "Pgb102st23": ".connector",
+    "PiLowPassFilter": "..circuits",
+    "Picoblade": ".connector",
+    "Picoblade53261": ".connector",
+    "Picoblade53398": ".connector",
+    "PinAssignmentUtil": "..circuits",
+    "PinHeader127DualShrouded": ".connector",
+    "PinHeader254": ".connector",
+    "PinHeader254DualShroudedInline": ".connector",
+    "PinHeader254Horizontal": ".connector",
+    "PinHeader254Vertical": ".connector",
+    "PinHeader2mm": ".connector",
+    "PinHeader2mmHorizontal": ".connector",
+    "PinHeader2mmVertical": ".connector",
+    "PinMapUtil": "..circuits",
+    "PinMappable": "..circuits",
+    "PinResource": "..circuits",
+    "PinSocket254": ".connector",
+    "PinSocket254Pair": ".connector",
+    "PinSocket2mm": ".connector",
+    "PinSocket2mmPair": ".connector",
+    "Pj_036ah": ".connector",
+    "Pj_102ah": ".connector",
+    "PmosChargerReverseProtection": "..circuits",
+    "PmosReverseProtection": "..circuits",
+    "Pn7160": ".interface",
+    "PololuA4988": ".power",
+    "Port": "..circuits",
+    "PortAdapter": "..circuits",
+    "PortBridge": "..circuits",
+    "PortTag": "..circuits",
+    "Power": "..circuits",
+    "PowerBarrelJack": ".connector",
+    "PowerConditioner": "..circuits",
+    "PowerSource": "..circuits",
+    "PowerSwitch": "..circuits",
+    "PptcFuse": "..circuits",
+    "PressureSensor": "..circuits",
+    "PriorityPowerOr": "..circuits",
+    "ProgrammableController": "..circuits",
+    "ProgrammingConnector": "..circuits",
+    "Protection": "..circuits",
+    "ProtectionTvsDiode": "..circuits",
+    "ProtectionZenerDiode": "..circuits",
+    "PulldownResistor": "..circuits",
+    "PulldownResistorArray": "..circuits",
+    "PullupDelayRc": "..circuits",
+    "PullupResistor": "..circuits",
+    "PullupResistorArray": "..circuits",
+    "Qmc5883l": ".sensor",
+    "Qmc5883p": ".sensor",
+    "Qt096t_if09": ".display",
+    "QwiicTarget": ".connector",
+    "Radiofrequency": "..circuits",
+    "RampLimiter": "..circuits",
+    "Range": "..circuits",
+    "RangeExpr": "..circuits",
+    "RangeLike": "..circuits",
+    "Ratio": "..circuits",
+    "Rclamp0521p": ".Jacdac",
+    "RealtimeClock": "..circuits",
+    "Ref30xx": ".power",
+    "RefdesRefinementPass": "..circuits",
+    "Refinements": "..circuits",
+    "Resettable": "..circuits",
+    "ResistiveDivider": "..circuits",
+    "Resistor": "..circuits",
+    "ResistorArray": "..circuits",
+    "ResistorArrayStandardFootprint": "..circuits",
+    "ResistorStandardFootprint": "..circuits",
+    "RfConnector": "..circuits",
+    "RfConnectorAntenna": "..circuits",
+    "RfConnectorTestPoint": "..circuits",
+    "RfFilter": "..circuits",
+    "RgbLedCommonAnode": "..circuits",
+    "RotaryEncoder": "..circuits",
+    "RotaryEncoderSwitch": "..circuits",
+    "Rp2040": ".microcontroller",
+    "S8261A": ".power",
+    "ScalaCompiler": "..circuits",
+    "Sd18ob261": ".human_interface",
+    "SdCard": ".connector",
+    "SdSocket": ".connector",
+    "Second": "..circuits",
+    "SelectorArea": "..circuits",
+    "SelectorFootprint": "..circuits",
+    "Sensor": "..circuits",
+    "SeriesPowerFerriteBead": "..circuits",
+    "SeriesPowerFuse": "..circuits",
+    "SeriesPowerInductor": "..circuits",
+    "SeriesPowerPptcFuse": "..circuits",
+    "SeriesPowerResistor": "..circuits",
+    "SeriesResistor": "..circuits",
+    "Shtc3": ".sensor",
+    "SignalDivider": "..circuits",
+    "SingleDiodePowerMerge": "..circuits",
+    "Sk6805_Ec15": ".human_interface",
+    "Sk6812Mini_E": ".human_interface",
+    "Sk6812_Side_A": ".human_interface",
+    "Skrh": ".human_interface",
+    "SmaConnector": "..circuits",
+    "SmaFConnector": "..circuits",
+    "SmaMConnector": "..circuits",
+    "Sn65hvd230": ".interface",
+    "Sn74lvc1g3157": ".analog",
+    "Sn74lvc1g74": ".logic",
+    "Sn74lvc2g02": ".logic",
+    "SoftPowerGate": "..circuits",
+    "SoftPowerSwitch": "..circuits",
+    "SolderJumperTriangular": ".debug",
+    "SolidStateRelay": "..circuits",
+    "Speaker": ".human_interface",
+    "SpeakerDriver": "..circuits",
+    "SpeakerDriverPort": "..circuits",
+    "SpeakerLink": "..circuits",
+    "SpeakerPort": "..circuits",
+    "SpiController": "..circuits",
+    "SpiLink": "..circuits",
+    "SpiMaster": "..circuits",
+    "SpiMemory": "..circuits",
+    "SpiMemoryQspi": "..circuits",
+    "SpiPeripheral": "..circuits",
+    "SpiSlave": "..circuits",
+    "SpiTestPoint": "..circuits",
+    "StandardFootprint": "..circuits",
+    "Stm32f103": ".microcontroller",
+    "Stm32f103_48": ".microcontroller",
+    "Stm32g031_G": ".microcontroller",
+    "Stm32g431kb": ".microcontroller",
+    "Stm32l432k": ".microcontroller",
+    "StringExpr": "..circuits",
+    "StringLike": "..circuits",
+    "SubElementDict": "..circuits",
+    "SubboardBlock": "..circuits",
+    "SubboardConnectorPair": "..circuits",
+    "SummingAmplifier": "..circuits",
+    "SvgPcbBackend": "..circuits",
+    "SvgPcbTemplateBlock": "..circuits",
+    "SwdCortexTargetConnector": "..circuits",
+    "SwdCortexTargetConnectorReset": "..circuits",
+    "SwdCortexTargetConnectorSwo": "..circuits",
+    "SwdCortexTargetConnectorTdi": "..circuits",
+    "SwdCortexTargetHeader": ".connector",
+    "SwdCortexTargetTagConnect": ".connector",
+    "SwdHostPort": "..circuits",
+    "SwdLink": "..circuits",
+    "SwdPullPort": "..circuits",
+    "SwdTargetPort": "..circuits",
+    "Switch": "..circuits",
+    "SwitchFet": "..circuits",
+    "SwitchMatrix": "..circuits",
+    "SwitchMatrixNeopixels": "..circuits",
+    "SwitchingVoltageRegulator": "..circuits",
+    "Sx1262": ".interface",
+    "TableAntenna": "..circuits",
+    "TableBjt": "..circuits",
+    "TableCapacitor": "..circuits",
+    "TableCrystal": "..circuits",
+    "TableDeratingCapacitor": "..circuits",
+    "TableDiode": "..circuits",
+    "TableFerriteBead": "..circuits",
+    "TableFet": "..circuits",
+    "TableFuse": "..circuits",
+    "TableInductor": "..circuits",
+    "TableLed": "..circuits",
+    "TableOscillator": "..circuits",
+    "TableResistor": "..circuits",
+    "TableResistorArray": "..circuits",
+    "TableSwitchFet": "..circuits",
+    "TableZenerDiode": "..circuits",
+    "TactileSwitch": "..circuits",
+    "TagConnect": ".connector",
+    "TagConnectLegged": ".connector",
+    "TagConnectNonLegged": ".connector",
+    "Te1734839": ".connector",
+    "TeRc": ".debug",
+    "TemperatureSensor": "..circuits",
+    "TestPoint": "..circuits",
+    "Testing": "..circuits",
+    "Tlp170am": ".analog",
+    "Tlp3545a": ".analog",
+    "Tlv757p": ".power",
+    "Tlv9061": ".analog",
+    "Tlv9152": ".analog",
+    "Tmp1075n": ".sensor",
+    "TouchDriver": "..circuits",
+    "TouchPadPort": "..circuits",
+    "Tpa2005d1": ".human_interface",
+    "Tpd2e009": ".connector",
+    "Tps54202h": ".power",
+    "Tps561201": ".power",
+    "Tps61040": ".power",
+    "Tps92200": ".power",
+    "TvsDiode": "..circuits",
+    "TypedJumper": "..circuits",
+    "TypedTestPoint": "..circuits",
+    "UartLink": "..circuits",
+    "UartPort": "..circuits",
+    "Ucc27282": ".power",
+    "UflConnector": "..circuits",
+    "UnitUtils": "..circuits",
+    "UnpolarizedCapacitor": "..circuits",
+    "UsbAReceptacle": ".connector",
+    "UsbBitBang": "..circuits",
+    "UsbCReceptacle": ".connector",
+    "UsbCcPort": "..circuits",
+    "UsbConnector": "..circuits",
+    "UsbDeviceConnector": "..circuits",
+    "UsbDevicePort": "..circuits",
+    "UsbEsdDiode": "..circuits",
+    "UsbHostConnector": "..circuits",
+    "UsbHostPort": "..circuits",
+    "UsbLink": "..circuits",
+    "UsbMicroBReceptacle": ".connector",
+    "UsbPassivePort": "..circuits",
+    "UsbSeriesResistor": "..circuits",
+    "VariantPinRemapper": "..circuits",
+    "Vector": "..circuits",
+    "Vl53l0x": ".sensor",
+    "Vl53l0xApplication": ".sensor",
+    "Vl53l0xArray": ".sensor",
+    "Vl53l0xConnector": ".sensor",
+    "Vl53l5cx": ".sensor",
+    "Volt": "..circuits",
+    "VoltageComparator": "..circuits",
+    "VoltageDivider": "..circuits",
+    "VoltageIndicatorLed": "..circuits",
+    "VoltageIsolatedSwitch": "..circuits",
+    "VoltageJumper": "..circuits",
+    "VoltageLink": "..circuits",
+    "VoltageReference": "..circuits",
+    "VoltageRegulator": "..circuits",
+    "VoltageRegulatorEnableWrapper": "..circuits",
+    "VoltageSenseDivider": "..circuits",
+    "VoltageSink": "..circuits",
+    "VoltageSource": "..circuits",
+    "VoltageSourceConnected": "..circuits",
+    "VoltageTestPoint": "..circuits",
+    "W25q": ".logic",
+    "Watt": "..circuits",
+    "Waveshare_Epd": ".display",
+    "WithCrystalGenerator": "..circuits",
+    "WrapperSubboardBlock": "..circuits",
+    "Ws2812b": ".human_interface",
+    "Ws2812c_2020": ".human_interface",
+    "Xbee_S3b": ".interface",
+    "XboxElite2Joystick": ".human_interface",
+    "Xc6206p": ".power",
+    "Xc6209": ".power",
+    "Xc9142": ".power",
+    "Xiao_Esp32c3": ".microcontroller",
+    "Xiao_Rp2040": ".microcontroller",
+    "ZenerDiode": "..circuits",
+    "abstract_block": "..circuits",
+    "abstract_block_default": "..circuits",
+    "builder": "..circuits",
+    "init_in_parent": "..circuits",
+    "kHertz": "..circuits",
+    "kOhm": "..circuits",
+    "kiBit": "..circuits",
+    "mAmp": "..circuits",
+    "mOhm": "..circuits",
+    "mSecond": "..circuits",
+    "mVolt": "..circuits",
+    "nAmp": "..circuits",
+    "nFarad": "..circuits",
+    "nHenry": "..circuits",
+    "nSecond": "..circuits",
+    "non_library": "..circuits",
+    "pAmp": "..circuits",
+    "pFarad": "..circuits",
+    "uAmp": "..circuits",
+    "uFarad": "..circuits",
+    "uHenry": "..circuits",
+    "uSecond": "..circuits",
+}
+
+# Submodules that are also visible as attributes with eager imports
+kSubmodules = [
+    "Jacdac",
+    "Labels",
+    "Mechanicals",
+    "TouchPad",
+    "analog",
+    "connector",
+    "debug",
+    "display",
+    "human_interface",
+    "interface",
+    "logic",
+    "microcontroller",
+    "power",
+    "sensor",
+]
@@ -1,24 +1,60 @@
-from ..circuits import *
+from typing import TYPE_CHECKING
 
-# A library of parts and application circuits around them,
-# distinct from circuits composed of abstract parts and vendor parts libraries.
-from .analog import *
-from .connector import *
-from .debug import *
-from .display import *
-from .human_interface import *
-from .interface import *
-from .logic import *
-from .microcontroller import *
-from .power import *
-from .sensor import *
+from ..LazyExports import ExportSources, LazyExportsModule
+from .ExportIndex import kExportIndex, kSubmodules
 
-from .Labels import DuckLogo, LeadFreeIndicator, IdDots4, LemurLogo
-from .TouchPad import FootprintTouchPad
-from .Mechanicals import Outline_Pn1332
-from .Mechanicals import MountingHole, MountingHole_M2_5, MountingHole_M3, MountingHole_M4, MountingHole_NoPad_M2_5
+# Exports are loaded on first use through the generated ExportIndex, regenerate it after changing these.
+_export_sources: ExportSources = [
+    ("..circuits", None),
+    # A library of parts and application circuits around them,
+    # distinct from circuits composed of abstract parts and vendor parts libraries.
+    (".analog", None),
+    (".connector", None),
+    (".debug", None),
+    (".display", None),
+    (".human_interface", None),
+    (".interface", None),
+    (".logic", None),
+    (".microcontroller", None),
+    (".power", None),
+    (".sensor", None),
+    (".Labels", ["DuckLogo", "LeadFreeIndicator", "IdDots4", "LemurLogo"]),
+    (".TouchPad", ["FootprintTouchPad"]),
+    (".Mechanicals", ["Outline_Pn1332"]),
+    (
+        ".Mechanicals",
+        ["MountingHole", "MountingHole_M2_5", "MountingHole_M3", "MountingHole_M4", "MountingHole_NoPad_M2_5"],
+    ),
+    (".Jacdac", ["JacdacDataPort", "JacdacPassivePort"]),
+    (".Jacdac", ["JacdacEdgeConnector", "JacdacDataInterface", "Rclamp0521p"]),
+    (".Jacdac", ["JacdacMountingData1", "JacdacMountingGnd2", "JacdacMountingGnd4", "JacdacMountingPwr3"]),
+    (".Jacdac", ["JacdacDeviceTop"]),
+]
 
-from .Jacdac import JacdacDataPort, JacdacPassivePort
-from .Jacdac import JacdacEdgeConnector, JacdacDataInterface, Rclamp0521p
-from .Jacdac import JacdacMountingData1, JacdacMountingGnd2, JacdacMountingGnd4, JacdacMountingPwr3
-from .Jacdac import JacdacDeviceTop
+if TYPE_CHECKING:  # static checkers see the equivalent eager imports
+    from ..circuits import *
+
+    # A library of parts and application circuits around them,
+    # distinct from circuits composed of abstract parts and vendor parts libraries.
+    from .analog import *
+    from .connector import *
+    from .debug import *
+    from .display import *
+    from .human_interface import *
+    from .interface import *
+    from .logic import *
+    from .microcontroller import *
+    from .power import *
+    from .sensor import *
+
+    from .Labels import DuckLogo, LeadFreeIndicator, IdDots4, LemurLogo
+    from .TouchPad import FootprintTouchPad
+    from .Mechanicals import Outline_Pn1332
+    from .Mechanicals import MountingHole, MountingHole_M2_5, MountingHole_M3, MountingHole_M4, MountingHole_NoPad_M2_5
+
+    from .Jacdac import JacdacDataPort, JacdacPassivePort
+    from .Jacdac import JacdacEdgeConnector, JacdacDataInterface, Rclamp0521p
+    from .Jacdac import JacdacMountingData1, JacdacMountingGnd2, JacdacMountingGnd4, JacdacMountingPwr3
+    from .Jacdac import JacdacDeviceTop
+
+LazyExportsModule.install(__name__, kExportIndex, kSubmodules)
@@ -0,0 +1,74 @@
+import ast
+import importlib
+import subprocess
+import sys
+import unittest
+from typing import Any, Dict
+
+import edg
+from .LazyExports import ExportSources, kLazyPackages, build_export_index, export_submodules
+from .hdl_server.LibraryIndex import LibraryElementIndexer
+
+
+class LazyExportsTestCase(unittest.TestCase):
+    def test_index_current(self) -> None:
+        for package in kLazyPackages:
+            module = sys.modules[package]
+            sources = module.__dict__["_export_sources"]
+            self.assertEqual(
+                module.__dict__["_export_index"],
+                build_export_index(package, sources),
+                f"stale export index for {package}, regenerate with `python -m edg.tools.export_index`",
+            )
+            self.assertEqual(module.__dict__["_export_submodules"], export_submodules(sources))
+
+    def test_type_checking_imports(self) -> None:
+        # the imports seen by static checkers must match the export sources
+        for package in kLazyPackages:
+            module = sys.modules[package]
+            assert module.__file__ is not None
+            with open(module.__file__) as f:
+                tree = ast.parse(f.read())
+            type_checking_blocks = [
+                node
+                for node in tree.body
+                if isinstance(node, ast.If) and isinstance(node.test, ast.Name) and node.test.id == "TYPE_CHECKING"
+            ]
+            self.assertEqual(len(type_checking_blocks), 1)
+            imported: ExportSources = []
+            for node in type_checking_blocks[0].body:
+                assert isinstance(node, ast.ImportFrom)
+                names = [alias.name for alias in node.names]
+                imported.append(("." * node.level + (node.module or ""), None if names == ["*"] else names))
+            self.assertEqual(imported, module.__dict__["_export_sources"], f"mismatched imports in {package}")
+
+    def test_exports(self) -> None:
+        self.assertIs(edg.Range, edg.core.Range)
+        # importing the submodule binds it to the package, but must not shadow the export of the same name
+        importlib.import_module("edg.BoardTop")
+        self.assertTrue(isinstance(edg.BoardTop, type))
+        self.assertIs(edg.Holyiot_18010, edg.parts.microcontroller.nRF52840.Holyiot_18010)
+        star_exports: Dict[str, Any] = {}
+        exec("from edg import *", star_exports)
+        self.assertIs(star_exports["edgir"], importlib.import_module("edg.edgir"))
+        self.assertIs(star_exports["TransformUtil"], importlib.import_module("edg.core.TransformUtil"))
+        with self.assertRaises(AttributeError):
+            getattr(edg, "NotAPart")
+
+    def test_lazy_import(self) -> None:
+        # runs in a separate process, since this process may have already imported the library
+        loaded = subprocess.check_output(
+            [
+                sys.executable,
+                "-c",
+                "import sys; from edg import Range, compile_board; print(sorted(sys.modules.keys()))",
+            ],
+            text=True,
+        )
+        self.assertNotIn("'edg.abstract_parts'", loaded)
+        self.assertNotIn("'edg.parts'", loaded)
+
+    def test_index_module(self) -> None:
+        elements = LibraryElementIndexer().index_module(edg)
+        self.assertIn(edg.Holyiot_18010, elements)
+        self.assertIn(edg.Resistor, elements)
@@ -0,0 +1,20 @@
+import argparse
+
+from ...core.CompilerDaemon import CompilerDaemon, kDefaultDaemonAddress
+
+parser = argparse.ArgumentParser(
+    description="Run a persistent compiler daemon, which keeps the compiler warm across client processes."
+)
+parser.add_argument("--host", type=str, default=kDefaultDaemonAddress[0], help="Address to listen on")
+parser.add_argument("--port", type=int, default=kDefaultDaemonAddress[1], help="Port to listen on")
+args = parser.parse_args()
+
+daemon = CompilerDaemon((args.host, args.port))
+host, port = daemon.address
+print(f"Compiler daemon listening on {host}:{port}")
+try:
+    daemon.serve_forever()
+except KeyboardInterrupt:
+    pass
+finally:
+    daemon.shutdown()
@@ -0,0 +1,8 @@
+import importlib
+
+from ...LazyExports import kLazyPackages, write_export_index
+
+for package in kLazyPackages:
+    importlib.import_module(package)
+    write_export_index(package)
+    print(f"Wrote export index for {package}")
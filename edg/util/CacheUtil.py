@@ -0,0 +1,82 @@
+import hashlib
+import os
+import sys
+from contextlib import contextmanager
+from typing import IO, Any, Dict, Iterable, Iterator, Optional, Tuple
+
+
+def cache_dir_from_env(variable: str) -> Optional[str]:
+    """Returns the cache directory set by an environment variable, or None if unset or empty."""
+    return os.environ.get(variable) or None
+
+
+def files_stat_hash(paths: Iterable[str]) -> str:
+    """Returns a hash of the paths, sizes and modification times of data files, which may be too large to hash
+    by contents. Raises OSError if a file does not exist."""
+    hasher = hashlib.sha256()
+    for path in paths:
+        stat = os.stat(path)
+        hasher.update(f"{os.path.abspath(path)};{stat.st_size};{stat.st_mtime_ns};".encode("utf-8"))
+    return hasher.hexdigest()
+
+
+@contextmanager
+def atomic_write(path: str, mode: str = "wb") -> Iterator[IO[Any]]:
+    """Opens a temporary file which replaces the file at path once written (write-then-rename),
+    so concurrent readers never see partial data. The temporary file is removed if writing fails."""
+    temp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(temp_path, mode) as f:
+            yield f
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+class SourceHasher:
+    """Hashes the source files of modules, so on-disk caches can detect code changes.
+    Files are hashed by contents, and only re-hashed when their modification time or size changes.
+
+    The file records may be persisted (see files) and restored, so unchanged files are not re-hashed
+    in other processes."""
+
+    def __init__(self, files: Optional[Dict[str, Tuple[int, int, str]]] = None) -> None:
+        self.files: Dict[str, Tuple[int, int, str]] = files or {}  # path -> (mtime_ns, size, sha256 hex)
+
+    def file_hash(self, path: str) -> str:
+        """Returns the current hash of a file. Raises OSError if the file cannot be read."""
+        stat = os.stat(path)
+        record = self.files.get(path)
+        if record is not None and record[:2] == (stat.st_mtime_ns, stat.st_size):
+            return record[2]
+        with open(path, "rb") as f:
+            file_hash = hashlib.sha256(f.read()).hexdigest()
+        self.files[path] = (stat.st_mtime_ns, stat.st_size, file_hash)
+        return file_hash
+
+    @staticmethod
+    def module_file(module_name: str) -> Optional[str]:
+        """Returns the source file of an imported module, or None if it has none (eg, builtin modules)."""
+        module_file: Optional[str] = getattr(sys.modules.get(module_name), "__file__", None)
+        if module_file is None or not os.path.isfile(module_file):
+            return None
+        return module_file
+
+    def module_hash(self, module_name: str) -> str:
+        """Returns the current source hash of an imported module, or an empty string for modules without
+        a source file, which are assumed constant."""
+        module_file = self.module_file(module_name)
+        if module_file is None:
+            return ""
+        return self.file_hash(module_file)
+
+    def modules_hash(self, module_names: Iterable[str]) -> str:
+        """Returns the combined source hash of imported modules, independent of their order."""
+        hasher = hashlib.sha256()
+        for module_name in sorted(set(module_names)):
+            hasher.update(f"{module_name}:{self.module_hash(module_name)};".encode("utf-8"))
+        return hasher.hexdigest()
@@ -0,0 +1,42 @@
+import os
+import tempfile
+import unittest
+
+from .CacheUtil import SourceHasher, atomic_write
+
+
+class CacheUtilTestCase(unittest.TestCase):
+    def test_atomic_write(self) -> None:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            path = os.path.join(cache_dir, "data")
+            with atomic_write(path) as f:
+                f.write(b"data")
+            with self.assertRaises(ValueError):
+                with atomic_write(path) as f:
+                    f.write(b"partial")
+                    raise ValueError()
+            with open(path, "rb") as f:
+                self.assertEqual(f.read(), b"data")  # failed write left the previous data
+            self.assertEqual(os.listdir(cache_dir), ["data"])  # and no temporary file
+
+    def test_file_hash(self) -> None:
+        with tempfile.TemporaryDirectory() as cache_dir:
+            path = os.path.join(cache_dir, "source.py")
+            with open(path, "w") as f:
+                f.write("a = 1")
+            hasher = SourceHasher()
+            file_hash = hasher.file_hash(path)
+            self.assertEqual(SourceHasher(hasher.files).file_hash(path), file_hash)  # restored records
+
+            with open(path, "w") as f:
+                f.write("a = 22")
+            self.assertNotEqual(hasher.file_hash(path), file_hash)
+            os.remove(path)
+            with self.assertRaises(OSError):
+                hasher.file_hash(path)
+
+    def test_module_hash(self) -> None:
+        hasher = SourceHasher()
+        self.assertEqual(hasher.module_hash("sys"), "")  # builtin
+        self.assertNotEqual(hasher.module_hash(__name__), "")
+        self.assertEqual(hasher.modules_hash([__name__, "sys"]), hasher.modules_hash(["sys", __name__, "sys"]))
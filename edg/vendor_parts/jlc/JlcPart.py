@@ -43,16 +43,22 @@ class JlcTableBase(PartsTableBase):
 
     __JLC_TABLE: Optional[PartsTable] = None
 
+    @classmethod
+    def _jlc_table_files(cls) -> List[str]:
+        return PartsTable.with_source_dir(["Pruned_JLCPCB SMT Parts Library(20220419).csv"], "resources")
+
     @classmethod
     def _jlc_table(cls) -> PartsTable:
         """Returns the full JLC parts table, saving the result for future use."""
         if JlcTableBase.__JLC_TABLE is None:  # specifically this class, so results are visible to subclasses
-            JlcTableBase.__JLC_TABLE = PartsTable.from_csv_files(
-                PartsTable.with_source_dir(["Pruned_JLCPCB SMT Parts Library(20220419).csv"], "resources"),
-                encoding="gb2312",
-            )
+            JlcTableBase.__JLC_TABLE = PartsTable.from_csv_files(cls._jlc_table_files(), encoding="gb2312")
         return JlcTableBase.__JLC_TABLE
 
+    @classmethod
+    @override
+    def _table_sources(cls) -> Optional[List[str]]:
+        return cls._jlc_table_files()
+
     @classmethod
     def _parse_jlcpcb_common(cls, row: PartsTableRow) -> Dict[PartsTableColumn, Any]:
         """Returns a dict with the cost row, or errors out with KeyError."""
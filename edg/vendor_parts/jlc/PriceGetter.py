@@ -15,8 +15,7 @@ class PartQuantityTransform(TransformUtil.Transform):
 
     @override
     def visit_block(self, context: TransformUtil.TransformContext, block: edgir.BlockTypes) -> None:
-        lcsc_part_number = self.design.get_value(context.path.to_tuple() + ("lcsc_part",))
-        part = self.design.get_value(context.path.to_tuple() + ("fp_part",))
+        lcsc_part_number, part = self.design.get_values(context.path.to_tuple(), ("lcsc_part", "fp_part"))
 
         if lcsc_part_number:  # non-None (value exists) and nonempty
             assert isinstance(lcsc_part_number, str)
@@ -31,7 +30,7 @@ class PartQuantityTransform(TransformUtil.Transform):
         self.part_list[index] = self.part_list.get(index, 0) + 1
 
     def run(self) -> Dict[str, int]:
-        self.transform_design(self.design.design)
+        self.visit_design(self.design.design)
         return self.part_list
 
 
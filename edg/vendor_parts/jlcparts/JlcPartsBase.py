@@ -1,5 +1,5 @@
 import sys
-from typing import Any, Optional, Dict, List, TypeVar, Type, ClassVar
+from typing import Any, Optional, Dict, List, TypeVar, Type, ClassVar, Tuple
 
 from pydantic import BaseModel, RootModel, Field
 import gzip
@@ -125,8 +125,7 @@ class JlcPartsBase(JlcPart, PartsTableAreaSelector, PartsTableFootprintFilter):
         raise NotImplementedError
 
     @classmethod
-    def _parse_table(cls) -> PartsTable:
-        """Parses the file to a PartsTable"""
+    def _jlcparts_dir(cls) -> str:
         jlcparts_dir = os.environ.get("JLCPARTS_DIR")
         if jlcparts_dir is None:
             jlcparts_dir = cls._config_parts_root_dir
@@ -135,6 +134,27 @@ class JlcPartsBase(JlcPart, PartsTableAreaSelector, PartsTableFootprintFilter):
             "set JLCPARTS_DIR environment variable or call JlcPartsBase.config_root_dir "
             "with jlcparts data folder"
         )
+        return jlcparts_dir
+
+    @classmethod
+    @override
+    def _table_sources(cls) -> Optional[List[str]]:
+        jlcparts_dir = cls._jlcparts_dir()
+        return [
+            os.path.join(jlcparts_dir, filename + postfix)
+            for filename in cls._JLC_PARTS_FILE_NAMES
+            for postfix in (kTableFilenamePostfix, kStockFilenamePostfix)
+        ]
+
+    @classmethod
+    @override
+    def _table_params(cls) -> Tuple[Any, ...]:
+        return (cls._config_min_stock,)
+
+    @classmethod
+    def _parse_table(cls) -> PartsTable:
+        """Parses the file to a PartsTable"""
+        jlcparts_dir = cls._jlcparts_dir()
 
         rows: List[PartsTableRow] = []
 